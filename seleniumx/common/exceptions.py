@@ -0,0 +1,163 @@
+"""Exceptions that may happen in all the webdriver code."""
+
+
+class WebDriverException(Exception):
+    """Base webdriver exception."""
+
+    def __init__(self, msg=None, screen=None, stacktrace=None):
+        self.msg = msg
+        self.screen = screen
+        self.stacktrace = stacktrace
+
+    def __str__(self):
+        exception_msg = f"Message: {self.msg}\n"
+        if self.screen is not None:
+            exception_msg += "Screenshot: available via screen\n"
+        if self.stacktrace is not None:
+            stacktrace = "\n".join(self.stacktrace)
+            exception_msg += f"Stacktrace:\n{stacktrace}"
+        return exception_msg
+
+
+class ErrorInResponseException(WebDriverException):
+    """Thrown when an error has occurred on the server side."""
+
+    def __init__(self, response, msg):
+        super().__init__(msg)
+        self.response = response
+
+
+class InvalidSwitchToTargetException(WebDriverException):
+    """Thrown when frame or window target to be switched doesn't exist."""
+
+
+class NoSuchFrameException(InvalidSwitchToTargetException):
+    """Thrown when frame target to be switched doesn't exist."""
+
+
+class NoSuchWindowException(InvalidSwitchToTargetException):
+    """Thrown when window target to be switched doesn't exist."""
+
+
+class NoSuchElementException(WebDriverException):
+    """Thrown when element could not be found."""
+
+
+class NoSuchAttributeException(WebDriverException):
+    """Thrown when the attribute of element could not be found."""
+
+
+class NoSuchCookieException(WebDriverException):
+    """Thrown when no cookie matching the given path name was found."""
+
+
+class StaleElementReferenceException(WebDriverException):
+    """Thrown when a reference to an element is now "stale"."""
+
+
+class InvalidElementStateException(WebDriverException):
+    """Thrown when a command could not be completed because the element is in an invalid state."""
+
+
+class UnexpectedAlertPresentException(WebDriverException):
+    """Thrown when an unexpected alert is appeared."""
+
+    def __init__(self, msg=None, screen=None, stacktrace=None, alert_text=None):
+        super().__init__(msg, screen, stacktrace)
+        self.alert_text = alert_text
+
+    def __str__(self):
+        return f"Alert Text: {self.alert_text}\n{super().__str__()}"
+
+
+class NoAlertPresentException(WebDriverException):
+    """Thrown when switching to no presented alert."""
+
+
+class ElementNotVisibleException(InvalidElementStateException):
+    """Thrown when an element is present on the DOM, but it is not visible."""
+
+
+class ElementNotInteractableException(InvalidElementStateException):
+    """Thrown when an element is present in the DOM but interactions with that element will hit another element."""
+
+
+class ElementNotSelectableException(InvalidElementStateException):
+    """Thrown when trying to select an unselectable element."""
+
+
+class InvalidCookieDomainException(WebDriverException):
+    """Thrown when attempting to add a cookie under a different domain than the current URL."""
+
+
+class UnableToSetCookieException(WebDriverException):
+    """Thrown when a driver fails to set a cookie."""
+
+
+class RemoteDriverServerException(WebDriverException):
+    """Thrown when the remote driver server responds with an error."""
+
+
+class TimeoutException(WebDriverException):
+    """Thrown when a command does not complete in enough time."""
+
+
+class MoveTargetOutOfBoundsException(WebDriverException):
+    """Thrown when the target provided to the `ActionsChains` move() method is invalid."""
+
+
+class UnexpectedTagNameException(WebDriverException):
+    """Thrown when a support class did not get an expected web element."""
+
+
+class InvalidSelectorException(NoSuchElementException):
+    """Thrown when the selector which is used to find an element does not return a WebElement."""
+
+
+class ImeNotAvailableException(WebDriverException):
+    """Thrown when IME support is not available."""
+
+
+class ImeActivationFailedException(WebDriverException):
+    """Thrown when activating an IME engine has failed."""
+
+
+class InvalidArgumentException(WebDriverException):
+    """The arguments passed to a command are either invalid or malformed."""
+
+
+class JavascriptException(WebDriverException):
+    """An error occurred while executing JavaScript supplied by the user."""
+
+
+class NoSuchShadowRootException(WebDriverException):
+    """Thrown when trying to access the shadow root of an element when it does not have a shadow root attached."""
+
+
+class ScreenshotException(WebDriverException):
+    """A screen capture was made impossible."""
+
+
+class ElementClickInterceptedException(WebDriverException):
+    """The Element Click command could not be completed because the element receiving the events
+    is obscuring the element that was requested clicked."""
+
+
+class InsecureCertificateException(WebDriverException):
+    """Navigation caused the user agent to hit a certificate warning."""
+
+
+class InvalidCoordinatesException(WebDriverException):
+    """The coordinates provided to an interactions operation are invalid."""
+
+
+class InvalidSessionIdException(WebDriverException):
+    """Occurs if the given session id is not in the list of active sessions."""
+
+
+class SessionNotCreatedException(WebDriverException):
+    """A new session could not be created."""
+
+
+class UnknownMethodException(WebDriverException):
+    """The requested command matched a known URL but did not match any methods for that URL."""
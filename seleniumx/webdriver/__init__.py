@@ -0,0 +1,15 @@
+from seleniumx.webdriver.common.desired_capabilities import DesiredCapabilities  # noqa
+from seleniumx.webdriver.common.keys import Keys  # noqa
+from seleniumx.webdriver.common.proxy import Proxy  # noqa
+from seleniumx.webdriver.firefox.firefox_profile import FirefoxProfile  # noqa
+from seleniumx.webdriver.firefox.options import Options as FirefoxOptions  # noqa
+from seleniumx.webdriver.firefox.webdriver import FirefoxDriver as Firefox  # noqa
+from seleniumx.webdriver.ie.webdriver import IEDriver as Ie  # noqa
+from seleniumx.webdriver.remote.webdriver import RemoteWebDriver as Remote  # noqa
+from seleniumx.webdriver.safari.webdriver import SafariDriver as Safari  # noqa
+from seleniumx.webdriver.webkitgtk.options import WebKitGtkOptions  # noqa
+from seleniumx.webdriver.webkitgtk.webdriver import WebKitGtkDriver as WebKitGTK  # noqa
+from seleniumx.webdriver.wpewebkit.options import WPEWebKitOptions  # noqa
+from seleniumx.webdriver.wpewebkit.webdriver import WPEWebKitDriver as WPEWebKit  # noqa
+
+__version__ = "0.1.0"
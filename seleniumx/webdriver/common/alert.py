@@ -0,0 +1,45 @@
+"""The Alert implementation."""
+
+from async_property import async_property
+
+from seleniumx.webdriver.common.utils import keys_to_typing
+from seleniumx.webdriver.remote.command import Command
+
+
+class Alert(object):
+    """Allows to work with alerts."""
+
+    def __init__(self, driver):
+        self._driver = driver
+
+    @async_property
+    async def text(self):
+        """Gets the text of the Alert."""
+        if self._driver.w3c:
+            response = await self._driver.execute(Command.W3C_GET_ALERT_TEXT)
+        else:
+            response = await self._driver.execute(Command.GET_ALERT_TEXT)
+        return response["value"]
+
+    async def dismiss(self):
+        """Dismisses the alert available."""
+        if self._driver.w3c:
+            await self._driver.execute(Command.W3C_DISMISS_ALERT)
+        else:
+            await self._driver.execute(Command.DISMISS_ALERT)
+
+    async def accept(self):
+        """Accepts the alert available."""
+        if self._driver.w3c:
+            await self._driver.execute(Command.W3C_ACCEPT_ALERT)
+        else:
+            await self._driver.execute(Command.ACCEPT_ALERT)
+
+    async def send_keys(self, keys_to_send):
+        """Send keys to the Alert."""
+        if self._driver.w3c:
+            await self._driver.execute(
+                Command.W3C_SET_ALERT_VALUE,
+                {"value": keys_to_typing(keys_to_send), "text": keys_to_send})
+        else:
+            await self._driver.execute(Command.SET_ALERT_VALUE, {"text": keys_to_send})
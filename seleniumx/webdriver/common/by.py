@@ -0,0 +1,52 @@
+"""The By implementation."""
+
+from functools import lru_cache
+
+
+class By(object):
+    """Set of supported locator strategies."""
+
+    ID = "id"
+    XPATH = "xpath"
+    LINK_TEXT = "link text"
+    PARTIAL_LINK_TEXT = "partial link text"
+    NAME = "name"
+    TAG_NAME = "tag name"
+    CLASS_NAME = "class name"
+    CSS_SELECTOR = "css selector"
+    ID_OR_NAME = "id or name"
+
+    @classmethod
+    def is_valid(cls, by):
+        return by in _ALL_STRATEGIES
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def get_w3caware_by_value(by, value, is_w3c):
+        """Converts legacy locator strategies to their W3C equivalents, as the
+        W3C endpoints only support a subset of strategies.
+
+        Pure and called with plain strings, so results are memoized — loops
+        re-locating the same selector skip the conversion entirely."""
+        if not is_w3c:
+            return (by, value)
+        converter = _W3C_LOCATOR_CONVERTERS.get(by)
+        if converter is not None:
+            return converter(value)
+        return (by, value)
+
+
+#: every strategy value, resolved once — is_valid was a dir() scan per call
+_ALL_STRATEGIES = frozenset(
+    value for name, value in vars(By).items()
+    if name.isupper() and isinstance(value, str))
+
+#: strategy -> W3C conversion, one dict hit per find instead of a chain of
+#: equality tests re-run on every invocation; strategies missing here pass
+#: through unchanged
+_W3C_LOCATOR_CONVERTERS = {
+    By.ID: lambda value: (By.CSS_SELECTOR, f'[id="{value}"]'),
+    By.TAG_NAME: lambda value: (By.CSS_SELECTOR, value),
+    By.CLASS_NAME: lambda value: (By.CSS_SELECTOR, f".{value}"),
+    By.NAME: lambda value: (By.CSS_SELECTOR, f'[name="{value}"]'),
+}
@@ -0,0 +1,73 @@
+"""The Keys implementation."""
+
+
+class Keys(object):
+    """Set of special keys codes."""
+
+    NULL = ""
+    CANCEL = ""
+    HELP = ""
+    BACKSPACE = ""
+    BACK_SPACE = BACKSPACE
+    TAB = ""
+    CLEAR = ""
+    RETURN = ""
+    ENTER = ""
+    SHIFT = ""
+    LEFT_SHIFT = SHIFT
+    CONTROL = ""
+    LEFT_CONTROL = CONTROL
+    ALT = ""
+    LEFT_ALT = ALT
+    PAUSE = ""
+    ESCAPE = ""
+    SPACE = ""
+    PAGE_UP = ""
+    PAGE_DOWN = ""
+    END = ""
+    HOME = ""
+    LEFT = ""
+    ARROW_LEFT = LEFT
+    UP = ""
+    ARROW_UP = UP
+    RIGHT = ""
+    ARROW_RIGHT = RIGHT
+    DOWN = ""
+    ARROW_DOWN = DOWN
+    INSERT = ""
+    DELETE = ""
+    SEMICOLON = ""
+    EQUALS = ""
+
+    NUMPAD0 = ""
+    NUMPAD1 = ""
+    NUMPAD2 = ""
+    NUMPAD3 = ""
+    NUMPAD4 = ""
+    NUMPAD5 = ""
+    NUMPAD6 = ""
+    NUMPAD7 = ""
+    NUMPAD8 = ""
+    NUMPAD9 = ""
+    MULTIPLY = ""
+    ADD = ""
+    SEPARATOR = ""
+    SUBTRACT = ""
+    DECIMAL = ""
+    DIVIDE = ""
+
+    F1 = ""
+    F2 = ""
+    F3 = ""
+    F4 = ""
+    F5 = ""
+    F6 = ""
+    F7 = ""
+    F8 = ""
+    F9 = ""
+    F10 = ""
+    F11 = ""
+    F12 = ""
+
+    META = ""
+    COMMAND = ""
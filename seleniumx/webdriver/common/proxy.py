@@ -0,0 +1,75 @@
+"""The Proxy implementation."""
+
+
+class ProxyType(object):
+    """Set of possible types of proxy."""
+
+    DIRECT = "direct"
+    MANUAL = "manual"
+    PAC = "pac"
+    AUTODETECT = "autodetect"
+    SYSTEM = "system"
+    UNSPECIFIED = "unspecified"
+
+
+class Proxy(object):
+    """Proxy contains information about proxy type and necessary proxy settings."""
+
+    def __init__(self, raw=None):
+        self.proxy_type = ProxyType.UNSPECIFIED
+        self.http_proxy = ""
+        self.ftp_proxy = ""
+        self.ssl_proxy = ""
+        self.no_proxy = ""
+        self.proxy_autoconfig_url = ""
+        self.socks_proxy = ""
+        self.socks_username = ""
+        self.socks_password = ""
+        self.auto_detect = False
+        if raw:
+            if "proxyType" in raw and raw["proxyType"]:
+                self.proxy_type = raw["proxyType"]
+            if "httpProxy" in raw and raw["httpProxy"]:
+                self.http_proxy = raw["httpProxy"]
+            if "ftpProxy" in raw and raw["ftpProxy"]:
+                self.ftp_proxy = raw["ftpProxy"]
+            if "sslProxy" in raw and raw["sslProxy"]:
+                self.ssl_proxy = raw["sslProxy"]
+            if "noProxy" in raw and raw["noProxy"]:
+                self.no_proxy = raw["noProxy"]
+            if "proxyAutoconfigUrl" in raw and raw["proxyAutoconfigUrl"]:
+                self.proxy_autoconfig_url = raw["proxyAutoconfigUrl"]
+            if "socksProxy" in raw and raw["socksProxy"]:
+                self.socks_proxy = raw["socksProxy"]
+            if "socksUsername" in raw and raw["socksUsername"]:
+                self.socks_username = raw["socksUsername"]
+            if "socksPassword" in raw and raw["socksPassword"]:
+                self.socks_password = raw["socksPassword"]
+            if "autodetect" in raw and raw["autodetect"]:
+                self.auto_detect = raw["autodetect"]
+
+    def to_capabilities(self):
+        proxy_caps = {"proxyType": self.proxy_type}
+        proxies = [
+            "autodetect", "ftpProxy", "httpProxy", "proxyAutoconfigUrl",
+            "sslProxy", "noProxy", "socksProxy", "socksUsername", "socksPassword",
+        ]
+        attr_names = {
+            "autodetect": "auto_detect",
+            "ftpProxy": "ftp_proxy",
+            "httpProxy": "http_proxy",
+            "proxyAutoconfigUrl": "proxy_autoconfig_url",
+            "sslProxy": "ssl_proxy",
+            "noProxy": "no_proxy",
+            "socksProxy": "socks_proxy",
+            "socksUsername": "socks_username",
+            "socksPassword": "socks_password",
+        }
+        for proxy in proxies:
+            value = getattr(self, attr_names[proxy])
+            if value:
+                proxy_caps[proxy] = value
+        return proxy_caps
+
+    def add_to_capabilities(self, capabilities):
+        capabilities["proxy"] = self.to_capabilities()
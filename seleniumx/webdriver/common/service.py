@@ -0,0 +1,121 @@
+"""Base class for all browser driver services."""
+
+import asyncio
+import errno
+import os
+import subprocess
+from platform import system
+
+import httpx
+
+from seleniumx.common.exceptions import WebDriverException
+from seleniumx.webdriver.common import utils
+
+
+class Service(object):
+    """Manages the life-cycle of the driver server subprocess."""
+
+    def __init__(self, executable, port=0, log_file=subprocess.DEVNULL, env=None, start_error_message=""):
+        self.path = executable
+        self.port = port
+        if self.port == 0:
+            self.port = utils.free_port()
+        self.start_error_message = start_error_message
+        self.log_file = log_file
+        self.env = env or os.environ
+        self.process = None
+
+    @property
+    def service_url(self):
+        """Gets the url of the Service."""
+        return f"http://localhost:{self.port}"
+
+    def command_line_args(self):
+        raise NotImplementedError("This method needs to be implemented in a sub class")
+
+    async def start(self):
+        """Starts the Service.
+
+        :Exceptions:
+         - WebDriverException : Raised either when it can't start the service
+           or when it can't connect to the service
+        """
+        try:
+            cmd = [self.path]
+            cmd.extend(self.command_line_args())
+            self.process = await asyncio.create_subprocess_exec(
+                *cmd,
+                env=self.env,
+                close_fds=system() != "Windows",
+                stdout=self.log_file,
+                stderr=self.log_file,
+                stdin=subprocess.PIPE)
+        except TypeError:
+            raise
+        except OSError as err:
+            if err.errno == errno.ENOENT:
+                raise WebDriverException(
+                    f"'{os.path.basename(self.path)}' executable needs to be in PATH. {self.start_error_message}")
+            elif err.errno == errno.EACCES:
+                raise WebDriverException(
+                    f"'{os.path.basename(self.path)}' executable may have wrong permissions. {self.start_error_message}")
+            else:
+                raise
+        except Exception as ex:
+            raise WebDriverException(
+                f"The executable {os.path.basename(self.path)} needs to be available in the path. "
+                f"{self.start_error_message}\n{ex}")
+        count = 0
+        while True:
+            await self.assert_process_still_running()
+            if await self.is_connectable():
+                break
+            count += 1
+            await asyncio.sleep(1)
+            if count == 30:
+                raise WebDriverException(f"Can not connect to the Service {self.path}")
+
+    async def assert_process_still_running(self):
+        return_code = self.process.returncode
+        if return_code is not None:
+            raise WebDriverException(f"Service {self.path} unexpectedly exited. Status code was: {return_code}")
+
+    async def is_connectable(self):
+        return utils.is_connectable(self.port)
+
+    async def send_remote_shutdown_command(self):
+        try:
+            async with httpx.AsyncClient() as client:
+                await client.get(f"{self.service_url}/shutdown")
+        except Exception:
+            return
+        for _ in range(30):
+            if not await self.is_connectable():
+                break
+            await asyncio.sleep(1)
+
+    async def stop(self):
+        """Stops the service."""
+        if self.log_file != subprocess.PIPE and not (self.log_file == subprocess.DEVNULL):
+            try:
+                self.log_file.close()
+            except Exception:
+                pass
+        if self.process is None:
+            return
+        try:
+            await self.send_remote_shutdown_command()
+        except TypeError:
+            pass
+        try:
+            if self.process:
+                for stream in [self.process.stdin]:
+                    try:
+                        stream.close()
+                    except AttributeError:
+                        pass
+                self.process.terminate()
+                await self.process.wait()
+                self.process = None
+        except OSError:
+            pass
@@ -0,0 +1,25 @@
+"""The Timeouts implementation."""
+
+
+class Timeouts(object):
+    """Describes the session timeouts (in seconds) as understood by the remote end."""
+
+    def __init__(self, implicit_wait=0, page_load=0, script=0):
+        self.implicit_wait = implicit_wait
+        self.page_load = page_load
+        self.script = script
+
+    def __repr__(self):
+        return (f"<{type(self).__name__} implicit_wait={self.implicit_wait}, "
+                f"page_load={self.page_load}, script={self.script}>")
+
+    def to_json(self):
+        """Converts to the wire representation (milliseconds)."""
+        timeouts = {}
+        if self.implicit_wait:
+            timeouts["implicit"] = int(self.implicit_wait * 1000)
+        if self.page_load:
+            timeouts["pageLoad"] = int(self.page_load * 1000)
+        if self.script:
+            timeouts["script"] = int(self.script * 1000)
+        return timeouts
@@ -0,0 +1,62 @@
+"""Common utility methods and helpers."""
+
+import socket
+import sys
+
+from seleniumx.webdriver.common.keys import Keys
+
+
+class Platform(object):
+    """Cheap platform predicates used when launching browser binaries."""
+
+    @staticmethod
+    def is_windows():
+        return sys.platform.startswith("win")
+
+    @staticmethod
+    def is_mac():
+        return sys.platform == "darwin"
+
+    @staticmethod
+    def is_linux():
+        return sys.platform.startswith("linux")
+
+
+def free_port():
+    """Determines a free port using sockets."""
+    free_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    free_socket.bind(("0.0.0.0", 0))
+    free_socket.listen(5)
+    port = free_socket.getsockname()[1]
+    free_socket.close()
+    return port
+
+
+def is_connectable(port, host="localhost"):
+    """Tries to connect to the server at port to see if it is running."""
+    socket_ = None
+    try:
+        socket_ = socket.create_connection((host, port), 1)
+        result = True
+    except socket.error:
+        result = False
+    finally:
+        if socket_:
+            socket_.close()
+    return result
+
+
+def keys_to_typing(value):
+    """Processes the values that will be typed in the element."""
+    typing = []
+    for val in value:
+        if isinstance(val, Keys):
+            typing.append(val)
+        elif isinstance(val, (int, float)):
+            val = str(val)
+            for i in range(len(val)):
+                typing.append(val[i])
+        else:
+            for i in range(len(val)):
+                typing.append(val[i])
+    return typing
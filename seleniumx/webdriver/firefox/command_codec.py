@@ -0,0 +1,22 @@
+"""Firefox (geckodriver) specific command end points."""
+
+from seleniumx.webdriver.remote.command import Command
+from seleniumx.webdriver.remote.command_codec import CommandCodec, HttpMethod
+
+
+class FirefoxCommandCodec(CommandCodec):
+
+    browser_name = "firefox"
+
+    def _init_command_specs(self):
+        super()._init_command_specs()
+        self.add_command(Command.GET_CONTEXT, HttpMethod.GET, "/session/{sessionId}/moz/context")
+        self.add_command(Command.SET_CONTEXT, HttpMethod.POST, "/session/{sessionId}/moz/context")
+        self.add_command(Command.ELEMENT_GET_ANONYMOUS_CHILDREN, HttpMethod.POST,
+                         "/session/{sessionId}/moz/xbl/{id}/anonymous_children")
+        self.add_command(Command.ELEMENT_FIND_ANONYMOUS_ELEMENTS_BY_ATTRIBUTE, HttpMethod.POST,
+                         "/session/{sessionId}/moz/xbl/{id}/anonymous_by_attribute")
+        self.add_command(Command.INSTALL_ADDON, HttpMethod.POST, "/session/{sessionId}/moz/addon/install")
+        self.add_command(Command.UNINSTALL_ADDON, HttpMethod.POST, "/session/{sessionId}/moz/addon/uninstall")
+        self.add_command(Command.FULL_PAGE_SCREENSHOT, HttpMethod.GET,
+                         "/session/{sessionId}/moz/screenshot/full")
@@ -0,0 +1,219 @@
+"""The FirefoxBinary implementation."""
+
+import asyncio
+import functools
+import os
+import shutil
+import subprocess
+
+from seleniumx.common.exceptions import WebDriverException
+from seleniumx.webdriver.common import utils
+from seleniumx.webdriver.common.utils import Platform
+
+_HAS_NATIVE_DEVNULL = hasattr(subprocess, "DEVNULL")
+DEVNULL = subprocess.DEVNULL if _HAS_NATIVE_DEVNULL else -3
+
+_DEVNULL_FD = None
+
+#: Environment overrides applied to every launched Firefox process. Shared at
+#: module scope so constructing a binary doesn't copy the whole environment.
+_FF_ENV_OVERRIDES = {
+    "MOZ_CRASHREPORTER_DISABLE": "1",
+    "MOZ_NO_REMOTE": "1",
+    "NO_EM_RESTART": "1",
+}
+
+
+def _get_devnull():
+    """Lazily opens os.devnull once and shares the FD across all instances."""
+    global _DEVNULL_FD
+    if _DEVNULL_FD is None:
+        _DEVNULL_FD = open(os.devnull, "wb")
+    return _DEVNULL_FD
+
+
+class FirefoxBinary(object):
+    """Launches and manages the life time of a firefox browser process."""
+
+    NO_FOCUS_LIBRARY_NAME = "x_ignore_nofocus.so"
+
+    def __init__(self, firefox_path=None, log_file=None):
+        """Creates a new instance of Firefox binary.
+
+        :Args:
+         - firefox_path - Path to the Firefox executable. By default, it will be detected from the standard locations.
+         - log_file - A file object to redirect the firefox process output to. It can be sys.stdout.
+                      Please note that with parallel run the output won't be synchronous.
+                      By default, it will be redirected to /dev/null.
+        """
+        self._start_cmd = firefox_path
+        # We used to default to subprocess.PIPE instead of /dev/null, but after
+        # a while the pipe would fill up and Firefox would freeze. The devnull
+        # handle itself is resolved lazily at launch time, so an unlaunched
+        # binary never holds an FD.
+        self.log_file = log_file if log_file != DEVNULL else None
+        self.command_line = None
+        self.process = None
+        self.profile = None
+        if not self._start_cmd:
+            self._start_cmd = self._get_firefox_start_cmd()
+        if not self._start_cmd.strip():
+            raise WebDriverException(
+                "Failed to find firefox binary. You can set it by specifying "
+                "the path to 'firefox_binary'")
+        # Rather than modifying the environment of the calling Python process,
+        # a merged copy is built at launch time in _start_from_profile_path.
+        self._firefox_env = None
+
+    def add_command_line_options(self, *args):
+        self.command_line = args
+
+    async def launch_browser(self, profile, timeout=30):
+        """Launches the browser for the given profile name.
+
+        It is assumed the profile already exists."""
+        self.profile = profile
+        await self._start_from_profile_path(self.profile.path)
+        await self._wait_until_connectable(timeout=timeout)
+
+    def kill(self):
+        """Kill the browser.
+
+        This is useful when the browser is stuck."""
+        if self.process:
+            self.process.kill()
+
+    async def _start_from_profile_path(self, path):
+        env = {**os.environ, **_FF_ENV_OVERRIDES, "XRE_PROFILE_PATH": path}
+        self._firefox_env = env
+
+        if Platform.is_linux():
+            self._modify_link_library_path(env)
+        command = [self._start_cmd, "-foreground"]
+        if self.command_line is not None:
+            for cli in self.command_line:
+                command.append(cli)
+        log_file = self.log_file
+        if log_file is None:
+            log_file = DEVNULL if _HAS_NATIVE_DEVNULL else _get_devnull()
+        popen_kwargs = {}
+        if not Platform.is_windows():
+            # Python marks its own FDs close-on-exec, so the child can skip
+            # the O(RLIMIT_NOFILE) close() sweep between fork and exec; with
+            # ulimit -n in the millions (common in containers) that sweep
+            # dominates launch time. Interpreters without the posix_spawn
+            # fast path keep the conservative close_fds=True behaviour.
+            popen_kwargs["close_fds"] = not hasattr(subprocess, "_USE_POSIX_SPAWN")
+            # Detach from our session so signals sent to the harness don't
+            # propagate to Firefox.
+            popen_kwargs["start_new_session"] = True
+        self.process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=log_file,
+            stderr=log_file,
+            env=env,
+            **popen_kwargs)
+
+    async def _wait_until_connectable(self, timeout=30):
+        """Blocks until the extension is connectable in the firefox."""
+        count = 0
+        while not utils.is_connectable(self.profile.port):
+            if self.process.returncode is not None:
+                # Browser has exited
+                raise WebDriverException(
+                    "The browser appears to have exited "
+                    "before we could connect. If you specified a log_file in "
+                    "the FirefoxBinary constructor, check it for details.")
+            if count >= timeout:
+                self.kill()
+                raise WebDriverException(
+                    f"Can't load the profile. Possible firefox version mismatch. "
+                    f"You must use GeckoDriver instead for Firefox 48+. Profile "
+                    f"Dir: {self.profile.path} If you specified a log_file in the "
+                    f"FirefoxBinary constructor, check it for details.")
+            count += 1
+            await asyncio.sleep(1)
+        return True
+
+    def which(self, fname):
+        """Returns the fully qualified path by searching Path of the given name."""
+        return shutil.which(fname)
+
+    def _get_firefox_start_cmd(self):
+        """Return the command to start firefox."""
+        start_cmd = ""
+        if Platform.is_mac():
+            start_cmd = "/Applications/Firefox.app/Contents/MacOS/firefox-bin"
+            # fallback to homebrew installation for mac users
+            if not os.path.exists(start_cmd):
+                start_cmd = os.path.expanduser("~") + start_cmd
+        elif Platform.is_windows():
+            start_cmd = self._find_exe_in_registry() or self._default_windows_location()
+        else:
+            for ffname in ["firefox", "iceweasel"]:
+                start_cmd = self.which(ffname)
+                if start_cmd is not None:
+                    break
+            else:
+                # couldn't find firefox on the system path
+                raise RuntimeError(
+                    "Could not find firefox in your system PATH. "
+                    "Please specify the firefox binary location or install firefox")
+        return start_cmd
+
+    def _find_exe_in_registry(self):
+        try:
+            from winreg import OpenKey, QueryValue, HKEY_LOCAL_MACHINE, HKEY_CURRENT_USER
+        except ImportError:
+            return ""
+        import shlex
+        keys = (r"SOFTWARE\Classes\FirefoxHTML\shell\open\command",
+                r"SOFTWARE\Classes\Applications\firefox.exe\shell\open\command")
+        command = ""
+        for path in keys:
+            try:
+                key = OpenKey(HKEY_LOCAL_MACHINE, path)
+                command = QueryValue(key, "")
+                break
+            except OSError:
+                try:
+                    key = OpenKey(HKEY_CURRENT_USER, path)
+                    command = QueryValue(key, "")
+                    break
+                except OSError:
+                    pass
+        else:
+            return ""
+        if not command:
+            return ""
+        return shlex.split(command)[0]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _default_windows_location():
+        # PROGRAMFILES and friends are constant for the process lifetime, so
+        # the resolved location is memoized across instances.
+        program_files = [os.getenv("PROGRAMFILES", r"C:\Program Files"),
+                         os.getenv("PROGRAMFILES(X86)", r"C:\Program Files (x86)")]
+        for path in program_files:
+            binary_path = os.path.join(path, r"Mozilla Firefox\firefox.exe")
+            if os.access(binary_path, os.X_OK):
+                return binary_path
+        return ""
+
+    def _modify_link_library_path(self, env):
+        existing_ld_lib_path = os.environ.get("LD_LIBRARY_PATH", "")
+        new_ld_lib_path = self._extract_and_check(self.profile, "x86", "amd64")
+        new_ld_lib_path += existing_ld_lib_path
+        env["LD_LIBRARY_PATH"] = new_ld_lib_path
+        env["LD_PRELOAD"] = self.NO_FOCUS_LIBRARY_NAME
+
+    def _extract_and_check(self, profile, x86, amd64):
+        paths = [x86, amd64]
+        built_path = ""
+        for path in paths:
+            library_path = os.path.join(profile.path, path)
+            if not os.path.exists(library_path):
+                os.makedirs(library_path)
+            built_path += library_path + ":"
+        return built_path
@@ -0,0 +1,486 @@
+"""The FirefoxProfile implementation."""
+
+import asyncio
+import base64
+import copy
+import json
+import os
+import re
+import shutil
+import tempfile
+import warnings
+import zipfile
+from io import BytesIO
+from xml.etree import ElementTree
+
+from seleniumx.common.exceptions import WebDriverException
+
+WEBDRIVER_EXT = "webdriver.xpi"
+EXTENSION_NAME = "fxdriver@googlecode.com"
+
+#: Preferences that are applied to every profile. The "frozen" set is always
+#: re-applied on top of whatever the user configured; the "mutable" set only
+#: provides defaults that ``set_preference`` may override.
+DEFAULT_PREFERENCES = {
+    "frozen": {
+        "app.update.auto": False,
+        "app.update.enabled": False,
+        "browser.displayedE10SNotice": 4,
+        "browser.download.manager.showWhenStarting": False,
+        "browser.EULA.override": True,
+        "browser.EULA.3.accepted": True,
+        "browser.link.open_external": 2,
+        "browser.link.open_newwindow": 2,
+        "browser.offline": False,
+        "browser.reader.detectedFirstArticle": True,
+        "browser.safebrowsing.enabled": False,
+        "browser.safebrowsing.malware.enabled": False,
+        "browser.search.update": False,
+        "browser.selfsupport.url": "",
+        "browser.sessionstore.resume_from_crash": False,
+        "browser.shell.checkDefaultBrowser": False,
+        "browser.tabs.warnOnClose": False,
+        "browser.tabs.warnOnOpen": False,
+        "datareporting.healthreport.service.enabled": False,
+        "datareporting.healthreport.uploadEnabled": False,
+        "datareporting.healthreport.service.firstRun": False,
+        "datareporting.healthreport.logging.consoleEnabled": False,
+        "datareporting.policy.dataSubmissionEnabled": False,
+        "datareporting.policy.dataSubmissionPolicyAccepted": False,
+        "devtools.errorconsole.enabled": True,
+        "dom.disable_open_during_load": False,
+        "extensions.autoDisableScopes": 10,
+        "extensions.blocklist.enabled": False,
+        "extensions.checkCompatibility.nightly": False,
+        "extensions.logging.enabled": True,
+        "extensions.update.enabled": False,
+        "extensions.update.notifyUser": False,
+        "javascript.enabled": True,
+        "network.manage-offline-status": False,
+        "network.http.phishy-userpass-length": 255,
+        "offline-apps.allow_by_default": True,
+        "prompts.tab_modal.enabled": False,
+        "security.fileuri.origin_policy": 3,
+        "security.fileuri.strict_origin_policy": False,
+        "signon.rememberSignons": False,
+        "toolkit.networkmanager.disable": True,
+        "toolkit.telemetry.prompted": 2,
+        "toolkit.telemetry.enabled": False,
+        "toolkit.telemetry.rejected": True,
+        "xpinstall.signatures.required": False,
+        "xpinstall.whitelist.required": False,
+    },
+    "mutable": {
+        "browser.dom.window.dump.enabled": True,
+        "browser.laterrun.enabled": False,
+        "browser.newtab.url": "about:blank",
+        "browser.newtabpage.enabled": False,
+        "browser.startup.page": 0,
+        "browser.startup.homepage": "about:blank",
+        "browser.startup.homepage_override.mstone": "ignore",
+        "browser.usedOnWindows10.introURL": "about:blank",
+        "dom.max_chrome_script_run_time": 30,
+        "dom.max_script_run_time": 30,
+        "dom.report_all_js_exceptions": True,
+        "javascript.options.showInConsole": True,
+        "network.captive-portal-service.enabled": False,
+        "security.csp.enable": False,
+        "startup.homepage_welcome_url": "about:blank",
+        "startup.homepage_welcome_url.additional": "about:blank",
+        "webdriver_accept_untrusted_certs": True,
+        "webdriver_assume_untrusted_issuer": True,
+    },
+}
+
+
+class AddonFormatError(Exception):
+    """Exception for not well-formed add-on manifest files."""
+
+
+class FirefoxProfile(object):
+
+    ANONYMOUS_PROFILE_NAME = "WEBDRIVER_ANONYMOUS_PROFILE"
+    DEFAULT_PREFERENCES = None
+
+    #: Number of pre-built profiles kept warm by :meth:`acquire`. Kept small
+    #: by default to bound the disk/RSS footprint of the spare profiles.
+    POOL_SIZE = 1
+    _pool = None
+    _pool_refill_task = None
+
+    def __init__(self, profile_directory=None):
+        """Initialises a new instance of a Firefox Profile.
+
+        :Args:
+         - profile_directory: Directory of profile that you want to use. If a
+           directory is passed in it is cloned into a temporary location so the
+           original is never touched. This defaults to None and will create a
+           new directory when the object is created.
+        """
+        if not FirefoxProfile.DEFAULT_PREFERENCES:
+            FirefoxProfile.DEFAULT_PREFERENCES = DEFAULT_PREFERENCES
+        self.default_preferences = copy.deepcopy(FirefoxProfile.DEFAULT_PREFERENCES["mutable"])
+        self.profile_dir = profile_directory
+        self.tempfolder = None
+        self.extensionsDir = None
+        self.userPrefs = None
+        if self.profile_dir is None:
+            self.profile_dir = self._create_tempfolder()
+            self.extensionsDir = os.path.join(self.profile_dir, "extensions")
+            self.userPrefs = os.path.join(self.profile_dir, "user.js")
+        else:
+            self._set_profile_dir()
+
+    @classmethod
+    async def create(cls, profile_directory=None):
+        """Async factory that creates a new Firefox Profile without blocking the
+        event loop while an existing profile directory is being cloned."""
+        profile = cls.__new__(cls)
+        if not FirefoxProfile.DEFAULT_PREFERENCES:
+            FirefoxProfile.DEFAULT_PREFERENCES = DEFAULT_PREFERENCES
+        profile.default_preferences = copy.deepcopy(FirefoxProfile.DEFAULT_PREFERENCES["mutable"])
+        profile.profile_dir = profile_directory
+        profile.tempfolder = None
+        profile.extensionsDir = None
+        profile.userPrefs = None
+        if profile.profile_dir is None:
+            profile.profile_dir = profile._create_tempfolder()
+            profile.extensionsDir = os.path.join(profile.profile_dir, "extensions")
+            profile.userPrefs = os.path.join(profile.profile_dir, "user.js")
+        else:
+            await profile._set_profile_dir_async()
+        return profile
+
+    # Public Methods
+    def set_preference(self, key, value):
+        """Sets the preference that we want in the profile."""
+        self.default_preferences[key] = value
+
+    def add_extension(self, extension=WEBDRIVER_EXT):
+        self._install_extension(extension)
+
+    def update_preferences(self):
+        """Writes the desired user prefs to disk."""
+        for key, value in FirefoxProfile.DEFAULT_PREFERENCES["frozen"].items():
+            self.default_preferences[key] = value
+        self._write_user_prefs(self.default_preferences)
+
+    async def update_preferences_async(self):
+        """Writes the desired user prefs to disk without blocking the event loop."""
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self.update_preferences)
+
+    @classmethod
+    async def acquire(cls):
+        """Pops a pre-built anonymous profile from the warm pool, falling back
+        to :meth:`create` when the pool is empty. A background task refills the
+        pool after each checkout, so the temp folder setup and preference write
+        happen off the critical path of the next ``launch_browser``.
+
+        Profiles obtained this way should be handed back via :meth:`release`
+        once the session is done with them."""
+        if cls._pool is None:
+            cls._pool = asyncio.Queue(maxsize=cls.POOL_SIZE)
+        try:
+            profile = cls._pool.get_nowait()
+        except asyncio.QueueEmpty:
+            profile = await cls.create()
+        cls._schedule_pool_refill()
+        return profile
+
+    def release(self):
+        """Deletes the temp folder backing this profile.
+
+        Only needed for profiles obtained via :meth:`acquire`."""
+        if self.tempfolder and os.path.exists(self.tempfolder):
+            shutil.rmtree(self.tempfolder, ignore_errors=True)
+
+    @classmethod
+    def _schedule_pool_refill(cls):
+        if cls._pool_refill_task is None or cls._pool_refill_task.done():
+            cls._pool_refill_task = asyncio.create_task(cls._refill_pool())
+
+    @classmethod
+    async def _refill_pool(cls):
+        while not cls._pool.full():
+            profile = await cls.create()
+            await profile.update_preferences_async()
+            try:
+                cls._pool.put_nowait(profile)
+            except asyncio.QueueFull:
+                profile.release()
+                break
+
+    # Properties
+    @property
+    def path(self):
+        """Gets the profile directory that is currently being used."""
+        return self.profile_dir
+
+    @property
+    def port(self):
+        """Gets the port that WebDriver is working on."""
+        return self._port
+
+    @port.setter
+    def port(self, port):
+        """Sets the port that WebDriver will be running on."""
+        if not isinstance(port, int):
+            raise WebDriverException("Port needs to be an integer")
+        try:
+            port = int(port)
+            if port < 1 or port > 65535:
+                raise WebDriverException("Port number must be in the range 1..65535")
+        except (ValueError, TypeError):
+            raise WebDriverException("Port needs to be an integer")
+        self._port = port
+        self.set_preference("webdriver_firefox_port", self._port)
+
+    @property
+    def accept_untrusted_certs(self):
+        return self.default_preferences["webdriver_accept_untrusted_certs"]
+
+    @accept_untrusted_certs.setter
+    def accept_untrusted_certs(self, value):
+        if not isinstance(value, bool):
+            raise WebDriverException("Please pass in a Boolean to this call")
+        self.set_preference("webdriver_accept_untrusted_certs", value)
+
+    @property
+    def assume_untrusted_cert_issuer(self):
+        return self.default_preferences["webdriver_assume_untrusted_issuer"]
+
+    @assume_untrusted_cert_issuer.setter
+    def assume_untrusted_cert_issuer(self, value):
+        if not isinstance(value, bool):
+            raise WebDriverException("Please pass in a Boolean to this call")
+        self.set_preference("webdriver_assume_untrusted_issuer", value)
+
+    #: Chunk size for incremental base64 encoding. Any multiple of 3 keeps the
+    #: per-chunk encodings concatenable without padding in the middle.
+    _B64_CHUNK = 57 * 1024
+
+    @property
+    def encoded(self):
+        """A zipped, base64 encoded string of profile directory for use with
+        remote WebDriver JSON wire protocol."""
+        self.update_preferences()
+        return self._encode_zipped(self._zip_profile())
+
+    async def encoded_async(self):
+        """A zipped, base64 encoded string of profile directory, produced
+        without blocking the event loop."""
+        await self.update_preferences_async()
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, lambda: self._encode_zipped(self._zip_profile()))
+
+    def _zip_profile(self):
+        fp = BytesIO()
+        zipped = zipfile.ZipFile(fp, "w", zipfile.ZIP_DEFLATED)
+        path_root = len(self.path) + 1  # account for trailing slash
+        for base, _, files in os.walk(self.path):
+            for fyle in files:
+                filename = os.path.join(base, fyle)
+                zipped.write(filename, filename[path_root:])
+        zipped.close()
+        return fp
+
+    def _encode_zipped(self, fp):
+        # Encode straight out of the buffer in chunks rather than
+        # getvalue() -> b64encode() -> decode(), which transiently holds the
+        # zip bytes, the base64 bytes and the final str all at once.
+        fp.seek(0)
+        out = bytearray()
+        while True:
+            chunk = fp.read(self._B64_CHUNK)
+            if not chunk:
+                break
+            out += base64.b64encode(chunk)
+        return bytes(out).decode("ascii")
+
+    def _create_tempfolder(self):
+        """Creates a temp folder to store User.js and the extension.
+
+        Honors ``SELENIUMX_PROFILE_DIR`` so profiles can be steered onto a
+        tmpfs mount (e.g. /dev/shm/selenium on Linux), which makes the profile
+        clone and Firefox's own startup writes considerably cheaper on hosts
+        where the default tempdir is disk-backed."""
+        self.tempfolder = tempfile.mkdtemp(dir=os.environ.get("SELENIUMX_PROFILE_DIR") or None)
+        return self.tempfolder
+
+    def _set_profile_dir(self):
+        """Clones the given profile directory into a temp location so the
+        original is never modified."""
+        newprof = os.path.join(self._create_tempfolder(), "webdriver-py-profilecopy")
+        ignore = shutil.ignore_patterns("parent.lock", "lock", ".parentlock")
+        # When source and tempdir live on the same filesystem, hardlink the
+        # profile files instead of byte-copying them. Firefox replaces the
+        # files it rewrites via rename-into-place and the ones it mutates in
+        # place are the lock files we ignore, so sharing inodes is safe.
+        copied = False
+        try:
+            if os.stat(self.profile_dir).st_dev == os.stat(tempfile.gettempdir()).st_dev:
+                shutil.copytree(self.profile_dir, newprof, ignore=ignore, copy_function=os.link)
+                copied = True
+        except OSError:
+            # cross-device move or no permission to link - fall back to copying
+            if os.path.exists(newprof):
+                shutil.rmtree(newprof, ignore_errors=True)
+        if not copied:
+            shutil.copytree(self.profile_dir, newprof, ignore=ignore)
+        self.profile_dir = newprof
+        os.chmod(self.profile_dir, 0o755)
+        self._read_existing_userjs(os.path.join(self.profile_dir, "user.js"))
+        self.extensionsDir = os.path.join(self.profile_dir, "extensions")
+        self.userPrefs = os.path.join(self.profile_dir, "user.js")
+        if os.path.isfile(self.userPrefs):
+            os.chmod(self.userPrefs, 0o644)
+
+    async def _set_profile_dir_async(self):
+        """Same as ``_set_profile_dir`` but runs the copy in an executor."""
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self._set_profile_dir)
+
+    def _write_user_prefs(self, user_prefs):
+        """Writes the current user prefs dictionary to disk."""
+        with open(self.userPrefs, "w") as f:
+            for key, value in user_prefs.items():
+                f.write(f'user_pref("{key}", {json.dumps(value)});\n')
+
+    def _read_existing_userjs(self, userjs):
+        PREF_RE = re.compile(r'user_pref\("(.*)",\s(.*)\)')
+        try:
+            with open(userjs) as f:
+                for usr in f:
+                    matches = PREF_RE.search(usr)
+                    try:
+                        self.default_preferences[matches.group(1)] = json.loads(matches.group(2))
+                    except Exception:
+                        warnings.warn(
+                            f"(skipping) failed to json.loads existing preference: {matches.group(1) + matches.group(2)}")
+        except Exception:
+            # The profile given hasn't had any changes made, i.e no users.js
+            pass
+
+    def _install_extension(self, addon, unpack=True):
+        """Installs addon from a filepath, url or directory of addons in the profile.
+
+        - addon: url, absolute path to .xpi, or directory of addons
+        - unpack: whether to unpack unless specified otherwise in the install.rdf
+        """
+        tmpdir = None
+        xpifile = None
+        if addon.endswith(".xpi"):
+            tmpdir = tempfile.mkdtemp(suffix="." + os.path.split(addon)[-1])
+            compressed_file = zipfile.ZipFile(addon, "r")
+            for name in compressed_file.namelist():
+                compressed_file.extract(name, tmpdir)
+            xpifile = addon
+            addon = tmpdir
+
+        # determine the addon id
+        addon_details = self._addon_details(addon)
+        addon_id = addon_details.get("id")
+        assert addon_id, f"The addon id could not be found: {addon}"
+
+        # copy the addon to the profile
+        addon_path = os.path.join(self.extensionsDir, addon_id)
+        if not unpack and not addon_details["unpack"] and xpifile:
+            if not os.path.exists(self.extensionsDir):
+                os.makedirs(self.extensionsDir)
+                os.chmod(self.extensionsDir, 0o755)
+            shutil.copy(xpifile, addon_path + ".xpi")
+        else:
+            if not os.path.exists(addon_path):
+                shutil.copytree(addon, addon_path, symlinks=True)
+
+        # remove the temporary directory, if any
+        if tmpdir:
+            shutil.rmtree(tmpdir)
+
+    def _addon_details(self, addon_path):
+        """Returns a dictionary of details about the addon.
+
+        :Args:
+         - addon_path : path to the add-on directory or XPI
+
+        Returns::
+
+            {'id':      u'rainbow@colors.org', # id of the addon
+             'version': u'1.4',                # version of the addon
+             'name':    u'Rainbow',            # name of the addon
+             'unpack':  False }                # whether to unpack the addon
+        """
+        details = {
+            "id": None,
+            "unpack": False,
+            "name": None,
+            "version": None,
+        }
+
+        def parse_manifest_json(content):
+            """Extracts the details from the contents of a WebExtensions
+            `manifest.json` file."""
+            manifest = json.loads(content)
+            try:
+                id_ = manifest["applications"]["gecko"]["id"]
+            except KeyError:
+                id_ = manifest["name"].replace(" ", "") + "@" + manifest["version"]
+            return {
+                "id": id_,
+                "version": manifest["version"],
+                "name": manifest["version"],
+                "unpack": False,
+            }
+
+        if not os.path.exists(addon_path):
+            raise IOError(f"Add-on path does not exist: {addon_path}")
+
+        try:
+            if zipfile.is_zipfile(addon_path):
+                with zipfile.ZipFile(addon_path, "r") as compressed_file:
+                    try:
+                        # single directory lookup + one decompress stream,
+                        # rather than materializing namelist() and re-reading
+                        with compressed_file.open("manifest.json") as manifest_file:
+                            return parse_manifest_json(manifest_file.read())
+                    except KeyError:
+                        manifest = compressed_file.read("install.rdf")
+            elif os.path.isdir(addon_path):
+                manifest_json_filename = os.path.join(addon_path, "manifest.json")
+                if os.path.exists(manifest_json_filename):
+                    with open(manifest_json_filename) as f:
+                        return parse_manifest_json(f.read())
+                with open(os.path.join(addon_path, "install.rdf")) as f:
+                    manifest = f.read()
+            else:
+                raise IOError(f"Add-on path is neither an XPI nor a directory: {addon_path}")
+        except (IOError, KeyError) as ex:
+            raise AddonFormatError(str(ex))
+
+        try:
+            root = ElementTree.fromstring(manifest)
+        except Exception as ex:
+            raise AddonFormatError(str(ex))
+
+        # ElementTree expands namespaces into Clark notation, so no prefix
+        # discovery is needed.
+        em = "{http://www.mozilla.org/2004/em-rdf#}"
+        rdf = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+
+        description = root.find(rdf + "Description")
+        if description is None:
+            description = root.find("Description")
+        if description is None:
+            raise AddonFormatError("Add-on manifest is missing a Description element.")
+        for node in description:
+            # Remove the namespace prefix from the tag for comparison
+            entry = node.tag.replace(em, "")
+            if entry in details.keys():
+                details[entry] = (node.text or "").strip()
+        if details.get("id") is None:
+            details["id"] = description.get(em + "id")
+        if details.get("id") is None:
+            raise AddonFormatError("Add-on id could not be found.")
+        return details
@@ -0,0 +1,167 @@
+"""Firefox specific options for starting a browser session."""
+
+import types
+
+from seleniumx.common.exceptions import InvalidArgumentException
+from seleniumx.webdriver.common.desired_capabilities import DesiredCapabilities
+from seleniumx.webdriver.common.proxy import Proxy
+from seleniumx.webdriver.firefox.firefox_binary import FirefoxBinary
+from seleniumx.webdriver.firefox.firefox_profile import FirefoxProfile
+
+#: Immutable view of the Firefox capability defaults. Shared by every Options
+#: instance so reading the defaults never copies; callers that need to mutate
+#: go through Options.default_capabilities_mutable().
+_FIREFOX_CAPS_VIEW = types.MappingProxyType(DesiredCapabilities.FIREFOX)
+
+
+class Log(object):
+
+    __slots__ = ("level",)
+
+    def __init__(self):
+        self.level = None
+
+    def to_capabilities(self):
+        if self.level:
+            return {"log": {"level": self.level}}
+        return {}
+
+
+class Options(object):
+
+    KEY = "moz:firefoxOptions"
+
+    __slots__ = ("_binary", "_preferences", "_profile", "_proxy", "_arguments",
+                 "_arg_set", "log")
+
+    def __init__(self):
+        self._binary = None
+        self._preferences = {}
+        self._profile = None
+        self._proxy = None
+        # list keeps the emission order for to_capabilities, the set gives
+        # O(1) membership checks for flags like -headless
+        self._arguments = []
+        self._arg_set = set()
+        self.log = Log()
+
+    @property
+    def binary(self):
+        """Returns the FirefoxBinary instance."""
+        return self._binary
+
+    @binary.setter
+    def binary(self, new_binary):
+        """Sets location of the browser binary, either by string or
+        ``FirefoxBinary`` instance."""
+        if not isinstance(new_binary, FirefoxBinary):
+            new_binary = FirefoxBinary(new_binary)
+        self._binary = new_binary
+
+    @property
+    def binary_location(self):
+        """Returns the location of the binary."""
+        return self.binary._start_cmd
+
+    @binary_location.setter
+    def binary_location(self, value):
+        """Sets the location of the browser binary by string."""
+        self.binary = value
+
+    @property
+    def preferences(self):
+        """Read-only view of the preferences; mutate via set_preference.
+
+        Advertising immutability lets callers skip their own defensive
+        copies. to_capabilities serializes the raw dict underneath."""
+        return types.MappingProxyType(self._preferences)
+
+    def set_preference(self, name, value):
+        """Sets a preference."""
+        self._preferences[name] = value
+
+    @property
+    def proxy(self):
+        """Returns the proxy if set, otherwise None."""
+        return self._proxy
+
+    @proxy.setter
+    def proxy(self, value):
+        if not isinstance(value, Proxy):
+            raise InvalidArgumentException("Only Proxy objects can be passed in.")
+        self._proxy = value
+
+    @property
+    def profile(self):
+        """Returns the Firefox profile to use."""
+        return self._profile
+
+    @profile.setter
+    def profile(self, new_profile):
+        """Sets location of the browser profile to use, either by string or
+        ``FirefoxProfile``."""
+        if not isinstance(new_profile, FirefoxProfile):
+            new_profile = FirefoxProfile(new_profile)
+        self._profile = new_profile
+
+    @property
+    def arguments(self):
+        """Returns a list of browser process arguments."""
+        return self._arguments
+
+    def add_argument(self, argument):
+        """Add argument to be used for the browser process."""
+        if argument is None:
+            raise ValueError("argument can not be null")
+        self._arguments.append(argument)
+        self._arg_set.add(argument)
+
+    @property
+    def headless(self):
+        """Returns whether or not the headless argument is set."""
+        return "-headless" in self._arg_set
+
+    @headless.setter
+    def headless(self, value):
+        """Sets the headless argument.
+
+        :Args:
+          value: boolean value indicating to set the headless option
+        """
+        if value is True:
+            self.add_argument("-headless")
+        elif "-headless" in self._arg_set:
+            self._arguments.remove("-headless")
+            self._arg_set.discard("-headless")
+
+    def to_capabilities(self):
+        """Marshals the Firefox options to a `moz:firefoxOptions` object."""
+        # This intentionally looks at the internal properties so if a binary
+        # or profile has _not_ been set, it will defer to geckodriver to find
+        # the system Firefox and generate a fresh profile.
+        caps = self.default_capabilities_mutable()
+        opts = {key: value for key, value in (
+            ("binary", self._binary._start_cmd if self._binary else None),
+            ("prefs", self._preferences or None),
+            ("profile", self._profile.encoded if self._profile else None),
+            ("args", self._arguments or None),
+            ("log", {"level": self.log.level} if self.log.level else None),
+        ) if value is not None}
+
+        if self._proxy is not None:
+            self._proxy.add_to_capabilities(opts)
+
+        if opts:
+            caps[Options.KEY] = opts
+
+        return caps
+
+    @property
+    def default_capabilities(self):
+        """Read-only view of the default Firefox capabilities."""
+        return _FIREFOX_CAPS_VIEW
+
+    def default_capabilities_mutable(self):
+        """A fresh dict of the default Firefox capabilities, for callers that
+        need to merge or mutate."""
+        return dict(_FIREFOX_CAPS_VIEW)
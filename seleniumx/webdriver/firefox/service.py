@@ -0,0 +1,26 @@
+from seleniumx.webdriver.common import service
+
+
+class FirefoxService(service.Service):
+    """Object that manages the starting and stopping of the GeckoDriver."""
+
+    def __init__(self, executable_path, port=0, service_args=None,
+                 log_path="geckodriver.log", env=None):
+        """Creates a new instance of the GeckoDriver remote service proxy.
+
+        GeckoDriver provides a HTTP interface speaking the W3C WebDriver
+        protocol to Marionette.
+
+        :Args:
+         - log_path : Optional path for the GeckoDriver to log to.
+        """
+        log_file = open(log_path, "a+") if log_path else None
+        super().__init__(executable_path, port=port, log_file=log_file, env=env)
+        self.service_args = service_args or []
+
+    def command_line_args(self):
+        return ["--port", str(self.port)] + self.service_args
+
+    async def send_remote_shutdown_command(self):
+        """Geckodriver does not spin up the shutdown endpoint."""
+        pass
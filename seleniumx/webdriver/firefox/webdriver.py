@@ -0,0 +1,212 @@
+"""The Firefox WebDriver implementation."""
+
+import base64
+import logging
+import warnings
+from contextlib import asynccontextmanager
+
+import aiofiles
+
+from seleniumx.webdriver.common.desired_capabilities import DesiredCapabilities
+from seleniumx.webdriver.firefox.options import Options, _FIREFOX_CAPS_VIEW
+from seleniumx.webdriver.firefox.service import FirefoxService
+from seleniumx.webdriver.remote.command import Command
+from seleniumx.webdriver.remote.webdriver import RemoteWebDriver
+
+#: Slice size for incrementally decoding base64 screenshots to disk. Must be
+#: a multiple of 4 so every slice decodes independently.
+_B64_FILE_CHUNK = 4096
+
+_logger = logging.getLogger(__name__)
+
+
+class FirefoxDriver(RemoteWebDriver):
+    """Controls the GeckoDriver and allows you to drive the browser."""
+
+    CONTEXT_CHROME = "chrome"
+    CONTEXT_CONTENT = "content"
+
+    def __init__(self, executable_path="geckodriver", port=0, options=None,
+                 desired_capabilities=None, service_args=None,
+                 service_log_path="geckodriver.log", firefox_profile=None,
+                 keep_alive=True):
+        """Starts a new local session of Firefox.
+
+        Based on the combination and specificity of the various keyword
+        arguments, a capabilities dictionary will be constructed that is passed
+        to the remote end.
+
+        :Args:
+         - executable_path - Full path to override which geckodriver binary to use.
+         - port - Port to run the service on.
+         - options - Instance of ``options.Options``.
+         - desired_capabilities - Dictionary of desired capabilities.
+         - service_args - List of args to pass to the driver service.
+         - service_log_path - Where to log information from the driver.
+         - firefox_profile - Instance of ``FirefoxProfile`` object.
+         - keep_alive - Whether to configure remote_connection.RemoteConnection to use HTTP keep-alive.
+        """
+        self.service = FirefoxService(
+            executable_path, port=port, service_args=service_args,
+            log_path=service_log_path)
+        if desired_capabilities is None:
+            # the shared read-only view suffices here: capability merging only
+            # iterates the mapping, so no per-session copy is needed
+            desired_capabilities = _FIREFOX_CAPS_VIEW
+        if options is None:
+            options = Options()
+        super().__init__(server_url=self.service.service_url, options=options,
+                         desired_capabilities=desired_capabilities,
+                         browser_profile=firefox_profile, keep_alive=keep_alive)
+        self._is_remote = False
+        # last context set through this driver; lets context() skip the
+        # GET_CONTEXT round-trip once the value is known
+        self._cached_context = None
+
+    async def start_service(self):
+        await self.service.start()
+
+    async def quit(self):
+        """Quits the driver and close every associated window."""
+        try:
+            await super().quit()
+        except Exception as ex:
+            # Happens if Firefox shutsdown before we've read the response from
+            # the connection. Lazy %s formatting defers str(ex) until a
+            # handler actually emits the record.
+            _logger.warning("Something went wrong issuing quit request to the browser. Error - %s", ex)
+        finally:
+            await self.service.stop()
+
+    @property
+    def firefox_profile(self):
+        return self._browser_profile
+
+    @asynccontextmanager
+    async def context(self, context):
+        """Sets the context that Selenium commands are running in using
+        a `with` statement. The state of the context on the server is
+        saved before entering the block, and restored upon exiting it.
+
+        :Args:
+         - context: Context, may be one of the class properties
+           `CONTEXT_CHROME` or `CONTEXT_CONTENT`.
+
+        Usage example::
+
+            async with driver.context(driver.CONTEXT_CHROME):
+                # chrome scope
+                ... do stuff ...
+        """
+        initial_context = self._cached_context
+        if initial_context is None:
+            response = await self.execute(Command.GET_CONTEXT)
+            initial_context = response["value"]
+        await self.set_context(context)
+        try:
+            yield
+        finally:
+            await self.set_context(initial_context)
+
+    async def set_context(self, context):
+        await self.execute(Command.SET_CONTEXT, {"context": context})
+        self._cached_context = context
+
+    async def install_addon(self, path, temporary=None):
+        """Installs Firefox addon.
+
+        Returns identifier of installed addon. This identifier can later
+        be used to uninstall addon.
+
+        :Args:
+         - path: Absolute path to the addon that will be installed.
+
+        :Usage:
+            ::
+
+                await driver.install_addon('/path/to/firebug.xpi')
+        """
+        payload = {"path": path}
+        if temporary is not None:
+            payload["temporary"] = temporary
+        response = await self.execute(Command.INSTALL_ADDON, payload)
+        return response["value"]
+
+    async def uninstall_addon(self, identifier):
+        """Uninstalls Firefox addon using its identifier.
+
+        :Usage:
+            ::
+
+                await driver.uninstall_addon('addon@foo.com')
+        """
+        await self.execute(Command.UNINSTALL_ADDON, {"id": identifier})
+
+    async def get_full_page_screenshot_as_file(self, filename):
+        """Saves a full document screenshot of the current window to a PNG
+        image file. Returns False if there is any IOError, else returns True.
+        Use full paths in your filename.
+
+        :Args:
+         - filename: The full path you wish to save your screenshot to. This
+           should end with a `.png` extension.
+
+        :Usage:
+            ::
+
+                await driver.get_full_page_screenshot_as_file('/Screenshots/foo.png')
+        """
+        if not filename.lower().endswith(".png"):
+            warnings.warn(
+                "name used for saved screenshot does not match file type. "
+                "It should end with a `.png` extension", UserWarning)
+        b64 = await self.get_full_page_screenshot_as_base64()
+        try:
+            async with aiofiles.open(filename, mode="wb") as fd:
+                # Decode in 4-char aligned slices so only one small chunk of
+                # decoded bytes is alive at a time, instead of holding the
+                # base64 string plus the whole decoded PNG.
+                for offset in range(0, len(b64), _B64_FILE_CHUNK):
+                    await fd.write(base64.b64decode(b64[offset:offset + _B64_FILE_CHUNK]))
+        except OSError:
+            return False
+        return True
+
+    async def save_full_page_screenshot(self, filename):
+        """Saves a full document screenshot of the current window to a PNG
+        image file. Returns False if there is any IOError, else returns True.
+        Use full paths in your filename.
+
+        :Args:
+         - filename: The full path you wish to save your screenshot to. This
+           should end with a `.png` extension.
+
+        :Usage:
+            ::
+
+                await driver.save_full_page_screenshot('/Screenshots/foo.png')
+        """
+        return await self.get_full_page_screenshot_as_file(filename)
+
+    async def get_full_page_screenshot_as_png(self):
+        """Gets the full document screenshot of the current window as a binary data.
+
+        :Usage:
+            ::
+
+                await driver.get_full_page_screenshot_as_png()
+        """
+        # b64decode accepts str directly, so no intermediate ascii bytes copy
+        return base64.b64decode(await self.get_full_page_screenshot_as_base64())
+
+    async def get_full_page_screenshot_as_base64(self):
+        """Gets the full document screenshot of the current window as a base64
+        encoded string which is useful in embedded images in HTML.
+
+        :Usage:
+            ::
+
+                await driver.get_full_page_screenshot_as_base64()
+        """
+        response = await self.execute(Command.FULL_PAGE_SCREENSHOT)
+        return response["value"]
@@ -0,0 +1,30 @@
+from seleniumx.webdriver.common import service
+
+
+class IeService(service.Service):
+    """Object that manages the starting and stopping of the IEDriver."""
+
+    def __init__(self, executable_path, port=0, host=None, log_level=None, log_file=None):
+        """Creates a new instance of the IEDriver service.
+
+        :Args:
+         - executable_path : Path to the IEDriver
+         - port : Port the service is running on
+         - host : IP address the service port is bound
+         - log_level : Level of logging of service, may be "FATAL", "ERROR", "WARN", "INFO", "DEBUG", "TRACE".
+           Default is "FATAL".
+         - log_file : Target of logging of service, may be "stdout", "stderr" or file path.
+           Default is "stdout".
+        """
+        self.service_args = []
+        if host is not None:
+            self.service_args.append(f"--host={host}")
+        if log_level is not None:
+            self.service_args.append(f"--log-level={log_level}")
+        if log_file is not None:
+            self.service_args.append(f"--log-file={log_file}")
+        super().__init__(executable_path, port=port,
+                         start_error_message="Please download from http://selenium-release.storage.googleapis.com/index.html and read up at https://github.com/SeleniumHQ/selenium/wiki/InternetExplorerDriver")
+
+    def command_line_args(self):
+        return [f"--port={self.port}"] + self.service_args
@@ -0,0 +1,59 @@
+"""The IE WebDriver implementation."""
+
+import logging
+
+from seleniumx.webdriver.common.desired_capabilities import DesiredCapabilities
+from seleniumx.webdriver.ie.service import IeService
+from seleniumx.webdriver.remote.webdriver import RemoteWebDriver
+
+DEFAULT_PORT = 0
+DEFAULT_HOST = None
+DEFAULT_LOG_LEVEL = None
+DEFAULT_SERVICE_LOG_PATH = None
+
+_logger = logging.getLogger(__name__)
+
+
+class IEDriver(RemoteWebDriver):
+    """Controls the IEServerDriver and allows you to drive Internet Explorer."""
+
+    def __init__(self, executable_path="IEDriverServer.exe", port=DEFAULT_PORT,
+                 desired_capabilities=None, host=DEFAULT_HOST,
+                 log_level=DEFAULT_LOG_LEVEL, service_log_path=DEFAULT_SERVICE_LOG_PATH,
+                 options=None, keep_alive=True):
+        """Creates a new instance of the Ie driver.
+
+        Starts the service and then creates new instance of Ie driver.
+
+        :Args:
+         - executable_path - path to the executable. If the default is used it assumes the executable is in the $PATH
+         - port - port you would like the service to run, if left as 0, a free port will be found.
+         - desired_capabilities: Dictionary object with desired capabilities
+         - host - IP address for the service
+         - log_level - log level you would like the service to run.
+         - service_log_path - target of logging of service, may be "stdout", "stderr" or file path.
+         - options - IE Options instance, providing additional IE options
+         - keep_alive - Whether to configure RemoteConnection to use HTTP keep-alive.
+        """
+        self.service = IeService(
+            executable_path, port=port, host=host, log_level=log_level,
+            log_file=service_log_path)
+        if desired_capabilities is None:
+            desired_capabilities = DesiredCapabilities.INTERNETEXPLORER.copy()
+        super().__init__(server_url=self.service.service_url, options=options,
+                         desired_capabilities=desired_capabilities,
+                         keep_alive=keep_alive)
+        self._is_remote = False
+
+    async def start_service(self):
+        await self.service.start()
+
+    async def quit(self):
+        """Closes the browser and shuts down the IEServerDriver executable."""
+        try:
+            await super().quit()
+        except Exception as ex:
+            # We don't care about the message because something probably has gone wrong
+            _logger.warning("Something went wrong issuing quit request to the browser. Error - %s", ex)
+        finally:
+            await self.service.stop()
@@ -0,0 +1,262 @@
+"""Encodes `Command` constants into HTTP method / url pairs understood by
+the remote end."""
+
+import string
+from collections import namedtuple
+from enum import Enum
+
+from seleniumx.common.exceptions import WebDriverException
+from seleniumx.webdriver.remote.command import Command
+
+_FORMATTER = string.Formatter()
+
+#: What `encode` hands back — just the resolved http method and the final
+#: url, without the template machinery a registered CommandSpec carries.
+ParsedCommandSpec = namedtuple("ParsedCommandSpec", ("http_method", "url_path"))
+
+
+class HttpMethod(Enum):
+    GET = "GET"
+    POST = "POST"
+    DELETE = "DELETE"
+
+
+class CommandSpec(object):
+    """A single wire protocol end point — http method plus url template."""
+
+    __slots__ = ("_http_method", "_url_path", "_segments")
+
+    def __init__(self, http_method, url_path):
+        self._http_method = http_method
+        self._url_path = url_path
+        # Pre-parse the url template once so encoding a command is a plain
+        # join over (literal, field) pairs instead of re-running the format
+        # grammar on every dispatch.
+        self._segments = tuple(
+            (literal, field) for literal, field, _, _ in _FORMATTER.parse(str(url_path)))
+
+    @property
+    def http_method(self):
+        return self._http_method
+
+    @property
+    def url_path(self):
+        return self._url_path
+
+    def __str__(self):
+        return f"{self._http_method.value} {self._url_path}"
+
+
+class CommandCodec(object):
+    """Translates a `CommandInfo` into the concrete request spec for the
+    W3C (and, where still needed, the legacy JsonWire) protocol.
+
+    Browser specific codecs subclass this and add their vendor end points."""
+
+    browser_name = None
+
+    #: normalized browser_name -> codec class, populated by
+    #: __init_subclass__ so importing a vendor codec is all it takes to make
+    #: it selectable — no list to keep in sync, no per-call reflection
+    _registry = {}
+
+    #: command tables built once per codec class; CommandSpec is immutable so
+    #: later instances shallow-copy the cached dicts instead of re-registering
+    #: the ~130 end points on every driver start
+    _COMMANDS_CACHE = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        browser_name = cls.__dict__.get("browser_name")
+        if browser_name:
+            CommandCodec._registry[browser_name.strip().lower()] = cls
+
+    def __init__(self):
+        cached = CommandCodec._COMMANDS_CACHE.get(type(self))
+        if cached is None:
+            self._commands = {}
+            self._aliases = {}
+            self._table = {}
+            self._init_command_specs()
+            CommandCodec._COMMANDS_CACHE[type(self)] = (dict(self._commands),
+                                                        dict(self._aliases))
+        else:
+            commands, aliases = cached
+            self._commands = dict(commands)
+            self._aliases = dict(aliases)
+            # flattened dispatch table: one lookup yields the method and the
+            # pre-split url segments, so the hot path never touches a
+            # CommandSpec attribute
+            self._table = {command: (spec._http_method, spec._segments)
+                           for command, spec in self._commands.items()}
+
+    def add_command(self, command, http_method, url_path):
+        spec = CommandSpec(http_method, url_path)
+        self._commands[command] = spec
+        self._table[command] = (spec._http_method, spec._segments)
+
+    def add_alias(self, command, alias_of):
+        self._aliases[command] = alias_of
+
+    def remove_command(self, command):
+        self._commands.pop(command, None)
+        self._table.pop(command, None)
+
+    def encode(self, command_info):
+        """Resolves `command_info` to a `ParsedCommandSpec` whose url has all
+        the placeholders substituted.
+
+        `command_info` is duck-typed; anything exposing `command` and
+        `get_all_params` works, which keeps the hot path free of type
+        checks."""
+        command = command_info.command
+        # single lookup on the common path; aliases are rare enough that
+        # resolving them only on a miss beats an unconditional .get
+        entry = self._table.get(command)
+        if entry is None:
+            alias_of = self._aliases.get(command)
+            if alias_of is not None:
+                entry = self._table.get(alias_of)
+        if entry is None:
+            raise WebDriverException(f"Unrecognized command {command}")
+        http_method, segments = entry
+        params = command_info.get_all_params()
+        try:
+            url = "".join(
+                literal + str(params[field]) if field is not None else literal
+                for literal, field in segments)
+        except KeyError as ex:
+            raise ValueError(f"Missing url parameter {ex} for {command}")
+        return ParsedCommandSpec(http_method, url)
+
+    def _init_command_specs(self):
+        self.add_command(Command.STATUS, HttpMethod.GET, "/status")
+        self.add_command(Command.NEW_SESSION, HttpMethod.POST, "/session")
+        self.add_command(Command.GET_ALL_SESSIONS, HttpMethod.GET, "/sessions")
+        self.add_command(Command.QUIT, HttpMethod.DELETE, "/session/{sessionId}")
+        self.add_command(Command.GET_CURRENT_WINDOW_HANDLE, HttpMethod.GET, "/session/{sessionId}/window_handle")
+        self.add_command(Command.W3C_GET_CURRENT_WINDOW_HANDLE, HttpMethod.GET, "/session/{sessionId}/window")
+        self.add_command(Command.GET_WINDOW_HANDLES, HttpMethod.GET, "/session/{sessionId}/window_handles")
+        self.add_command(Command.W3C_GET_WINDOW_HANDLES, HttpMethod.GET, "/session/{sessionId}/window/handles")
+        self.add_command(Command.GET, HttpMethod.POST, "/session/{sessionId}/url")
+        self.add_command(Command.GO_FORWARD, HttpMethod.POST, "/session/{sessionId}/forward")
+        self.add_command(Command.GO_BACK, HttpMethod.POST, "/session/{sessionId}/back")
+        self.add_command(Command.REFRESH, HttpMethod.POST, "/session/{sessionId}/refresh")
+        self.add_command(Command.EXECUTE_SCRIPT, HttpMethod.POST, "/session/{sessionId}/execute")
+        self.add_command(Command.W3C_EXECUTE_SCRIPT, HttpMethod.POST, "/session/{sessionId}/execute/sync")
+        self.add_command(Command.W3C_EXECUTE_SCRIPT_ASYNC, HttpMethod.POST, "/session/{sessionId}/execute/async")
+        self.add_command(Command.GET_CURRENT_URL, HttpMethod.GET, "/session/{sessionId}/url")
+        self.add_command(Command.GET_TITLE, HttpMethod.GET, "/session/{sessionId}/title")
+        self.add_command(Command.GET_PAGE_SOURCE, HttpMethod.GET, "/session/{sessionId}/source")
+        self.add_command(Command.SCREENSHOT, HttpMethod.GET, "/session/{sessionId}/screenshot")
+        self.add_command(Command.ELEMENT_SCREENSHOT, HttpMethod.GET, "/session/{sessionId}/element/{id}/screenshot")
+        self.add_command(Command.FIND_ELEMENT, HttpMethod.POST, "/session/{sessionId}/element")
+        self.add_command(Command.FIND_ELEMENTS, HttpMethod.POST, "/session/{sessionId}/elements")
+        self.add_command(Command.W3C_GET_ACTIVE_ELEMENT, HttpMethod.GET, "/session/{sessionId}/element/active")
+        self.add_command(Command.GET_ACTIVE_ELEMENT, HttpMethod.POST, "/session/{sessionId}/element/active")
+        self.add_command(Command.FIND_CHILD_ELEMENT, HttpMethod.POST, "/session/{sessionId}/element/{id}/element")
+        self.add_command(Command.FIND_CHILD_ELEMENTS, HttpMethod.POST, "/session/{sessionId}/element/{id}/elements")
+        self.add_command(Command.CLICK_ELEMENT, HttpMethod.POST, "/session/{sessionId}/element/{id}/click")
+        self.add_command(Command.CLEAR_ELEMENT, HttpMethod.POST, "/session/{sessionId}/element/{id}/clear")
+        self.add_command(Command.SUBMIT_ELEMENT, HttpMethod.POST, "/session/{sessionId}/element/{id}/submit")
+        self.add_command(Command.GET_ELEMENT_TEXT, HttpMethod.GET, "/session/{sessionId}/element/{id}/text")
+        self.add_command(Command.SEND_KEYS_TO_ELEMENT, HttpMethod.POST, "/session/{sessionId}/element/{id}/value")
+        self.add_command(Command.SEND_KEYS_TO_ACTIVE_ELEMENT, HttpMethod.POST, "/session/{sessionId}/keys")
+        self.add_command(Command.UPLOAD_FILE, HttpMethod.POST, "/session/{sessionId}/se/file")
+        self.add_command(Command.GET_ELEMENT_VALUE, HttpMethod.GET, "/session/{sessionId}/element/{id}/value")
+        self.add_command(Command.GET_ELEMENT_TAG_NAME, HttpMethod.GET, "/session/{sessionId}/element/{id}/name")
+        self.add_command(Command.IS_ELEMENT_SELECTED, HttpMethod.GET, "/session/{sessionId}/element/{id}/selected")
+        self.add_command(Command.IS_ELEMENT_ENABLED, HttpMethod.GET, "/session/{sessionId}/element/{id}/enabled")
+        self.add_command(Command.IS_ELEMENT_DISPLAYED, HttpMethod.GET, "/session/{sessionId}/element/{id}/displayed")
+        self.add_command(Command.GET_ELEMENT_LOCATION, HttpMethod.GET, "/session/{sessionId}/element/{id}/location")
+        self.add_command(Command.GET_ELEMENT_LOCATION_ONCE_SCROLLED_INTO_VIEW, HttpMethod.GET,
+                         "/session/{sessionId}/element/{id}/location_in_view")
+        self.add_command(Command.GET_ELEMENT_SIZE, HttpMethod.GET, "/session/{sessionId}/element/{id}/size")
+        self.add_command(Command.GET_ELEMENT_RECT, HttpMethod.GET, "/session/{sessionId}/element/{id}/rect")
+        self.add_command(Command.GET_ELEMENT_ATTRIBUTE, HttpMethod.GET,
+                         "/session/{sessionId}/element/{id}/attribute/{name}")
+        self.add_command(Command.GET_ELEMENT_PROPERTY, HttpMethod.GET,
+                         "/session/{sessionId}/element/{id}/property/{name}")
+        self.add_command(Command.GET_ALL_COOKIES, HttpMethod.GET, "/session/{sessionId}/cookie")
+        self.add_command(Command.ADD_COOKIE, HttpMethod.POST, "/session/{sessionId}/cookie")
+        self.add_command(Command.GET_COOKIE, HttpMethod.GET, "/session/{sessionId}/cookie/{name}")
+        self.add_command(Command.DELETE_ALL_COOKIES, HttpMethod.DELETE, "/session/{sessionId}/cookie")
+        self.add_command(Command.DELETE_COOKIE, HttpMethod.DELETE, "/session/{sessionId}/cookie/{name}")
+        self.add_command(Command.SWITCH_TO_FRAME, HttpMethod.POST, "/session/{sessionId}/frame")
+        self.add_command(Command.SWITCH_TO_PARENT_FRAME, HttpMethod.POST, "/session/{sessionId}/frame/parent")
+        self.add_command(Command.SWITCH_TO_WINDOW, HttpMethod.POST, "/session/{sessionId}/window")
+        self.add_command(Command.NEW_WINDOW, HttpMethod.POST, "/session/{sessionId}/window/new")
+        self.add_command(Command.CLOSE, HttpMethod.DELETE, "/session/{sessionId}/window")
+        self.add_command(Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY, HttpMethod.GET,
+                         "/session/{sessionId}/element/{id}/css/{propertyName}")
+        self.add_command(Command.IMPLICIT_WAIT, HttpMethod.POST, "/session/{sessionId}/timeouts/implicit_wait")
+        self.add_command(Command.EXECUTE_ASYNC_SCRIPT, HttpMethod.POST, "/session/{sessionId}/execute_async")
+        self.add_command(Command.SET_SCRIPT_TIMEOUT, HttpMethod.POST, "/session/{sessionId}/timeouts/async_script")
+        self.add_command(Command.SET_TIMEOUTS, HttpMethod.POST, "/session/{sessionId}/timeouts")
+        self.add_command(Command.GET_TIMEOUTS, HttpMethod.GET, "/session/{sessionId}/timeouts")
+        self.add_command(Command.DISMISS_ALERT, HttpMethod.POST, "/session/{sessionId}/dismiss_alert")
+        self.add_command(Command.W3C_DISMISS_ALERT, HttpMethod.POST, "/session/{sessionId}/alert/dismiss")
+        self.add_command(Command.ACCEPT_ALERT, HttpMethod.POST, "/session/{sessionId}/accept_alert")
+        self.add_command(Command.W3C_ACCEPT_ALERT, HttpMethod.POST, "/session/{sessionId}/alert/accept")
+        self.add_command(Command.SET_ALERT_VALUE, HttpMethod.POST, "/session/{sessionId}/alert_text")
+        self.add_command(Command.W3C_SET_ALERT_VALUE, HttpMethod.POST, "/session/{sessionId}/alert/text")
+        self.add_command(Command.GET_ALERT_TEXT, HttpMethod.GET, "/session/{sessionId}/alert_text")
+        self.add_command(Command.W3C_GET_ALERT_TEXT, HttpMethod.GET, "/session/{sessionId}/alert/text")
+        self.add_command(Command.SET_ALERT_CREDENTIALS, HttpMethod.POST, "/session/{sessionId}/alert/credentials")
+        self.add_command(Command.CLICK, HttpMethod.POST, "/session/{sessionId}/click")
+        self.add_command(Command.W3C_ACTIONS, HttpMethod.POST, "/session/{sessionId}/actions")
+        self.add_command(Command.W3C_CLEAR_ACTIONS, HttpMethod.DELETE, "/session/{sessionId}/actions")
+        self.add_command(Command.DOUBLE_CLICK, HttpMethod.POST, "/session/{sessionId}/doubleclick")
+        self.add_command(Command.MOUSE_DOWN, HttpMethod.POST, "/session/{sessionId}/buttondown")
+        self.add_command(Command.MOUSE_UP, HttpMethod.POST, "/session/{sessionId}/buttonup")
+        self.add_command(Command.MOVE_TO, HttpMethod.POST, "/session/{sessionId}/moveto")
+        self.add_command(Command.GET_WINDOW_SIZE, HttpMethod.GET, "/session/{sessionId}/window/{windowHandle}/size")
+        self.add_command(Command.SET_WINDOW_SIZE, HttpMethod.POST, "/session/{sessionId}/window/{windowHandle}/size")
+        self.add_command(Command.GET_WINDOW_POSITION, HttpMethod.GET,
+                         "/session/{sessionId}/window/{windowHandle}/position")
+        self.add_command(Command.SET_WINDOW_POSITION, HttpMethod.POST,
+                         "/session/{sessionId}/window/{windowHandle}/position")
+        self.add_command(Command.SET_WINDOW_RECT, HttpMethod.POST, "/session/{sessionId}/window/rect")
+        self.add_command(Command.GET_WINDOW_RECT, HttpMethod.GET, "/session/{sessionId}/window/rect")
+        self.add_command(Command.MAXIMIZE_WINDOW, HttpMethod.POST, "/session/{sessionId}/window/{windowHandle}/maximize")
+        self.add_command(Command.W3C_MAXIMIZE_WINDOW, HttpMethod.POST, "/session/{sessionId}/window/maximize")
+        self.add_command(Command.SET_SCREEN_ORIENTATION, HttpMethod.POST, "/session/{sessionId}/orientation")
+        self.add_command(Command.GET_SCREEN_ORIENTATION, HttpMethod.GET, "/session/{sessionId}/orientation")
+        self.add_command(Command.SINGLE_TAP, HttpMethod.POST, "/session/{sessionId}/touch/click")
+        self.add_command(Command.TOUCH_DOWN, HttpMethod.POST, "/session/{sessionId}/touch/down")
+        self.add_command(Command.TOUCH_UP, HttpMethod.POST, "/session/{sessionId}/touch/up")
+        self.add_command(Command.TOUCH_MOVE, HttpMethod.POST, "/session/{sessionId}/touch/move")
+        self.add_command(Command.TOUCH_SCROLL, HttpMethod.POST, "/session/{sessionId}/touch/scroll")
+        self.add_command(Command.DOUBLE_TAP, HttpMethod.POST, "/session/{sessionId}/touch/doubleclick")
+        self.add_command(Command.LONG_PRESS, HttpMethod.POST, "/session/{sessionId}/touch/longclick")
+        self.add_command(Command.FLICK, HttpMethod.POST, "/session/{sessionId}/touch/flick")
+        self.add_command(Command.EXECUTE_SQL, HttpMethod.POST, "/session/{sessionId}/execute_sql")
+        self.add_command(Command.GET_LOCATION, HttpMethod.GET, "/session/{sessionId}/location")
+        self.add_command(Command.SET_LOCATION, HttpMethod.POST, "/session/{sessionId}/location")
+        self.add_command(Command.GET_APP_CACHE, HttpMethod.GET, "/session/{sessionId}/application_cache")
+        self.add_command(Command.GET_APP_CACHE_STATUS, HttpMethod.GET, "/session/{sessionId}/application_cache/status")
+        self.add_command(Command.CLEAR_APP_CACHE, HttpMethod.DELETE, "/session/{sessionId}/application_cache/clear")
+        self.add_command(Command.GET_NETWORK_CONNECTION, HttpMethod.GET, "/session/{sessionId}/network_connection")
+        self.add_command(Command.SET_NETWORK_CONNECTION, HttpMethod.POST, "/session/{sessionId}/network_connection")
+        self.add_command(Command.GET_LOCAL_STORAGE_ITEM, HttpMethod.GET, "/session/{sessionId}/local_storage/key/{key}")
+        self.add_command(Command.REMOVE_LOCAL_STORAGE_ITEM, HttpMethod.DELETE,
+                         "/session/{sessionId}/local_storage/key/{key}")
+        self.add_command(Command.GET_LOCAL_STORAGE_KEYS, HttpMethod.GET, "/session/{sessionId}/local_storage")
+        self.add_command(Command.SET_LOCAL_STORAGE_ITEM, HttpMethod.POST, "/session/{sessionId}/local_storage")
+        self.add_command(Command.CLEAR_LOCAL_STORAGE, HttpMethod.DELETE, "/session/{sessionId}/local_storage")
+        self.add_command(Command.GET_LOCAL_STORAGE_SIZE, HttpMethod.GET, "/session/{sessionId}/local_storage/size")
+        self.add_command(Command.GET_SESSION_STORAGE_ITEM, HttpMethod.GET,
+                         "/session/{sessionId}/session_storage/key/{key}")
+        self.add_command(Command.REMOVE_SESSION_STORAGE_ITEM, HttpMethod.DELETE,
+                         "/session/{sessionId}/session_storage/key/{key}")
+        self.add_command(Command.GET_SESSION_STORAGE_KEYS, HttpMethod.GET, "/session/{sessionId}/session_storage")
+        self.add_command(Command.SET_SESSION_STORAGE_ITEM, HttpMethod.POST, "/session/{sessionId}/session_storage")
+        self.add_command(Command.CLEAR_SESSION_STORAGE, HttpMethod.DELETE, "/session/{sessionId}/session_storage")
+        self.add_command(Command.GET_SESSION_STORAGE_SIZE, HttpMethod.GET, "/session/{sessionId}/session_storage/size")
+        self.add_command(Command.GET_LOG, HttpMethod.POST, "/session/{sessionId}/se/log")
+        self.add_command(Command.GET_AVAILABLE_LOG_TYPES, HttpMethod.GET, "/session/{sessionId}/se/log/types")
+        self.add_command(Command.CURRENT_CONTEXT_HANDLE, HttpMethod.GET, "/session/{sessionId}/context")
+        self.add_command(Command.CONTEXT_HANDLES, HttpMethod.GET, "/session/{sessionId}/contexts")
+        self.add_command(Command.SWITCH_TO_CONTEXT, HttpMethod.POST, "/session/{sessionId}/context")
+        self.add_command(Command.FULLSCREEN_WINDOW, HttpMethod.POST, "/session/{sessionId}/window/fullscreen")
+        self.add_command(Command.MINIMIZE_WINDOW, HttpMethod.POST, "/session/{sessionId}/window/minimize")
@@ -0,0 +1,199 @@
+"""Error handling for the responses coming back from the remote end."""
+
+import logging
+
+from seleniumx.common import exceptions
+
+_logger = logging.getLogger(__name__)
+
+
+class ErrorCode(object):
+    """Error codes defined in the WebDriver wire protocol.
+
+    Each constant carries the legacy numeric status plus the W3C error
+    string so both protocol dialects resolve to the same exception."""
+
+    SUCCESS = 0
+    NO_SUCH_ELEMENT = [7, "no such element"]
+    NO_SUCH_FRAME = [8, "no such frame"]
+    UNKNOWN_COMMAND = [9, "unknown command"]
+    STALE_ELEMENT_REFERENCE = [10, "stale element reference"]
+    ELEMENT_NOT_VISIBLE = [11, "element not visible"]
+    INVALID_ELEMENT_STATE = [12, "invalid element state"]
+    UNKNOWN_ERROR = [13, "unknown error"]
+    ELEMENT_IS_NOT_SELECTABLE = [15, "element not selectable"]
+    JAVASCRIPT_ERROR = [17, "javascript error"]
+    XPATH_LOOKUP_ERROR = [19, "invalid selector"]
+    TIMEOUT = [21, "timeout"]
+    NO_SUCH_WINDOW = [23, "no such window"]
+    INVALID_COOKIE_DOMAIN = [24, "invalid cookie domain"]
+    UNABLE_TO_SET_COOKIE = [25, "unable to set cookie"]
+    UNEXPECTED_ALERT_OPEN = [26, "unexpected alert open"]
+    NO_ALERT_OPEN = [27, "no such alert"]
+    SCRIPT_TIMEOUT = [28, "script timeout"]
+    INVALID_ELEMENT_COORDINATES = [29, "invalid element coordinates"]
+    IME_NOT_AVAILABLE = [30, "ime not available"]
+    IME_ENGINE_ACTIVATION_FAILED = [31, "ime engine activation failed"]
+    INVALID_SELECTOR = [32, "invalid selector"]
+    SESSION_NOT_CREATED = [33, "session not created"]
+    MOVE_TARGET_OUT_OF_BOUNDS = [34, "move target out of bounds"]
+    INVALID_XPATH_SELECTOR = [51, "invalid selector"]
+    INVALID_XPATH_SELECTOR_RETURN_TYPER = [52, "invalid selector"]
+
+    ELEMENT_NOT_INTERACTABLE = [60, "element not interactable"]
+    INSECURE_CERTIFICATE = ["insecure certificate"]
+    INVALID_ARGUMENT = [61, "invalid argument"]
+    INVALID_COORDINATES = ["invalid coordinates"]
+    INVALID_SESSION_ID = ["invalid session id"]
+    NO_SUCH_COOKIE = [62, "no such cookie"]
+    UNABLE_TO_CAPTURE_SCREEN = [63, "unable to capture screen"]
+    ELEMENT_CLICK_INTERCEPTED = [64, "element click intercepted"]
+    UNKNOWN_METHOD = ["unknown method exception"]
+
+    METHOD_NOT_ALLOWED = [405, "unsupported operation"]
+
+
+class ErrorHandler(object):
+    """Handles errors returned by the WebDriver server."""
+
+    def handle(self, response):
+        """Checks that a JSON response from the WebDriver does not have an
+        error, raising the corresponding exception when it does.
+
+        :Args:
+         - response - The JSON response from the WebDriver server as a dictionary
+           object.
+
+        :Raises: If the response contains an error message.
+        """
+        status = response.get("status", None)
+        if status is None or status == ErrorCode.SUCCESS:
+            return
+        # normalize once: int() handles both real ints and numeric strings
+        # (including surrounding whitespace) without the str round-trip
+        try:
+            status_int = int(status)
+        except (TypeError, ValueError):
+            status_int = None
+        if status_int is not None:
+            status, value, message = self._get_status_value_message(response, status_int)
+        else:
+            value = response.get("value", None)
+            message = ""
+            if isinstance(value, dict):
+                status = value.get("error", status)
+                message = value.get("message", "")
+                value = value.get("data", value)
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("error handler resolved status %s", status)
+        exception_class = self._exception_for_status(status)
+        screen = None
+        stacktrace = None
+        if isinstance(value, dict):
+            screen = value.get("screen", None)
+            if "stackTrace" in value and value["stackTrace"]:
+                stacktrace = []
+                for frame in value["stackTrace"]:
+                    line = frame.get("lineNumber", "")
+                    file_ = frame.get("fileName", "<anonymous>")
+                    if line:
+                        file_ = f"{file_}:{line}"
+                    meth = frame.get("methodName", "<anonymous>")
+                    if "className" in frame:
+                        meth = f"{frame['className']}.{meth}"
+                    stacktrace.append(f"    at {meth} ({file_})")
+            elif "stacktrace" in value:
+                stacktrace = str(value["stacktrace"]).split("\n")
+            if not message:
+                message = value.get("message", str(value))
+        if exception_class == exceptions.UnexpectedAlertPresentException:
+            alert_text = None
+            if isinstance(value, dict) and "data" in value:
+                alert_text = value["data"].get("text")
+            raise exception_class(message, screen, stacktrace, alert_text)
+        raise exception_class(message, screen, stacktrace)
+
+    def _get_status_value_message(self, response, status):
+        """Normalizes a legacy numeric-status response to the (status, value,
+        message) triple used by `handle`."""
+        value = response.get("value", None)
+        message = ""
+        if isinstance(value, str):
+            message = value
+            value = None
+        elif isinstance(value, dict):
+            message = value.get("message", "")
+        for attr in dir(ErrorCode):
+            if attr.startswith("_"):
+                continue
+            codes = getattr(ErrorCode, attr)
+            if isinstance(codes, list) and status in codes:
+                status = codes[-1] if isinstance(codes[-1], str) else status
+                break
+        return status, value, message
+
+    def _exception_for_status(self, status):
+        if status in ErrorCode.NO_SUCH_ELEMENT:
+            return exceptions.NoSuchElementException
+        elif status in ErrorCode.NO_SUCH_FRAME:
+            return exceptions.NoSuchFrameException
+        elif status in ErrorCode.NO_SUCH_WINDOW:
+            return exceptions.NoSuchWindowException
+        elif status in ErrorCode.STALE_ELEMENT_REFERENCE:
+            return exceptions.StaleElementReferenceException
+        elif status in ErrorCode.ELEMENT_NOT_VISIBLE:
+            return exceptions.ElementNotVisibleException
+        elif status in ErrorCode.INVALID_ELEMENT_STATE:
+            return exceptions.InvalidElementStateException
+        elif status in ErrorCode.INVALID_SELECTOR \
+                or status in ErrorCode.INVALID_XPATH_SELECTOR \
+                or status in ErrorCode.INVALID_XPATH_SELECTOR_RETURN_TYPER:
+            return exceptions.InvalidSelectorException
+        elif status in ErrorCode.ELEMENT_IS_NOT_SELECTABLE:
+            return exceptions.ElementNotSelectableException
+        elif status in ErrorCode.ELEMENT_NOT_INTERACTABLE:
+            return exceptions.ElementNotInteractableException
+        elif status in ErrorCode.INVALID_COOKIE_DOMAIN:
+            return exceptions.InvalidCookieDomainException
+        elif status in ErrorCode.UNABLE_TO_SET_COOKIE:
+            return exceptions.UnableToSetCookieException
+        elif status in ErrorCode.TIMEOUT:
+            return exceptions.TimeoutException
+        elif status in ErrorCode.SCRIPT_TIMEOUT:
+            return exceptions.TimeoutException
+        elif status in ErrorCode.UNEXPECTED_ALERT_OPEN:
+            return exceptions.UnexpectedAlertPresentException
+        elif status in ErrorCode.NO_ALERT_OPEN:
+            return exceptions.NoAlertPresentException
+        elif status in ErrorCode.IME_NOT_AVAILABLE:
+            return exceptions.ImeNotAvailableException
+        elif status in ErrorCode.IME_ENGINE_ACTIVATION_FAILED:
+            return exceptions.ImeActivationFailedException
+        elif status in ErrorCode.MOVE_TARGET_OUT_OF_BOUNDS:
+            return exceptions.MoveTargetOutOfBoundsException
+        elif status in ErrorCode.JAVASCRIPT_ERROR:
+            return exceptions.JavascriptException
+        elif status in ErrorCode.SESSION_NOT_CREATED:
+            return exceptions.SessionNotCreatedException
+        elif status in ErrorCode.INVALID_ARGUMENT:
+            return exceptions.InvalidArgumentException
+        elif status in ErrorCode.NO_SUCH_COOKIE:
+            return exceptions.NoSuchCookieException
+        elif status in ErrorCode.UNABLE_TO_CAPTURE_SCREEN:
+            return exceptions.ScreenshotException
+        elif status in ErrorCode.ELEMENT_CLICK_INTERCEPTED:
+            return exceptions.ElementClickInterceptedException
+        elif status in ErrorCode.INSECURE_CERTIFICATE:
+            return exceptions.InsecureCertificateException
+        elif status in ErrorCode.INVALID_COORDINATES:
+            return exceptions.InvalidCoordinatesException
+        elif status in ErrorCode.INVALID_SESSION_ID:
+            return exceptions.InvalidSessionIdException
+        elif status in ErrorCode.UNKNOWN_METHOD:
+            return exceptions.UnknownMethodException
+        return exceptions.WebDriverException
+
+
+#: ErrorHandler keeps no per-session state, so every executor can share this
+#: one instance instead of allocating a fresh handler per command.
+DEFAULT_ERROR_HANDLER = ErrorHandler()
@@ -0,0 +1,37 @@
+"""File detectors used by `send_keys` to decide whether a value refers to a
+local file that must be uploaded to the remote end first."""
+
+import os
+from abc import ABCMeta, abstractmethod
+
+from seleniumx.webdriver.common.utils import keys_to_typing
+
+
+class FileDetector(object, metaclass=ABCMeta):
+    """Used for identifying whether a sequence of chars represents the path of a file."""
+
+    @abstractmethod
+    def is_local_file(self, *keys):
+        return
+
+
+class UselessFileDetector(FileDetector):
+    """A file detector that never finds anything."""
+
+    def is_local_file(self, *keys):
+        return None
+
+
+class LocalFileDetector(FileDetector):
+    """Detects files on the local disk."""
+
+    def is_local_file(self, *keys):
+        file_path = "".join(keys_to_typing(keys))
+        if not file_path:
+            return None
+        try:
+            if os.path.isfile(file_path):
+                return file_path
+        except Exception:
+            pass
+        return None
@@ -0,0 +1,179 @@
+"""Asynchronous HTTP transport for WebDriver commands."""
+
+import base64
+import json
+import platform
+import types
+from urllib import parse
+
+import httpx
+
+try:
+    # C-accelerated serializer; emits bytes, which the client sends as-is
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_dumps = json.dumps
+
+from seleniumx import __version__
+from seleniumx.webdriver.remote.command_codec import HttpMethod
+from seleniumx.webdriver.remote.errorhandler import DEFAULT_ERROR_HANDLER
+from seleniumx.webdriver.remote.wrappers import WebDriverResponseWrapper
+
+#: Shared stand-in for "no parameters" — never mutated, so one instance
+#: serves every parameterless command without allocating.
+_EMPTY_PARAMS = {}
+
+#: pre-encoded body for parameterless POST commands (back, refresh, close,
+#: ...), so navigation-heavy loops skip JSON serialization entirely
+_EMPTY_BODY = b"{}"
+
+#: Refcounted AsyncClient per (base_url, timeout). Drivers pointed at the
+#: same server share one connection pool instead of opening a private set of
+#: sockets each; the client closes when its last executor does.
+_SHARED_CLIENTS = {}
+
+
+class HttpExecutor(object):
+    """Sends `CommandInfo` objects to the remote end over HTTP and shapes
+    the responses into plain dictionaries."""
+
+    __slots__ = ("_command_codec", "_encode", "_keep_alive", "_timeout",
+                 "_pool_maxsize", "_http2", "_client", "_client_key",
+                 "_request_wrapper", "_base_url", "_headers")
+
+    def __init__(self, command_codec, base_url=None, keep_alive=True, timeout=120,
+                 pool_maxsize=10, http2=False):
+        self._command_codec = command_codec
+        # the codec never changes for the executor's lifetime, so bind its
+        # encoder once instead of two attribute loads per command
+        self._encode = command_codec.encode if command_codec is not None else None
+        self._keep_alive = keep_alive
+        self._timeout = timeout
+        self._pool_maxsize = pool_maxsize
+        self._http2 = http2
+        self._client = None
+        self._client_key = None
+        self._request_wrapper = None
+        self._base_url = None
+        # frozen so concurrent tasks can share the mapping without any
+        # per-request copy; rebuilt wholesale when the base url changes
+        headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json;charset=UTF-8",
+            "User-Agent": f"seleniumx/{__version__} (python {platform.python_version()})",
+        }
+        if keep_alive:
+            # persistent connections are the HTTP/1.1 default, but some
+            # driver servers drop the socket per command unless asked not to
+            headers["Connection"] = "keep-alive"
+        self._headers = types.MappingProxyType(headers)
+        if base_url is not None:
+            self.base_url = base_url
+
+    @property
+    def base_url(self):
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value):
+        if value:
+            value = value.rstrip("/")
+        self._base_url = value
+        # credentials live in the url and never change mid-session, so the
+        # Authorization header is computed once here rather than per request
+        headers = {k: v for k, v in self._headers.items() if k != "Authorization"}
+        auth_header = self._get_auth_header() if value else None
+        if auth_header:
+            headers["Authorization"] = auth_header
+        self._headers = types.MappingProxyType(headers)
+
+    @property
+    def request_wrapper(self):
+        return self._request_wrapper
+
+    @request_wrapper.setter
+    def request_wrapper(self, value):
+        self._request_wrapper = value
+
+    def _get_auth_header(self):
+        """Returns the basic auth header value when the server url carries
+        credentials, else None."""
+        url = parse.urljoin(self._base_url, "/")
+        parsed_url = parse.urlparse(url)
+        if not parsed_url.username:
+            return None
+        auth = f"{parsed_url.username}:{parsed_url.password}"
+        encoded = base64.b64encode(auth.encode("utf-8")).decode("ascii")
+        return f"Basic {encoded}"
+
+    def _get_client(self):
+        if self._client is None:
+            # a maxsize above 1 lets overlapped awaits against one session run
+            # in parallel instead of queueing on a single connection
+            limits = httpx.Limits(max_connections=self._pool_maxsize,
+                                  max_keepalive_connections=self._pool_maxsize)
+            if self._keep_alive:
+                # drivers against the same server share one pooled client;
+                # a second session reuses warm connections instead of paying
+                # TCP/TLS setup for a private pool of its own
+                key = (self._base_url, self._timeout, self._pool_maxsize, self._http2)
+                entry = _SHARED_CLIENTS.get(key)
+                if entry is None:
+                    entry = [httpx.AsyncClient(timeout=self._timeout, limits=limits,
+                                               http2=self._http2), 0]
+                    _SHARED_CLIENTS[key] = entry
+                entry[1] += 1
+                self._client = entry[0]
+                self._client_key = key
+            else:
+                self._client = httpx.AsyncClient(timeout=self._timeout, limits=limits,
+                                                 http2=self._http2)
+        return self._client
+
+    async def execute(self, command_info):
+        """Sends one command and returns the decoded response dictionary.
+
+        :Args:
+         - command_info - the `CommandInfo` describing the command to send.
+        """
+        params = command_info.params or _EMPTY_PARAMS
+        # no defensive copy: unwrap_web_element returns fresh containers
+        # whenever it converts anything, and nothing below mutates params
+        if self._request_wrapper is not None:
+            params = self._request_wrapper.unwrap_web_element(params)
+        command_info.params = params
+        command_spec = self._encode(command_info)
+        url = f"{self._base_url}{command_spec.url_path}"
+        client = self._get_client()
+        if command_spec.http_method == HttpMethod.POST:
+            # unwrap_web_element returns empty containers unchanged, so the
+            # identity check still holds after wrapping
+            data = _EMPTY_BODY if params is _EMPTY_PARAMS else _json_dumps(params)
+            response = await client.post(url, headers=self._headers, content=data)
+        elif command_spec.http_method == HttpMethod.GET:
+            response = await client.get(url, headers=self._headers)
+        else:
+            response = await client.delete(url, headers=self._headers)
+        response_dict = WebDriverResponseWrapper.create_response(response)
+        DEFAULT_ERROR_HANDLER.handle(response_dict)
+        return response_dict
+
+    async def close(self):
+        """Closes the underlying HTTP client.
+
+        Shared clients are refcounted and only actually close when the last
+        executor using them does."""
+        if self._client is None:
+            return
+        client, self._client = self._client, None
+        key, self._client_key = self._client_key, None
+        if key is None:
+            await client.aclose()
+            return
+        entry = _SHARED_CLIENTS.get(key)
+        if entry is not None:
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del _SHARED_CLIENTS[key]
+                await client.aclose()
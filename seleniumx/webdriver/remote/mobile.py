@@ -0,0 +1,97 @@
+"""Mobile specific commands (network connection and contexts)."""
+
+import asyncio
+from operator import itemgetter
+
+from seleniumx.webdriver.remote.command import Command
+
+#: C-level accessor for the ubiquitous response["value"] lookup.
+_VALUE = itemgetter("value")
+
+
+async def execute_batch(driver, commands):
+    """Issues several independent commands concurrently and returns their
+    responses in input order.
+
+    Each entry in `commands` is a `(command, params)` pair. The requests are
+    in flight at the same time, so the remote end may process them in any
+    order — only use this for commands with no ordering dependency (reads,
+    or writes to unrelated state). The underlying HTTP client keeps
+    connections pooled, so the batch shares sockets rather than opening one
+    per command."""
+    return await asyncio.gather(
+        *(driver.execute(command, params) for command, params in commands))
+
+
+class ConnectionType(object):
+    """Describes the mobile network connection as a bit mask.
+
+    Bit 0 - airplane mode, bit 1 - wifi, bit 2 - data."""
+
+    __slots__ = ("mask",)
+
+    def __init__(self, mask):
+        self.mask = mask
+
+    @property
+    def airplane_mode(self):
+        return bool(self.mask & 1)
+
+    @property
+    def wifi(self):
+        return bool((self.mask >> 1) & 1)
+
+    @property
+    def data(self):
+        return bool((self.mask >> 2) & 1)
+
+
+#: Canonical instances for every meaningful 3-bit mask; responses resolve to
+#: these by index, so connection polling loops never allocate and `is`
+#: comparisons against the Mobile class constants hold.
+_CONN_TABLE = tuple(ConnectionType(mask) for mask in range(8))
+
+
+def _connection_type_for(mask):
+    if 0 <= mask < 8:
+        return _CONN_TABLE[mask]
+    return ConnectionType(mask)
+
+
+class Mobile(object):
+
+    ConnectionType = ConnectionType
+    ALL_NETWORK = _CONN_TABLE[6]
+    WIFI_NETWORK = _CONN_TABLE[2]
+    DATA_NETWORK = _CONN_TABLE[4]
+    AIRPLANE_MODE = _CONN_TABLE[1]
+
+    def __init__(self, driver):
+        self._driver = driver
+
+    async def network_connection(self):
+        response = await self._driver.execute(Command.GET_NETWORK_CONNECTION)
+        return _connection_type_for(_VALUE(response))
+
+    async def set_network_connection(self, network):
+        """Set the network connection for the remote device."""
+        # duck-typed: anything carrying a mask works, plain ints pass through
+        mode = getattr(network, "mask", network)
+        response = await self._driver.execute(
+            Command.SET_NETWORK_CONNECTION,
+            {"name": "network_connection", "parameters": {"type": mode}})
+        return _connection_type_for(_VALUE(response))
+
+    async def context(self):
+        """Returns the current context (Native or WebView)."""
+        response = await self._driver.execute(Command.CURRENT_CONTEXT_HANDLE)
+        return _VALUE(response)
+
+    async def contexts(self):
+        """Returns a list of available contexts."""
+        response = await self._driver.execute(Command.CONTEXT_HANDLES)
+        return _VALUE(response)
+
+    async def set_context(self, new_context):
+        """Sets the current context."""
+        await self._driver.execute(Command.SWITCH_TO_CONTEXT, {"name": new_context})
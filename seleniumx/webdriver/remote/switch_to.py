@@ -0,0 +1,159 @@
+"""The SwitchTo implementation."""
+
+from operator import itemgetter
+
+from seleniumx.common.exceptions import (NoSuchFrameException,
+                                         NoSuchWindowException)
+from seleniumx.webdriver.common.alert import Alert
+from seleniumx.webdriver.remote.command import Command
+
+#: C-level accessor for the ubiquitous response["value"] lookup.
+_VALUE = itemgetter("value")
+
+#: Constant request body for default_content, shared across calls — the
+#: executor treats params as read-only, so one instance is safe.
+_DEFAULT_CONTENT_BODY = {"id": None}
+
+
+class SwitchTo(object):
+    """Gives access to frame, window, alert and active element switching."""
+
+    def __init__(self, driver):
+        self._driver = driver
+        self._w3c = driver.w3c
+        # the protocol dialect is fixed for the session, so resolve the
+        # dialect-dependent command once instead of branching per call
+        self._active_element_cmd = (Command.W3C_GET_ACTIVE_ELEMENT if self._w3c
+                                    else Command.GET_ACTIVE_ELEMENT)
+        # window_name -> handle mappings learned by _w3c_window; a hit turns
+        # the O(N round trips) name sweep into one switch command
+        self._handle_cache = {}
+        # handle this client last switched to; lets window() skip a
+        # SWITCH_TO_WINDOW that would be a no-op
+        self._current_handle = None
+
+    def invalidate(self):
+        """Drops cached window metadata; call when windows may have closed
+        or been renamed outside this client."""
+        self._handle_cache.clear()
+        self._current_handle = None
+
+    async def active_element(self):
+        """Returns the element with focus, or BODY if nothing has focus."""
+        response = await self._driver.execute(self._active_element_cmd)
+        return _VALUE(response)
+
+    async def alert(self):
+        """Switches focus to an alert on the page.
+
+        No presence probe is issued here; the first operation on the
+        returned `Alert` raises `NoAlertPresentException` if there is no
+        alert. Use `wait_alert` to validate presence eagerly."""
+        return Alert(self._driver)
+
+    async def wait_alert(self):
+        """Switches focus to an alert, verifying one is actually present.
+
+        Costs one extra round trip over `alert`; raises
+        `NoAlertPresentException` when no alert is open."""
+        alert = Alert(self._driver)
+        await alert.text
+        return alert
+
+    async def default_content(self):
+        """Switch focus to the default frame."""
+        self._current_handle = None
+        await self._driver.execute(Command.SWITCH_TO_FRAME, _DEFAULT_CONTENT_BODY)
+
+    async def frame(self, frame_reference):
+        """Switches focus to the specified frame, by index, name, or webelement."""
+        if frame_reference is None:
+            # same semantics as default_content, which also reuses the
+            # constant {'id': None} payload
+            await self.default_content()
+            return
+        if isinstance(frame_reference, int):
+            self._current_handle = None
+            await self._driver.execute(Command.SWITCH_TO_FRAME, {"id": frame_reference})
+            return
+        if isinstance(frame_reference, str) and self._w3c:
+            # one scripted lookup covers both id and name, where
+            # find_element(By.ID_OR_NAME, ...) costs two sequential finds
+            element = await self._driver.execute_script(
+                "return document.getElementById(arguments[0]) "
+                "|| document.getElementsByName(arguments[0])[0] || null;",
+                frame_reference)
+            if element is None:
+                raise NoSuchFrameException(frame_reference)
+            frame_reference = element
+        self._current_handle = None
+        await self._driver.execute(Command.SWITCH_TO_FRAME, {"id": frame_reference})
+
+    async def new_window(self, type_hint=None):
+        """Switches to a new top-level browsing context.
+
+        The type hint can be one of "tab" or "window"."""
+        response = await self._driver.execute(Command.NEW_WINDOW, {"type": type_hint})
+        # the response handle is fresh and guaranteed valid, so switch to it
+        # directly instead of going through _w3c_window's probe-and-sweep
+        handle = _VALUE(response)["handle"]
+        await self._driver.execute(Command.SWITCH_TO_WINDOW, {"handle": handle})
+        self._current_handle = handle
+
+    async def parent_frame(self):
+        """Switches focus to the parent context."""
+        await self._driver.execute(Command.SWITCH_TO_PARENT_FRAME)
+
+    async def window(self, window_name):
+        """Switches focus to the specified window."""
+        if self._w3c:
+            # defensive re-switches to the already focused handle are common
+            # in tests; skip the round trip outright
+            if isinstance(window_name, str) and window_name == self._current_handle:
+                return
+            await self._w3c_window(window_name)
+            return
+        data = {"name": window_name}
+        await self._driver.execute(Command.SWITCH_TO_WINDOW, data)
+
+    async def _send_handle(self, handle):
+        await self._driver.execute(Command.SWITCH_TO_WINDOW, {"handle": handle})
+        self._current_handle = handle
+
+    async def _w3c_window(self, window_name):
+        # Known window names dispatch straight to their handle — no
+        # doomed try-as-handle probe, so no exception raised and unwound.
+        cached_handle = self._handle_cache.get(window_name)
+        if cached_handle is not None:
+            try:
+                await self._send_handle(cached_handle)
+                return
+            except NoSuchWindowException:
+                # window has gone away since we learned it
+                del self._handle_cache[window_name]
+        try:
+            # Try using it as a window handle first.
+            await self._send_handle(window_name)
+        except NoSuchWindowException:
+            # Check every window to try to find the given window name.
+            original_handle = await self._driver.current_window_handle()
+            handles = await self._driver.window_handles()
+            # probe the original window first without re-switching to it, and
+            # track focus locally so a failed search only restores when the
+            # last probe actually moved away — the naive loop costs two round
+            # trips per handle plus an unconditional restore
+            current_handle = original_handle
+            for handle in [original_handle] + [h for h in handles if h != original_handle]:
+                if handle != current_handle:
+                    await self._send_handle(handle)
+                    current_handle = handle
+                current_name = await self._driver.execute_script("return window.name")
+                # record every name seen, not just the target: one sweep then
+                # resolves any of these windows from the cache later
+                if current_name:
+                    self._handle_cache[current_name] = handle
+                if window_name == current_name:
+                    return
+            if current_handle != original_handle:
+                await self._send_handle(original_handle)
+            raise
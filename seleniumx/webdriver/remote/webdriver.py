@@ -0,0 +1,619 @@
+"""The WebDriver implementation."""
+
+import base64
+import copy
+import inspect
+import warnings
+from contextlib import asynccontextmanager
+
+import aiofiles
+from async_property import async_property
+
+from seleniumx.common.exceptions import (InvalidArgumentException,
+                                         NoSuchCookieException,
+                                         NoSuchElementException,
+                                         WebDriverException)
+from seleniumx.webdriver.common.by import By
+from seleniumx.webdriver.common.timeouts import Timeouts
+from seleniumx.webdriver.firefox.command_codec import FirefoxCommandCodec
+from seleniumx.webdriver.remote.command import Command, CommandInfo
+from seleniumx.webdriver.remote.command_codec import CommandCodec
+from seleniumx.webdriver.remote.errorhandler import ErrorHandler
+from seleniumx.webdriver.remote.file_detector import FileDetector, LocalFileDetector
+from seleniumx.webdriver.remote.http_executor import HttpExecutor
+from seleniumx.webdriver.remote.mobile import Mobile
+from seleniumx.webdriver.remote.switch_to import SwitchTo
+from seleniumx.webdriver.remote.webelement import WebElement
+from seleniumx.webdriver.remote.wrappers import (WebDriverRequestWrapper,
+                                                 WebDriverResponseWrapper)
+from seleniumx.webdriver.safari.command_codec import SafariCommandCodec
+
+_W3C_CAPABILITY_NAMES = frozenset([
+    "acceptInsecureCerts",
+    "browserName",
+    "browserVersion",
+    "platformName",
+    "pageLoadStrategy",
+    "proxy",
+    "setWindowRect",
+    "timeouts",
+    "unhandledPromptBehavior",
+    "strictFileInteractability",
+])
+
+_OSS_W3C_CONVERSION = {
+    "acceptSslCerts": "acceptInsecureCerts",
+    "version": "browserVersion",
+    "platform": "platformName",
+}
+
+_ALLOWED_ORIENTATIONS = frozenset(("LANDSCAPE", "PORTRAIT"))
+
+# importing a vendor codec registers it with CommandCodec._registry; this
+# list only documents the bundled ones (and forces their import)
+all_codecs = [FirefoxCommandCodec, SafariCommandCodec]
+
+
+class _BaseDriver(object):
+    """Holds the pieces of driver state that do not depend on a session."""
+
+    __slots__ = ("_file_detector",)
+
+    def __init__(self, file_detector=None):
+        self._file_detector = file_detector or LocalFileDetector()
+
+    @property
+    def file_detector(self):
+        return self._file_detector
+
+    @file_detector.setter
+    def file_detector(self, detector):
+        """Set the file detector to be used when sending keyboard input.
+
+        By default, this is set to a file detector that does nothing."""
+        if detector is None:
+            raise WebDriverException("You may not set a file detector that is null")
+        if not isinstance(detector, FileDetector):
+            raise WebDriverException("Detector has to be instance of FileDetector")
+        self._file_detector = detector
+
+    @asynccontextmanager
+    async def file_detector_context(self, file_detector_class, *args, **kwargs):
+        """Overrides the current file detector (if necessary) in limited context."""
+        last_detector = None
+        if not isinstance(self.file_detector, file_detector_class):
+            last_detector = self.file_detector
+            self.file_detector = file_detector_class(*args, **kwargs)
+        try:
+            yield
+        finally:
+            if last_detector is not None:
+                # the original detector already passed the setter's checks,
+                # so restore it directly instead of re-validating
+                self._file_detector = last_detector
+
+    #: memoized filtering results keyed by the capability signature; entries
+    #: are shared, so callers must treat the returned structure as read-only
+    _w3c_caps_cache = {}
+
+    def _make_w3c_capabilities(self, capabilities, profile=None):
+        """Makes a W3C always_match capabilities object.
+
+        Filters out capability names that are not in the W3C spec. Spec-compliant
+        drivers will reject requests containing unknown capability names.
+
+        The returned structure is shared across calls with equal inputs and
+        must not be mutated by the caller."""
+        cache_key = None
+        if profile is None:
+            try:
+                cache_key = tuple(sorted(capabilities.items()))
+                hash(cache_key)
+            except TypeError:
+                # unhashable capability values (nested dicts) — skip memoizing
+                cache_key = None
+            if cache_key is not None:
+                cached = _BaseDriver._w3c_caps_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+        # only the nested dicts we actually rewrite get copied below; the
+        # wholesale deepcopy of the capability tree was pure overhead.
+        # membership runs as C-level set intersections on the key view rather
+        # than two tests per key; legacy aliases convert first so an
+        # explicitly supplied spec name wins over its converted twin
+        keys = capabilities.keys()
+        always_match = {}
+        for k in keys & _OSS_W3C_CONVERSION.keys():
+            value = capabilities[k]
+            always_match[_OSS_W3C_CONVERSION[k]] = value.lower() if k == "platform" else value
+        for k in keys & _W3C_CAPABILITY_NAMES:
+            always_match[k] = capabilities[k]
+        for k in keys:
+            if ":" in k:
+                always_match[k] = capabilities[k]
+        if "proxy" in always_match and "proxyType" in always_match["proxy"]:
+            always_match["proxy"] = copy.deepcopy(always_match["proxy"])
+            always_match["proxy"]["proxyType"] = always_match["proxy"]["proxyType"].lower()
+        if profile is not None:
+            # only the top-level mapping gains a key, so a shallow copy
+            # isolates the caller's dict without recursing into its values
+            moz_opts = dict(always_match.get("moz:firefoxOptions", ()))
+            moz_opts["profile"] = profile
+            always_match["moz:firefoxOptions"] = moz_opts
+        result = {"capabilities": {"firstMatch": [{}], "alwaysMatch": always_match}}
+        if cache_key is not None:
+            _BaseDriver._w3c_caps_cache[cache_key] = result
+        return result
+
+
+class RemoteWebDriver(_BaseDriver):
+    """Controls a browser by sending commands to a remote server."""
+
+    # driver objects are created per session, often by the hundred in
+    # parallel suites; slots keep them __dict__-free. Subclasses that add
+    # state get a __dict__ again unless they declare slots of their own.
+    __slots__ = ("_server_url", "session_id", "server_capabilities", "_is_remote",
+                 "_w3c", "_cmd_execute_script", "_cmd_execute_async_script",
+                 "_cmd_window_handle", "_cmd_window_handles",
+                 "_maximize_cmd_params", "_window_op", "user_capabilities",
+                 "user_capabilities_w3c", "_browser_profile",
+                 "_new_session_payload", "command_codec",
+                 "_http_executor", "_response_wrapper", "error_handler",
+                 "_switch_to", "_mobile")
+
+    _web_element_cls = WebElement
+
+    # the base hooks below are plain functions; subclasses overriding them
+    # with coroutines get re-inspected once in __init_subclass__
+    _start_service_is_async = False
+    _start_client_is_async = False
+    _stop_client_is_async = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # hooks are static per subclass, so introspect them here instead of
+        # on every create()/quit() call
+        cls._start_service_is_async = inspect.iscoroutinefunction(cls.start_service)
+        cls._start_client_is_async = inspect.iscoroutinefunction(cls.start_client)
+        cls._stop_client_is_async = inspect.iscoroutinefunction(cls.stop_client)
+
+    def __init__(self, server_url=None, options=None, desired_capabilities=None,
+                 browser_profile=None, keep_alive=True, file_detector=None,
+                 pool_maxsize=10, http2=False):
+        super().__init__(file_detector)
+        self._server_url = server_url or "http://127.0.0.1:4444/wd/hub"
+        self.session_id = None
+        self.server_capabilities = {}
+        self._is_remote = True
+        self._w3c = True
+        self._refresh_dialect_commands()
+        self._set_user_capabilities(options, desired_capabilities, browser_profile)
+        self.command_codec = self._determine_command_codec(self.user_capabilities)
+        self._http_executor = HttpExecutor(self.command_codec, base_url=self._server_url,
+                                           keep_alive=keep_alive,
+                                           pool_maxsize=pool_maxsize,
+                                           http2=http2)
+        self._http_executor.request_wrapper = WebDriverRequestWrapper(self._web_element_cls)
+        self._response_wrapper = WebDriverResponseWrapper(self)
+        self.error_handler = ErrorHandler()
+        self._switch_to = SwitchTo(self)
+        self._mobile = Mobile(self)
+
+    @classmethod
+    async def create(cls, *args, **kwargs):
+        """Creates the driver, starts required services and opens a new session.
+
+        This is the supported way of obtaining a ready to use driver, since
+        ``__init__`` cannot await the session handshake."""
+        driver = cls(*args, **kwargs)
+        if cls._start_service_is_async:
+            await driver.start_service()
+        else:
+            driver.start_service()
+        if cls._start_client_is_async:
+            await driver.start_client()
+        else:
+            driver.start_client()
+        await driver.start_session()
+        return driver
+
+    def start_service(self):
+        """Called before starting a new session. Subclasses that manage a local
+        driver service override this."""
+        pass
+
+    def start_client(self):
+        """Called before starting a new session. May be overridden."""
+        pass
+
+    def stop_client(self):
+        """Called after executing a quit command. May be overridden."""
+        pass
+
+    def _set_user_capabilities(self, options, desired_capabilities, browser_profile):
+        # one C-level merge builds the final dict instead of create-then-update
+        capabilities = {**(options.to_capabilities() if options is not None else {}),
+                        **(desired_capabilities or {})}
+        self._browser_profile = browser_profile
+        self.user_capabilities = capabilities
+        self.user_capabilities_w3c = None
+        self._new_session_payload = None
+        if browser_profile is None:
+            # capabilities are final from here on, so the NEW_SESSION payload
+            # can be built now instead of on the session-start critical path;
+            # profiles stay deferred since encoding one zips a directory
+            w3c_caps = self._make_w3c_capabilities(capabilities)["capabilities"]
+            self.user_capabilities_w3c = w3c_caps
+            self._new_session_payload = {"capabilities": w3c_caps,
+                                         "desiredCapabilities": capabilities}
+
+    def _refresh_dialect_commands(self):
+        """Resolves the commands that differ between the W3C and legacy
+        dialects once, so per-call methods don't re-branch on `_w3c`."""
+        w3c = self._w3c
+        self._cmd_execute_script = (Command.W3C_EXECUTE_SCRIPT if w3c
+                                    else Command.EXECUTE_SCRIPT)
+        self._cmd_execute_async_script = (Command.W3C_EXECUTE_SCRIPT_ASYNC if w3c
+                                          else Command.EXECUTE_ASYNC_SCRIPT)
+        self._cmd_window_handle = (Command.W3C_GET_CURRENT_WINDOW_HANDLE if w3c
+                                   else Command.GET_CURRENT_WINDOW_HANDLE)
+        self._cmd_window_handles = (Command.W3C_GET_WINDOW_HANDLES if w3c
+                                    else Command.GET_WINDOW_HANDLES)
+        if w3c:
+            self._maximize_cmd_params = (Command.W3C_MAXIMIZE_WINDOW, None)
+        else:
+            self._maximize_cmd_params = (Command.MAXIMIZE_WINDOW,
+                                         {"windowHandle": "current"})
+        self._window_op = self._window_op_w3c if w3c else self._window_op_legacy
+
+    def _determine_command_codec(self, capabilities):
+        browser_name = capabilities.get("browserName", "")
+        codec = CommandCodec._registry.get(browser_name.strip().lower(), CommandCodec)
+        return codec()
+
+    @property
+    def w3c(self):
+        return self._w3c
+
+    @property
+    def mobile(self):
+        return self._mobile
+
+    @property
+    def switch_to(self):
+        return self._switch_to
+
+    @property
+    def desired_capabilities(self):
+        """Returns the drivers current desired capabilities being used."""
+        return self.server_capabilities
+
+    @async_property
+    async def name(self):
+        """Returns the name of the underlying browser for this instance."""
+        if "browserName" in self.server_capabilities:
+            return self.server_capabilities["browserName"]
+        raise KeyError("browserName not specified in session capabilities")
+
+    async def start_session(self):
+        """Creates a new session with the desired capabilities."""
+        parameters = self._new_session_payload
+        if parameters is None:
+            capabilities = self.user_capabilities
+            profile = self._browser_profile.encoded
+            w3c_caps = self._make_w3c_capabilities(capabilities, profile)["capabilities"]
+            self.user_capabilities_w3c = w3c_caps
+            parameters = {"capabilities": w3c_caps,
+                          "desiredCapabilities": capabilities}
+        response = await self.execute(Command.NEW_SESSION, parameters)
+        if "sessionId" not in response:
+            response = response["value"]
+        self.session_id = response["sessionId"]
+        self.server_capabilities = response.get("value")
+        if self.server_capabilities is None:
+            self.server_capabilities = response.get("capabilities")
+        self._w3c = response.get("status") is None
+        self._refresh_dialect_commands()
+
+    def create_web_element(self, element_id):
+        """Creates a web element with the specified `element_id`."""
+        return self._web_element_cls(self, element_id, w3c=self._w3c)
+
+    async def execute(self, command, params=None):
+        """Sends a command to be executed by a command_codec.
+
+        :Args:
+         - command: The name of the command to execute as a `Command`.
+         - params: A dictionary of named parameters to send with the command.
+
+        :Returns:
+          The command's JSON response loaded into a dictionary object.
+        """
+        command_info = CommandInfo(command, session_id=self.session_id, params=params)
+        response = await self._http_executor.execute(command_info)
+        if response:
+            response["value"] = self._response_wrapper.wrap_web_element(response.get("value", None))
+            return response
+        # If the server doesn't send a response, assume the command was a success
+        return {"success": 0, "value": None, "sessionId": self.session_id}
+
+    async def execute_value(self, command, params=None):
+        """Sends a command and returns only its "value" field.
+
+        Most commands are issued solely for that field; going through this
+        path hands the wrapped value straight back instead of writing it into
+        the response dict only for the caller to read it out again.
+
+        :Args:
+         - command: The name of the command to execute as a `Command`.
+         - params: A dictionary of named parameters to send with the command.
+        """
+        command_info = CommandInfo(command, session_id=self.session_id, params=params)
+        response = await self._http_executor.execute(command_info)
+        if response:
+            return self._response_wrapper.wrap_web_element(response.get("value", None))
+        return None
+
+    async def get(self, url):
+        """Loads a web page in the current browser session."""
+        await self.execute(Command.GET, {"url": url})
+
+    async def title(self):
+        """Returns the title of the current page."""
+        return (await self.execute_value(Command.GET_TITLE)) or ""
+
+    async def current_url(self):
+        """Gets the URL of the current page."""
+        return await self.execute_value(Command.GET_CURRENT_URL)
+
+    async def page_source(self):
+        """Gets the source of the current page."""
+        return await self.execute_value(Command.GET_PAGE_SOURCE)
+
+    async def find_element(self, by=By.ID, value=None):
+        """Finds an element by the given By strategy and locator."""
+        if by == By.ID_OR_NAME:
+            try:
+                return await self.find_element(By.ID, value)
+            except NoSuchElementException:
+                return await self.find_element(By.NAME, value)
+        by, value = By.get_w3caware_by_value(by, value, self._w3c)
+        return await self.execute_value(Command.FIND_ELEMENT, {"using": by, "value": value})
+
+    async def find_elements(self, by=By.ID, value=None):
+        """Finds elements by the given By strategy and locator."""
+        by, value = By.get_w3caware_by_value(by, value, self._w3c)
+        return (await self.execute_value(Command.FIND_ELEMENTS, {"using": by, "value": value})) or []
+
+    async def execute_script(self, script, *args):
+        """Synchronously executes JavaScript in the current window or frame."""
+        # json serializes tuples as arrays, so args needs no list copy
+        return await self.execute_value(self._cmd_execute_script,
+                                        {"script": script, "args": args})
+
+    async def execute_async_script(self, script, *args):
+        """Asynchronously executes JavaScript in the current window or frame."""
+        return await self.execute_value(self._cmd_execute_async_script,
+                                        {"script": script, "args": args})
+
+    async def quit(self):
+        """Quits the driver and closes every associated window."""
+        try:
+            await self.execute(Command.QUIT)
+        finally:
+            if type(self)._stop_client_is_async:
+                await self.stop_client()
+            else:
+                self.stop_client()
+            await self._http_executor.close()
+
+    async def current_window_handle(self):
+        """Returns the handle of the current window."""
+        return await self.execute_value(self._cmd_window_handle)
+
+    async def window_handles(self):
+        """Returns the handles of all windows within the current session."""
+        return await self.execute_value(self._cmd_window_handles)
+
+    async def maximize_window(self):
+        """Maximizes the current window that webdriver is using."""
+        command, params = self._maximize_cmd_params
+        await self.execute(command, params)
+
+    async def get_cookies(self):
+        """Returns a set of dictionaries, corresponding to cookies visible in
+        the current session."""
+        return await self.execute_value(Command.GET_ALL_COOKIES)
+
+    async def get_cookies_dict(self):
+        """Returns the session's cookies as a name -> cookie mapping.
+
+        One round trip regardless of how many cookies the caller then looks
+        up, where repeated `get_cookie` calls cost a request (and, in legacy
+        mode, a linear scan) each."""
+        cookies = await self.get_cookies()
+        return {cookie["name"]: cookie for cookie in cookies}
+
+    async def get_cookie(self, name):
+        """Get a single cookie by name. Returns the cookie if found, None if not."""
+        if self._w3c:
+            try:
+                return await self.execute_value(Command.GET_COOKIE, {"name": name})
+            except NoSuchCookieException:
+                return None
+        else:
+            cookies = await self.get_cookies_dict()
+            return cookies.get(name)
+
+    async def delete_cookie(self, name):
+        """Deletes a single cookie with the given name."""
+        await self.execute(Command.DELETE_COOKIE, {"name": name})
+
+    async def delete_all_cookies(self):
+        """Delete all cookies in the scope of the session."""
+        await self.execute(Command.DELETE_ALL_COOKIES)
+
+    async def add_cookie(self, cookie_dict):
+        """Adds a cookie to your current session."""
+        await self.execute(Command.ADD_COOKIE, {"cookie": cookie_dict})
+
+    async def implicitly_wait(self, time_to_wait):
+        """Sets a sticky timeout to implicitly wait for an element to be found."""
+        if self._w3c:
+            await self.execute(Command.SET_TIMEOUTS, {"implicit": int(float(time_to_wait) * 1000)})
+        else:
+            await self.execute(Command.IMPLICIT_WAIT, {"ms": float(time_to_wait) * 1000})
+
+    async def set_script_timeout(self, time_to_wait):
+        """Sets the amount of time that the script should wait during an
+        execute_async_script call before throwing an error."""
+        if self._w3c:
+            await self.execute(Command.SET_TIMEOUTS, {"script": int(float(time_to_wait) * 1000)})
+        else:
+            await self.execute(Command.SET_SCRIPT_TIMEOUT, {"ms": float(time_to_wait) * 1000})
+
+    async def set_page_load_timeout(self, time_to_wait):
+        """Sets the amount of time to wait for a page load to complete before
+        throwing an error."""
+        await self.execute(Command.SET_TIMEOUTS, {"pageLoad": int(float(time_to_wait) * 1000)})
+
+    async def timeouts(self):
+        """Gets all the timeouts that have been set on the current session."""
+        timeouts = await self.execute_value(Command.GET_TIMEOUTS)
+        return Timeouts(implicit_wait=timeouts.get("implicit", 0) / 1000,
+                        page_load=timeouts.get("pageLoad", 0) / 1000,
+                        script=timeouts.get("script", 0) / 1000)
+
+    async def set_timeouts(self, timeouts):
+        """Sets the given `Timeouts` on the current session."""
+        await self.execute(Command.SET_TIMEOUTS, timeouts.to_json())
+
+    async def get_screenshot_as_base64(self):
+        """Gets the screenshot of the current window as a base64 encoded string."""
+        return await self.execute_value(Command.SCREENSHOT)
+
+    async def get_screenshot_as_png(self):
+        """Gets the screenshot of the current window as a binary data."""
+        # b64decode accepts str directly, so no intermediate ascii bytes copy
+        return base64.b64decode(await self.get_screenshot_as_base64())
+
+    async def get_screenshot_as_file(self, filename):
+        """Saves a screenshot of the current window to a PNG image file.
+
+        Returns False if there is any IOError, else returns True."""
+        if not str(filename).lower().endswith(".png"):
+            warnings.warn(
+                "name used for saved screenshot does not match file type. "
+                "It should end with a `.png` extension", UserWarning)
+        png_file = await self.get_screenshot_as_png()
+        try:
+            async with aiofiles.open(filename, mode="wb") as fd:
+                await fd.write(png_file)
+        except OSError:
+            return False
+        return True
+
+    async def save_screenshot(self, filename):
+        return await self.get_screenshot_as_file(filename)
+
+    async def _window_op_w3c(self, windowHandle, set_params, legacy_command):
+        """W3C dispatch for the window size/position calls: routes through
+        the rect commands, warning on non-current handles. `set_params` is
+        None for reads. `_refresh_dialect_commands` binds this (or the
+        legacy variant) to `_window_op`, so the public methods carry no
+        per-call dialect branch."""
+        if windowHandle != "current":
+            warnings.warn("Only 'current' window is supported for W3C compatible browsers.")
+        if set_params is None:
+            return await self.get_window_rect()
+        return await self.set_window_rect(**set_params)
+
+    async def _window_op_legacy(self, windowHandle, set_params, legacy_command):
+        """Legacy dispatch for the window size/position calls: sends
+        `legacy_command` with the handle attached."""
+        params = dict(set_params) if set_params else {}
+        params["windowHandle"] = windowHandle
+        return await self.execute_value(legacy_command, params)
+
+    async def set_window_size(self, width, height, windowHandle="current"):
+        """Sets the width and height of the current window."""
+        await self._window_op(windowHandle,
+                              {"width": int(width), "height": int(height)},
+                              Command.SET_WINDOW_SIZE)
+
+    async def get_window_size(self, windowHandle="current"):
+        """Gets the width and height of the current window."""
+        size = await self._window_op(windowHandle, None, Command.GET_WINDOW_SIZE)
+        if size.get("value", None):
+            size = size["value"]
+        return {k: size[k] for k in ("width", "height")}
+
+    async def set_window_position(self, x, y, windowHandle="current"):
+        """Sets the x,y position of the current window."""
+        return await self._window_op(windowHandle, {"x": int(x), "y": int(y)},
+                                     Command.SET_WINDOW_POSITION)
+
+    async def get_window_position(self, windowHandle="current"):
+        """Gets the x,y position of the current window."""
+        position = await self._window_op(windowHandle, None, Command.GET_WINDOW_POSITION)
+        return {k: position[k] for k in ("x", "y")}
+
+    async def get_window_rect(self):
+        """Gets the x, y coordinates of the window as well as height and width of
+        the current window."""
+        return await self.execute_value(Command.GET_WINDOW_RECT)
+
+    async def set_window_rect(self, x=None, y=None, width=None, height=None):
+        """Sets the x, y coordinates of the window as well as height and width of
+        the current window."""
+        if (x is None and y is None) and (height is None and width is None):
+            raise InvalidArgumentException("x and y or height and width need values")
+        return await self.execute_value(Command.SET_WINDOW_RECT,
+                                        {"x": x, "y": y, "width": width, "height": height})
+
+    @async_property
+    async def orientation(self):
+        """Gets the current orientation of the device."""
+        return await self.execute_value(Command.GET_SCREEN_ORIENTATION)
+
+    async def set_orientation(self, value):
+        """Sets the current orientation of the device."""
+        if value.upper() in _ALLOWED_ORIENTATIONS:
+            await self.execute(Command.SET_SCREEN_ORIENTATION, {"orientation": value})
+        else:
+            raise WebDriverException("You can only set the orientation to 'LANDSCAPE' and 'PORTRAIT'")
+
+    @async_property
+    async def log_types(self):
+        """Gets a list of the available log types."""
+        return await self.execute_value(Command.GET_AVAILABLE_LOG_TYPES)
+
+    async def get_log(self, log_type):
+        """Gets the log for a given log type."""
+        return await self.execute_value(Command.GET_LOG, {"type": log_type})
+
+
+def _make_command_method(command, doc):
+    """Builds a parameterless command wrapper bound to `command`."""
+    async def method(self):
+        await self.execute(command)
+    method.__doc__ = doc
+    return method
+
+
+# the navigation/window one-liners differ only in the Command they name, so
+# they are generated from a table instead of hand-written six times over
+for _name, _command, _doc in (
+        ("back", Command.GO_BACK, "Goes one step backward in the browser history."),
+        ("forward", Command.GO_FORWARD, "Goes one step forward in the browser history."),
+        ("refresh", Command.REFRESH, "Refreshes the current page."),
+        ("close", Command.CLOSE, "Closes the current window."),
+        ("fullscreen_window", Command.FULLSCREEN_WINDOW,
+         "Invokes the window manager-specific 'full screen' operation."),
+        ("minimize_window", Command.MINIMIZE_WINDOW,
+         "Invokes the window manager-specific 'minimize' operation.")):
+    _method = _make_command_method(_command, _doc)
+    _method.__name__ = _name
+    _method.__qualname__ = f"RemoteWebDriver.{_name}"
+    setattr(RemoteWebDriver, _name, _method)
+del _name, _command, _doc, _method
@@ -0,0 +1,324 @@
+"""The WebElement implementation."""
+
+import base64
+import contextvars
+import os
+import warnings
+import zipfile
+from io import BytesIO as IOStream
+from math import floor
+
+import aiofiles
+from async_property import async_property
+
+from seleniumx.common.exceptions import WebDriverException
+from seleniumx.webdriver.common.by import By
+from seleniumx.webdriver.common.utils import keys_to_typing
+from seleniumx.webdriver.remote.command import Command
+
+
+#: reads the requested properties off every element in one script call
+_BATCH_QUERY_SCRIPT = (
+    "var props = arguments[1];"
+    "return arguments[0].map(function(el) {"
+    " var out = {};"
+    " for (var i = 0; i < props.length; i++) { out[props[i]] = el[props[i]]; }"
+    " return out; });")
+
+#: approximates is_displayed for every element in one script call
+_BATCH_DISPLAYED_SCRIPT = (
+    "return arguments[0].map(function(el) {"
+    " var style = window.getComputedStyle(el);"
+    " return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)"
+    "  && style.visibility !== 'hidden' && style.display !== 'none'; });")
+
+
+async def batch_query(driver, elements,
+                      props=("tagName", "textContent", "offsetWidth",
+                             "offsetHeight", "offsetLeft", "offsetTop")):
+    """Reads the given DOM properties from every element in one script call.
+
+    A loop of per-element accessors costs one round trip each; this issues a
+    single EXECUTE_SCRIPT and returns a list of {prop: value} dicts in input
+    order. Values are raw DOM properties, so e.g. `textContent` differs from
+    the rendered text that `WebElement.text` returns."""
+    return await driver.execute_script(_BATCH_QUERY_SCRIPT, list(elements), list(props))
+
+
+async def batch_get_displayed(driver, elements):
+    """Returns a visibility flag for every element in one script call.
+
+    A scripted approximation of `is_displayed` (layout box present and not
+    hidden via CSS); for the rare cases that need the remote end's exact
+    displayedness algorithm, fall back to per-element `is_displayed`."""
+    return await driver.execute_script(_BATCH_DISPLAYED_SCRIPT, list(elements))
+
+
+class WebElement(object):
+    """Represents a DOM element.
+
+    Generally, all interesting operations that interact with a document will be
+    performed through this interface.
+
+    All method calls will do a freshness check to ensure that the element
+    reference is still valid."""
+
+    def __init__(self, parent, id_, w3c=False):
+        self._parent = parent
+        self._id = id_
+        self._w3c = w3c
+
+    def __repr__(self):
+        return f'<{type(self).__module__}.{type(self).__name__} (session="{self._parent.session_id}", element="{self._id}")>'
+
+    @property
+    def parent(self):
+        """Internal reference to the WebDriver instance this element was found from."""
+        return self._parent
+
+    @property
+    def id(self):
+        """Internal ID used by selenium.
+
+        This is mainly for internal use. Simple use cases such as checking if 2
+        webelements refer to the same element, can be done using ``==``."""
+        return self._id
+
+    @async_property
+    async def tag_name(self):
+        """This element's ``tagName`` property."""
+        response = await self._execute(Command.GET_ELEMENT_TAG_NAME)
+        return response["value"]
+
+    @async_property
+    async def text(self):
+        """The text of the element."""
+        response = await self._execute(Command.GET_ELEMENT_TEXT)
+        return response["value"]
+
+    async def click(self):
+        """Clicks the element."""
+        await self._execute(Command.CLICK_ELEMENT)
+
+    async def submit(self):
+        """Submits a form."""
+        if self._w3c:
+            form = await self.find_element(By.XPATH, "./ancestor-or-self::form")
+            await self._parent.execute_script(
+                "var e = arguments[0].ownerDocument.createEvent('Event');"
+                "e.initEvent('submit', true, true);"
+                "if (arguments[0].dispatchEvent(e)) { arguments[0].submit() }", form)
+        else:
+            await self._execute(Command.SUBMIT_ELEMENT)
+
+    async def clear(self):
+        """Clears the text if it's a text entry element."""
+        await self._execute(Command.CLEAR_ELEMENT)
+
+    async def get_property(self, name):
+        """Gets the given property of the element."""
+        try:
+            response = await self._execute(Command.GET_ELEMENT_PROPERTY, {"name": name})
+            return response["value"]
+        except WebDriverException:
+            # if we hit an end point that doesn't understand getElementProperty
+            # lets fake it
+            return await self._parent.execute_script("return arguments[0][arguments[1]]", self, name)
+
+    async def get_attribute(self, name):
+        """Gets the given attribute or property of the element."""
+        response = await self._execute(Command.GET_ELEMENT_ATTRIBUTE, {"name": name})
+        attribute_value = response["value"]
+        if attribute_value is not None:
+            if name != "value" and attribute_value.lower() in ("true", "false"):
+                attribute_value = attribute_value.lower()
+        return attribute_value
+
+    async def is_selected(self):
+        """Returns whether the element is selected.
+
+        Can be used to check if a checkbox or radio button is selected."""
+        response = await self._execute(Command.IS_ELEMENT_SELECTED)
+        return response["value"]
+
+    async def is_enabled(self):
+        """Returns whether the element is enabled."""
+        response = await self._execute(Command.IS_ELEMENT_ENABLED)
+        return response["value"]
+
+    async def is_displayed(self):
+        """Whether the element is visible to a user."""
+        response = await self._execute(Command.IS_ELEMENT_DISPLAYED)
+        return response["value"]
+
+    async def send_keys(self, *value):
+        """Simulates typing into the element."""
+        # transfer file to another machine only if remote driver is used
+        # the same behaviour as for java binding
+        if self._parent._is_remote:
+            local_file = self._parent.file_detector.is_local_file(*value)
+            if local_file is not None:
+                value = await self._upload(local_file)
+        typing = keys_to_typing(value)
+        await self._execute(Command.SEND_KEYS_TO_ELEMENT,
+                            {"text": "".join(typing), "value": typing})
+
+    async def _get_rect(self):
+        """Fetches the element's rect (x, y, width and height) in a single
+        round trip; size/location/rect all slice their answer from it."""
+        response = await self._execute(Command.GET_ELEMENT_RECT)
+        return response["value"]
+
+    @async_property
+    async def size(self):
+        """The size of the element."""
+        if self._w3c:
+            size = await self._get_rect()
+        else:
+            response = await self._execute(Command.GET_ELEMENT_SIZE)
+            size = response["value"]
+        return {"height": size["height"], "width": size["width"]}
+
+    @async_property
+    async def location(self):
+        """The location of the element in the renderable canvas."""
+        if self._w3c:
+            old_loc = await self._get_rect()
+        else:
+            response = await self._execute(Command.GET_ELEMENT_LOCATION)
+            old_loc = response["value"]
+        # floor(x + 0.5) is one C call; round() goes through generic
+        # __round__ dispatch per coordinate
+        return {"x": floor(old_loc["x"] + 0.5), "y": floor(old_loc["y"] + 0.5)}
+
+    @async_property
+    async def location_once_scrolled_into_view(self):
+        """THIS PROPERTY MAY CHANGE WITHOUT WARNING. Use this to discover where
+        on the screen an element is so that we can click it."""
+        if self._w3c:
+            response = await self._execute(
+                Command.W3C_EXECUTE_SCRIPT,
+                {"script": "arguments[0].scrollIntoView(true); return arguments[0].getBoundingClientRect()",
+                 "args": [self]})
+            old_loc = response["value"]
+            return {"x": floor(old_loc["x"] + 0.5), "y": floor(old_loc["y"] + 0.5)}
+        else:
+            response = await self._execute(Command.GET_ELEMENT_LOCATION_ONCE_SCROLLED_INTO_VIEW)
+            return response["value"]
+
+    @async_property
+    async def rect(self):
+        """A dictionary with the size and location of the element."""
+        # one GET_ELEMENT_RECT; the old W3C branch awaited self.size (a
+        # second round trip) and then tried to .copy() the coroutine result
+        return await self._get_rect()
+
+    async def value_of_css_property(self, property_name):
+        """The value of a CSS property."""
+        response = await self._execute(
+            Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY, {"propertyName": property_name})
+        return response["value"]
+
+    async def get_screenshot_as_base64(self):
+        """Gets the screenshot of the current element as a base64 encoded string."""
+        response = await self._execute(Command.ELEMENT_SCREENSHOT)
+        return response["value"]
+
+    async def get_screenshot_as_png(self):
+        """Gets the screenshot of the current element as binary data."""
+        # b64decode accepts str directly, so no intermediate ascii bytes copy
+        return base64.b64decode(await self.get_screenshot_as_base64())
+
+    async def get_screenshot_as_file(self, filename):
+        """Saves a screenshot of the current element to a PNG image file.
+
+        Returns False if there is any IOError, else returns True."""
+        if not filename.lower().endswith(".png"):
+            warnings.warn(
+                "name used for saved screenshot does not match file type. "
+                "It should end with a `.png` extension", UserWarning)
+        try:
+            async with aiofiles.open(filename, mode="wb") as fd:
+                await fd.write(await self.get_screenshot_as_png())
+        except OSError:
+            return False
+        return True
+
+    async def save_screenshot(self, filename):
+        return await self.get_screenshot_as_file(filename)
+
+    async def find_element(self, by=By.ID, value=None):
+        """Find an element given a By strategy and locator, relative to this element."""
+        by, value = By.get_w3caware_by_value(by, value, self._w3c)
+        response = await self._execute(Command.FIND_CHILD_ELEMENT, {"using": by, "value": value})
+        return response["value"]
+
+    async def find_elements(self, by=By.ID, value=None):
+        """Find elements given a By strategy and locator, relative to this element."""
+        by, value = By.get_w3caware_by_value(by, value, self._w3c)
+        response = await self._execute(Command.FIND_CHILD_ELEMENTS, {"using": by, "value": value})
+        return response["value"]
+
+    async def _execute(self, command, params=None):
+        """Executes a command against the underlying HTML element."""
+        if not params:
+            params = {}
+        params["id"] = self._id
+        return await self._parent.execute(command, params)
+
+    #: extensions whose contents are already compressed; deflating them again
+    #: burns O(filesize) CPU for no size win
+    _PRECOMPRESSED_EXTENSIONS = frozenset(
+        (".png", ".gif", ".jpg", ".jpeg", ".webp", ".zip", ".gz", ".bz2",
+         ".xz", ".7z", ".mp3", ".mp4", ".avi", ".mkv", ".pdf"))
+
+    #: per-task scratch buffer for zipping uploads; each asyncio task sees
+    #: its own, so concurrent uploads never share one
+    _upload_buffer = contextvars.ContextVar("upload_buffer")
+
+    async def _upload(self, filename):
+        fp = self._upload_buffer.get(None)
+        if fp is None:
+            fp = IOStream()
+            self._upload_buffer.set(fp)
+        else:
+            # rewind and reuse the grown buffer instead of re-allocating
+            fp.seek(0)
+            fp.truncate()
+        ext = os.path.splitext(filename)[1].lower()
+        compression = (zipfile.ZIP_STORED if ext in self._PRECOMPRESSED_EXTENSIONS
+                       else zipfile.ZIP_DEFLATED)
+        with zipfile.ZipFile(fp, "w", compression) as zipped:
+            zipped.write(filename, os.path.split(filename)[1])
+        # b64encode over the line-folding encodebytes: no newlines every 76
+        # chars for the server to strip, and a single C pass over the zip
+        content = base64.b64encode(fp.getvalue()).decode("ascii")
+        try:
+            response = await self._execute(Command.UPLOAD_FILE, {"file": content})
+            return response["value"]
+        except WebDriverException as ex:
+            if "Unrecognized command: POST" in str(ex):
+                return filename
+            elif "Command not found: POST" in str(ex):
+                return filename
+            elif '{"status":405,"value":["GET","HEAD","DELETE"]}' in str(ex):
+                return filename
+            else:
+                raise
+
+    def __eq__(self, element):
+        # real elements compare on _id with no attribute probing — the case
+        # dict/set containment hits; wrappers that expose an underlying id
+        # (e.g. EventFiringWebElement) take the duck-typed path
+        if isinstance(element, WebElement):
+            return self._id == element._id
+        other_id = getattr(element, "id", None)
+        return other_id is not None and self._id == other_id
+
+    def __ne__(self, element):
+        return not self.__eq__(element)
+
+    def __hash__(self):
+        # equality is string equality on _id, so the str hash is all a dict
+        # or set needs — no digest, hex decode or bignum parse per lookup
+        return hash(self._id)
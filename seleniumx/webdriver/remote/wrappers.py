@@ -0,0 +1,128 @@
+"""Wrappers that translate WebElement references between the wire protocol
+representation and `WebElement` instances."""
+
+import json
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from seleniumx.webdriver.remote.errorhandler import ErrorCode
+
+
+class WebDriverRequestWrapper(object):
+    """Converts `WebElement` instances found in outgoing command parameters
+    into the wire protocol element dicts."""
+
+    ELEMENT1 = "ELEMENT"
+    ELEMENT2 = "element-6066-11e4-a52e-4f735466cecf"
+
+    __slots__ = ("_web_element_cls",)
+
+    def __init__(self, web_element_cls):
+        self._web_element_cls = web_element_cls
+
+    def unwrap_web_element(self, value):
+        """Recursively walks `value` replacing any `WebElement` with its wire
+        representation."""
+        # empty params and scalar values (the bulk of GET-style commands)
+        # need no conversion at all
+        if not value:
+            return value
+        value_type = type(value)
+        if value_type is dict:
+            # skip recursion when every value is a scalar — no element can
+            # hide below
+            if not any(type(v) in (dict, list, tuple) or isinstance(v, self._web_element_cls)
+                       for v in value.values()):
+                return value
+            return {k: self.unwrap_web_element(v) for k, v in value.items()}
+        if value_type is list or value_type is tuple:
+            return [self.unwrap_web_element(item) for item in value]
+        if isinstance(value, self._web_element_cls):
+            element_id = value.id
+            return {self.ELEMENT1: element_id, self.ELEMENT2: element_id}
+        return value
+
+
+class WebDriverResponseWrapper(object):
+    """Converts wire protocol element dicts in responses into `WebElement`
+    instances bound to the owning driver."""
+
+    ELEMENT1 = "ELEMENT"
+    ELEMENT2 = "element-6066-11e4-a52e-4f735466cecf"
+
+    __slots__ = ("_driver",)
+
+    def __init__(self, driver):
+        self._driver = driver
+
+    def wrap_web_element(self, value):
+        """Recursively walks `value` replacing any wire protocol element dict
+        with a `WebElement`."""
+        # Most responses (titles, urls, booleans, ...) are scalars; bail out
+        # before any container handling. Wire responses are plain json types,
+        # so exact type checks are safe and cheaper than isinstance here.
+        value_type = type(value)
+        if value_type is not dict and value_type is not list:
+            return value
+        if value_type is dict:
+            if self.ELEMENT1 in value or self.ELEMENT2 in value:
+                wrapped_id = value.get(self.ELEMENT1, None)
+                if wrapped_id:
+                    return self._driver.create_web_element(value[self.ELEMENT1])
+                else:
+                    return self._driver.create_web_element(value[self.ELEMENT2])
+            # a dict holding only scalars (rects, timeouts, cookies) cannot
+            # contain an element reference anywhere below it
+            if not any(type(v) is dict or type(v) is list for v in value.values()):
+                return value
+            return {k: self.wrap_web_element(v) for k, v in value.items()}
+        # FIND_ELEMENTS returns a homogeneous list of flat element dicts,
+        # sometimes hundreds long; build the elements in one comprehension
+        # instead of a generic recursive walk per item
+        if value and type(value[0]) is dict and (
+                self.ELEMENT1 in value[0] or self.ELEMENT2 in value[0]):
+            create = self._driver.create_web_element
+            element1, element2 = self.ELEMENT1, self.ELEMENT2
+            try:
+                return [create(item.get(element1) or item[element2]) for item in value]
+            except (KeyError, TypeError, AttributeError):
+                # mixed payload after all — fall through to the general walk
+                pass
+        return [self.wrap_web_element(item) for item in value]
+
+    @staticmethod
+    def create_response(response):
+        """Shapes the raw HTTP response into the canonical
+        ``{'status': ..., 'value': ...}`` dictionary."""
+        status_code = response.status_code
+        response_bytes = response.content
+        encoding = response.encoding or "utf-8"
+        response_data = None
+        is_json = False
+        try:
+            # loads accepts utf-8 bytes directly, so the common case skips
+            # the intermediate str for large payloads (screenshots, sources)
+            response_data = _json_loads(response_bytes)
+            is_json = True
+        except Exception:
+            try:
+                response_data = json.loads(response_bytes.decode(encoding, errors="replace"))
+                is_json = True
+            except Exception:
+                pass
+        if 399 < status_code <= 500:
+            return {"status": status_code, "value": response_data}
+        if is_json and isinstance(response_data, dict):
+            if "value" not in response_data:
+                response_data = {"status": response_data.get("status", ErrorCode.SUCCESS),
+                                 "value": response_data}
+            if "status" not in response_data:
+                response_data["status"] = ErrorCode.SUCCESS
+            return response_data
+        if response_data is None:
+            response_data = response_bytes.decode(encoding, errors="replace")
+        return {"status": ErrorCode.SUCCESS, "value": response_data}
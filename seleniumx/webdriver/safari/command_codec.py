@@ -0,0 +1,15 @@
+"""Safari (safaridriver) specific command end points."""
+
+from seleniumx.webdriver.remote.command import Command
+from seleniumx.webdriver.remote.command_codec import CommandCodec, HttpMethod
+
+
+class SafariCommandCodec(CommandCodec):
+
+    browser_name = "safari"
+
+    def _init_command_specs(self):
+        super()._init_command_specs()
+        self.add_command(Command.GET_PERMISSIONS, HttpMethod.GET, "/session/{sessionId}/apple/permissions")
+        self.add_command(Command.SET_PERMISSIONS, HttpMethod.POST, "/session/{sessionId}/apple/permissions")
+        self.add_command(Command.ATTACH_DEBUGGER, HttpMethod.POST, "/session/{sessionId}/apple/attach_debugger")
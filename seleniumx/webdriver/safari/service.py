@@ -0,0 +1,31 @@
+from seleniumx.common.exceptions import WebDriverException
+from seleniumx.webdriver.common import service, utils
+
+
+class SafariService(service.Service):
+    """Object that manages the starting and stopping of the SafariDriver."""
+
+    def __init__(self, executable_path, port=0, quiet=False, service_args=None):
+        """Creates a new instance of the SafariDriver service.
+
+        :Args:
+         - executable_path : Path to the SafariDriver
+         - port : Port the service is running on
+         - quiet : Suppress driver stdout and stderr
+         - service_args : List of args to pass to the safaridriver service
+        """
+        if not utils.Platform.is_mac():
+            raise WebDriverException("SafariDriver is only supported on MacOS")
+        self.service_args = service_args or []
+        self.quiet = quiet
+        log = None
+        if quiet:
+            import os
+            log = open(os.devnull, "w")
+        super().__init__(executable_path, port=port, log_file=log)
+
+    def command_line_args(self):
+        return ["-p", str(self.port)] + self.service_args
+
+    async def send_remote_shutdown_command(self):
+        pass
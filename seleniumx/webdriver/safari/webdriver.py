@@ -0,0 +1,80 @@
+"""The Safari WebDriver implementation."""
+
+import asyncio
+
+from seleniumx.common.exceptions import WebDriverException
+from seleniumx.webdriver.common.desired_capabilities import DesiredCapabilities
+from seleniumx.webdriver.remote.command import Command
+from seleniumx.webdriver.remote.webdriver import RemoteWebDriver
+from seleniumx.webdriver.safari.service import SafariService
+
+
+class SafariDriver(RemoteWebDriver):
+    """Controls the SafariDriver and allows you to drive the browser."""
+
+    def __init__(self, port=0, executable_path="/usr/bin/safaridriver",
+                 reuse_service=False, desired_capabilities=None, quiet=False,
+                 keep_alive=True, service_args=None):
+        """Creates a new Safari driver instance and launches or reuses a
+        local safaridriver service.
+
+        :Args:
+         - port - The port on which the safaridriver service should listen for new connections. If zero, a free port will be found.
+         - executable_path - Path to a custom safaridriver executable to be used. If absent, /usr/bin/safaridriver is used.
+         - reuse_service - If True, do not spawn a safaridriver instance; instead, connect to an already-running service that was launched externally.
+         - desired_capabilities: Dictionary object with desired capabilities (Can be used to provide various Safari switches).
+         - quiet - If True, the driver's stdout and stderr is suppressed.
+         - keep_alive - Whether to configure SafariRemoteConnection to use HTTP keep_alive. Defaults to True.
+         - service_args : List of args to pass to the safaridriver service
+        """
+        self._reuse_service = reuse_service
+        self.service = SafariService(
+            executable_path, port=port, quiet=quiet, service_args=service_args)
+        if desired_capabilities is None:
+            desired_capabilities = DesiredCapabilities.SAFARI.copy()
+        super().__init__(server_url=self.service.service_url,
+                         desired_capabilities=desired_capabilities,
+                         keep_alive=keep_alive)
+        self._is_remote = False
+
+    async def start_service(self):
+        if not self._reuse_service:
+            await self.service.start()
+
+    async def quit(self):
+        """Closes the browser and shuts down the SafariDriver executable that
+        was started when starting the SafariDriver."""
+        await super().quit()
+        if not self._reuse_service:
+            await self.service.stop()
+
+    # safaridriver extension commands. The canonical command support matrix is at
+    # https://developer.apple.com/documentation/webkit/macos_webdriver_commands_for_safari_12_and_later
+
+    async def set_permission(self, permission, value):
+        if not isinstance(value, bool):
+            raise WebDriverException("Value of a session permission must be set to True or False.")
+        payload = {}
+        payload[permission] = value
+        await self.execute(Command.SET_PERMISSIONS, {"permissions": payload})
+
+    async def get_permissions(self, permissions):
+        """Returns the requested permissions as a name -> bool mapping.
+
+        One GET_PERMISSIONS round trip serves any number of names; unknown
+        or non-boolean entries come back as None."""
+        response = await self.execute(Command.GET_PERMISSIONS)
+        current = response["value"]["permissions"] or {}
+        return {name: (current[name]
+                       if isinstance(current.get(name), bool) else None)
+                for name in permissions}
+
+    async def get_permission(self, permission):
+        permissions = await self.get_permissions((permission,))
+        return permissions[permission]
+
+    async def debug(self):
+        # the attach and the debugger statement are independent on the
+        # server, so issue them in parallel rather than back to back
+        await asyncio.gather(self.execute(Command.ATTACH_DEBUGGER),
+                             self.execute_script("debugger;"))
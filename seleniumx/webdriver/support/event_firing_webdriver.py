@@ -0,0 +1,365 @@
+"""Wrappers that fire listener events around WebDriver and WebElement calls."""
+
+from asyncio import iscoroutinefunction as _iscoro
+from functools import lru_cache
+
+from seleniumx.common.exceptions import WebDriverException
+from seleniumx.webdriver.common.by import By
+from seleniumx.webdriver.remote.webdriver import RemoteWebDriver
+from seleniumx.webdriver.remote.webelement import WebElement
+from seleniumx.webdriver.support.abstract_event_listener import AbstractEventListener
+
+
+@lru_cache(maxsize=None)
+def _type_has_attr(owner_type, name):
+    """Memoized class-level attribute probe for the __setattr__ hot path.
+
+    Covers everything defined on the type; attributes that only exist on a
+    particular instance still fall back to a live hasattr check."""
+    return hasattr(owner_type, name)
+
+
+#: listener hooks that only fire through a wrapped element; when none of
+#: them is overridden, wrapping returned elements buys nothing
+_ELEMENT_HOOK_NAMES = (
+    "before_click", "after_click", "before_change_value_of",
+    "after_change_value_of", "before_find", "after_find", "on_exception")
+
+
+def _wrap_elements(result, ef_driver):
+    # most dispatched calls return None, a bool or a string (titles, urls,
+    # is_displayed, ...); bail out on those exact types before paying for
+    # the isinstance checks below
+    t = type(result)
+    if result is None or t is bool or t is str or t is int:
+        return result
+    if not ef_driver._has_element_hooks:
+        return result
+    if isinstance(result, WebElement):
+        return EventFiringWebElement(result, ef_driver)
+    if t is list or isinstance(result, (list, tuple)):
+        return [_wrap_elements(item, ef_driver) for item in result]
+    return result
+
+
+#: hook names defined on the abstract listener, resolved once at import
+_HOOK_NAMES = tuple(
+    name for name in vars(AbstractEventListener)
+    if name.startswith(("before_", "after_", "on_")))
+
+
+class _Dispatcher(object):
+    """Runs the before/after listener hooks around the actual driver call."""
+
+    __slots__ = ("_listener", "_ef_driver", "_driver", "_is_coro",
+                 "_on_exception", "_on_exception_coro")
+
+    def __init__(self, listener, ef_driver):
+        self._listener = listener
+        self._ef_driver = ef_driver
+        self._driver = ef_driver.wrapped_driver
+        # a listener method is either a coroutine function or it isn't, for
+        # the lifetime of the listener; classify every hook here so dispatch
+        # does a dict lookup instead of reflection per call
+        self._is_coro = {
+            name: _iscoro(getattr(listener, name))
+            for name in _HOOK_NAMES}
+        self._on_exception = listener.on_exception
+        self._on_exception_coro = self._is_coro["on_exception"]
+
+    async def dispatch(self, before_func, after_func, listener_args, main_func, main_func_args):
+        # callers pass ready-made tuples, so no argument normalization here;
+        # hooks are plain functions in the common case; calling them inline
+        # avoids spinning up a coroutine frame per hook, and the driver
+        # method is always a coroutine so it is awaited directly.
+        # self._is_coro is hoisted to a local: three LOAD_FASTs beat three
+        # slot lookups on the critical path of every user action
+        is_coro = self._is_coro
+        if is_coro[before_func.__name__]:
+            await before_func(*listener_args)
+        else:
+            before_func(*listener_args)
+        try:
+            result = await main_func(*main_func_args)
+        except Exception as ex:
+            if self._on_exception_coro:
+                await self._on_exception(ex, self._driver)
+            else:
+                self._on_exception(ex, self._driver)
+            raise
+        if is_coro[after_func.__name__]:
+            await after_func(*listener_args)
+        else:
+            after_func(*listener_args)
+        return _wrap_elements(result, self._ef_driver)
+
+
+class EventFiringWebDriver(object):
+    """A wrapper around an arbitrary WebDriver instance which supports firing
+    events."""
+
+    __slots__ = ("_driver", "_listener", "_dispatcher", "_attr_cache",
+                 "_has_element_hooks", "_before_click", "_after_click",
+                 "_before_change", "_after_change", "_before_find",
+                 "_after_find")
+
+    def __init__(self, driver, event_listener):
+        """Creates a new instance of the EventFiringWebDriver.
+
+        :Args:
+         - driver : A WebDriver instance
+         - event_listener : Instance of a class that subclasses AbstractEventListener and implements it fully or partially
+
+        Example:
+
+        .. code-block:: python
+
+            from seleniumx.webdriver.support.events import EventFiringWebDriver, AbstractEventListener
+
+            class MyListener(AbstractEventListener):
+                def before_navigate_to(self, url, driver):
+                    print("Before navigate to %s" % url)
+                def after_navigate_to(self, url, driver):
+                    print("After navigate to %s" % url)
+
+            driver = Firefox()
+            ef_driver = EventFiringWebDriver(driver, MyListener())
+            await ef_driver.get("http://www.google.co.in/")
+        """
+        if not isinstance(driver, RemoteWebDriver):
+            raise WebDriverException("A WebDriver instance must be supplied")
+        if not isinstance(event_listener, AbstractEventListener):
+            raise WebDriverException("Event listener must be a subclass of AbstractEventListener")
+        self._driver = driver
+        self._listener = event_listener
+        self._dispatcher = _Dispatcher(event_listener, self)
+        self._attr_cache = {}
+        # wrapping returned elements only matters if the listener reacts to
+        # element-level events; a listener that leaves them all as the
+        # abstract no-ops gets raw WebElements back with zero overhead
+        listener_type = type(event_listener)
+        self._has_element_hooks = any(
+            getattr(listener_type, hook, None) is not getattr(AbstractEventListener, hook)
+            for hook in _ELEMENT_HOOK_NAMES)
+        # bind the element-level hooks once; every wrapped element reuses
+        # these instead of re-creating a bound method per dispatched call
+        self._before_click = event_listener.before_click
+        self._after_click = event_listener.after_click
+        self._before_change = event_listener.before_change_value_of
+        self._after_change = event_listener.after_change_value_of
+        self._before_find = event_listener.before_find
+        self._after_find = event_listener.after_find
+
+    @property
+    def wrapped_driver(self):
+        """Returns the WebDriver instance wrapped by this EventFiringWebDriver."""
+        return self._driver
+
+    async def get(self, url):
+        await self._dispatcher.dispatch(
+            self._listener.before_navigate_to, self._listener.after_navigate_to,
+            (url, self._driver), self._driver.get, (url,))
+
+    async def back(self):
+        await self._dispatcher.dispatch(
+            self._listener.before_navigate_back, self._listener.after_navigate_back,
+            (self._driver,), self._driver.back, ())
+
+    async def forward(self):
+        await self._dispatcher.dispatch(
+            self._listener.before_navigate_forward, self._listener.after_navigate_forward,
+            (self._driver,), self._driver.forward, ())
+
+    async def execute_script(self, script, *args):
+        unwrapped_args = (script,) + self._unwrap_element_args(args)
+        return await self._dispatcher.dispatch(
+            self._listener.before_execute_script, self._listener.after_execute_script,
+            (script, self._driver), self._driver.execute_script, unwrapped_args)
+
+    async def execute_async_script(self, script, *args):
+        unwrapped_args = (script,) + self._unwrap_element_args(args)
+        return await self._dispatcher.dispatch(
+            self._listener.before_execute_script, self._listener.after_execute_script,
+            (script, self._driver), self._driver.execute_async_script, unwrapped_args)
+
+    async def close(self):
+        await self._dispatcher.dispatch(
+            self._listener.before_close, self._listener.after_close,
+            (self._driver,), self._driver.close, ())
+
+    async def quit(self):
+        await self._dispatcher.dispatch(
+            self._listener.before_quit, self._listener.after_quit,
+            (self._driver,), self._driver.quit, ())
+
+    async def find_element(self, by=By.ID, value=None):
+        return await self._dispatcher.dispatch(
+            self._before_find, self._after_find,
+            (by, value, self._driver), self._driver.find_element, (by, value))
+
+    async def find_elements(self, by=By.ID, value=None):
+        return await self._dispatcher.dispatch(
+            self._before_find, self._after_find,
+            (by, value, self._driver), self._driver.find_elements, (by, value))
+
+    def _unwrap_element_args(self, args):
+        if isinstance(args, EventFiringWebElement):
+            return args.wrapped_element
+        elif isinstance(args, tuple):
+            return tuple(self._unwrap_element_args(item) for item in args)
+        elif isinstance(args, list):
+            return [self._unwrap_element_args(item) for item in args]
+        else:
+            return args
+
+    def __setattr__(self, item, value):
+        if item.startswith("_") or not (_type_has_attr(type(self._driver), item)
+                                        or hasattr(self._driver, item)):
+            object.__setattr__(self, item, value)
+        else:
+            try:
+                object.__setattr__(self._driver, item, value)
+            except Exception as ex:
+                raise WebDriverException(str(ex))
+
+    def __getattr__(self, name):
+        # wrappers are immutable once built, so serve repeat accesses from a
+        # per-instance cache instead of re-running the reflection and
+        # closure construction below on every call
+        cached = self._attr_cache.get(name)
+        if cached is not None:
+            return cached
+
+        def _wrap(*args, **kwargs):
+            try:
+                result = attrib(*args, **kwargs)
+                return _wrap_elements(result, self)
+            except Exception as ex:
+                self._listener.on_exception(ex, self._driver)
+                raise
+
+        async def _wrap_async(*args, **kwargs):
+            try:
+                result = await attrib(*args, **kwargs)
+                return _wrap_elements(result, self)
+            except Exception as ex:
+                self._listener.on_exception(ex, self._driver)
+                raise
+
+        try:
+            attrib = getattr(self._driver, name)
+            if not callable(attrib):
+                return attrib
+            # a dispatch wrapper is never introspected, so a readable
+            # __name__ is all it needs; copying the full metadata via
+            # update_wrapper was the bulk of the cold-miss cost
+            wrapper = _wrap_async if _iscoro(attrib) else _wrap
+            wrapper.__name__ = name
+            self._attr_cache[name] = wrapper
+            return wrapper
+        except AttributeError as ex:
+            raise WebDriverException(str(ex))
+
+
+class EventFiringWebElement(object):
+    """A wrapper around WebElement instance which supports firing events."""
+
+    __slots__ = ("_webelement", "_ef_driver", "_driver", "_listener",
+                 "_dispatcher", "_attr_cache", "_before_click", "_after_click",
+                 "_before_change", "_after_change", "_before_find",
+                 "_after_find", "_el_pair")
+
+    def __init__(self, webelement, ef_driver):
+        """Creates a new instance of the EventFiringWebElement."""
+        self._webelement = webelement
+        self._ef_driver = ef_driver
+        self._driver = ef_driver.wrapped_driver
+        self._listener = ef_driver._listener
+        # the dispatcher's state is all derived from ef_driver, so every
+        # wrapped element can share the driver's instance instead of
+        # allocating an identical one apiece
+        self._dispatcher = ef_driver._dispatcher
+        self._attr_cache = {}
+        # reuse the hook methods the driver wrapper bound once; slot reads
+        # here, no bound-method allocation per call below
+        self._before_click = ef_driver._before_click
+        self._after_click = ef_driver._after_click
+        self._before_change = ef_driver._before_change
+        self._after_change = ef_driver._after_change
+        self._before_find = ef_driver._before_find
+        self._after_find = ef_driver._after_find
+        # the hook argument pair never changes for this element
+        self._el_pair = (webelement, self._driver)
+
+    @property
+    def wrapped_element(self):
+        """Returns the WebElement wrapped by this EventFiringWebElement
+        instance."""
+        return self._webelement
+
+    async def click(self):
+        await self._dispatcher.dispatch(
+            self._before_click, self._after_click,
+            self._el_pair, self._webelement.click, ())
+
+    async def clear(self):
+        await self._dispatcher.dispatch(
+            self._before_change, self._after_change,
+            self._el_pair, self._webelement.clear, ())
+
+    async def send_keys(self, *value):
+        await self._dispatcher.dispatch(
+            self._before_change, self._after_change,
+            self._el_pair, self._webelement.send_keys, value)
+
+    async def find_element(self, by=By.ID, value=None):
+        return await self._dispatcher.dispatch(
+            self._before_find, self._after_find,
+            (by, value, self._driver), self._webelement.find_element, (by, value))
+
+    async def find_elements(self, by=By.ID, value=None):
+        return await self._dispatcher.dispatch(
+            self._before_find, self._after_find,
+            (by, value, self._driver), self._webelement.find_elements, (by, value))
+
+    def __setattr__(self, item, value):
+        if item.startswith("_") or not (_type_has_attr(type(self._webelement), item)
+                                        or hasattr(self._webelement, item)):
+            object.__setattr__(self, item, value)
+        else:
+            try:
+                object.__setattr__(self._webelement, item, value)
+            except Exception as ex:
+                raise WebDriverException(str(ex))
+
+    def __getattr__(self, name):
+        cached = self._attr_cache.get(name)
+        if cached is not None:
+            return cached
+
+        def _wrap(*args, **kwargs):
+            try:
+                result = attrib(*args, **kwargs)
+                return _wrap_elements(result, self._ef_driver)
+            except Exception as ex:
+                self._listener.on_exception(ex, self._driver)
+                raise
+
+        async def _wrap_async(*args, **kwargs):
+            try:
+                result = await attrib(*args, **kwargs)
+                return _wrap_elements(result, self._ef_driver)
+            except Exception as ex:
+                self._listener.on_exception(ex, self._driver)
+                raise
+
+        try:
+            attrib = getattr(self._webelement, name)
+            if not callable(attrib):
+                return attrib
+            wrapper = _wrap_async if _iscoro(attrib) else _wrap
+            wrapper.__name__ = name
+            self._attr_cache[name] = wrapper
+            return wrapper
+        except AttributeError as ex:
+            raise WebDriverException(str(ex))
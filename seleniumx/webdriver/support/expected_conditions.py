@@ -0,0 +1,513 @@
+"""Canned expected conditions which are generally useful within webdriver
+tests."""
+
+import asyncio
+import re
+
+from seleniumx.common.exceptions import (
+    NoAlertPresentException,
+    NoSuchElementException,
+    NoSuchFrameException,
+    StaleElementReferenceException,
+    WebDriverException)
+from seleniumx.webdriver.remote.webelement import WebElement
+
+"""
+ * Canned conditions which are generally useful within webdriver tests.
+ * Each method returns an (async) predicate that takes the driver as its sole
+ * argument, suitable for use with WebDriverWait.
+"""
+
+
+class _TitleIs(object):
+    """An expectation for checking the title of a page.
+
+    title is the expected title, which must be an exact match returns True
+    if the title matches, false otherwise."""
+
+    __slots__ = ("title",)
+
+    def __init__(self, title):
+        self.title = title
+
+    async def __call__(self, driver):
+        return (await driver.title()) == self.title
+
+
+class _TitleContains(object):
+    """An expectation for checking that the title contains a case-sensitive
+    substring.
+
+    title is the fragment of title expected returns True when the title
+    matches, False otherwise."""
+
+    __slots__ = ("title",)
+
+    def __init__(self, title):
+        self.title = title
+
+    async def __call__(self, driver):
+        return self.title in (await driver.title())
+
+
+class _PresenceOfElementLocated(object):
+    """An expectation for checking that an element is present on the DOM of
+    a page. This does not necessarily mean that the element is visible.
+
+    locator - used to find the element returns the WebElement once it is
+    located."""
+
+    __slots__ = ("locator",)
+
+    def __init__(self, locator):
+        self.locator = locator
+
+    async def __call__(self, driver):
+        return await driver.find_element(*self.locator)
+
+
+class _UrlContains(object):
+    """An expectation for checking that the current url contains a
+    case-sensitive substring.
+
+    url is the fragment of url expected, returns True when the url matches,
+    False otherwise."""
+
+    __slots__ = ("url",)
+
+    def __init__(self, url):
+        self.url = url
+
+    async def __call__(self, driver):
+        return self.url in (await driver.current_url())
+
+
+class _UrlMatches(object):
+    """An expectation for checking the current url.
+
+    pattern is the expected pattern, which must be an exact match returns
+    True if the url matches, false otherwise."""
+
+    __slots__ = ("pattern",)
+
+    def __init__(self, pattern):
+        # compile once here rather than on every poll of the predicate;
+        # pre-compiled pattern objects pass through unchanged
+        self.pattern = re.compile(pattern) if isinstance(pattern, str) else pattern
+
+    async def __call__(self, driver):
+        return self.pattern.search(await driver.current_url()) is not None
+
+
+class _UrlToBe(object):
+    """An expectation for checking the current url.
+
+    url is the expected url, which must be an exact match returns True if
+    the url matches, false otherwise."""
+
+    __slots__ = ("url",)
+
+    def __init__(self, url):
+        self.url = url
+
+    async def __call__(self, driver):
+        return self.url == (await driver.current_url())
+
+
+class _VisibilityOfAllElementsLocated(object):
+    """An expectation for checking that all elements are present on the DOM
+    of a page and visible. Visibility means that the elements are not only
+    displayed but also has a height and width that is greater than 0.
+
+    locator - used to find the elements returns the list of WebElements
+    once they are located and visible."""
+
+    __slots__ = ("locator", "_cached")
+
+    def __init__(self, locator):
+        self.locator = locator
+        # once a poll has located elements, later polls only re-test their
+        # visibility; a staleness error drops the cache and re-locates
+        self._cached = None
+
+    async def __call__(self, driver):
+        try:
+            elements = self._cached
+            if elements is None:
+                elements = await driver.find_elements(*self.locator)
+                if not elements:
+                    return elements
+                self._cached = elements
+            results = await asyncio.gather(*(element.is_displayed() for element in elements))
+            if not all(results):
+                return False
+            return elements
+        except StaleElementReferenceException:
+            self._cached = None
+            return False
+
+
+class _UrlChanges(object):
+    """An expectation for checking the current url.
+
+    url is the expected url, which must not be an exact match returns True
+    if the url is different, false otherwise."""
+
+    __slots__ = ("url",)
+
+    def __init__(self, url):
+        self.url = url
+
+    async def __call__(self, driver):
+        return self.url != (await driver.current_url())
+
+
+class ExpectedConditions(object):
+
+    # the simple single-capture conditions are slotted callable classes
+    # rather than closure factories: one compact instance per condition
+    # instead of a closure plus a cell per captured variable, and the
+    # per-poll reads are slot accesses instead of cell dereferences
+    title_is = _TitleIs
+    title_contains = _TitleContains
+    presence_of_element_located = _PresenceOfElementLocated
+    url_contains = _UrlContains
+    url_matches = _UrlMatches
+    url_to_be = _UrlToBe
+    url_changes = _UrlChanges
+
+    @staticmethod
+    def visibility_of_element_located(locator):
+        """An expectation for checking that an element is present on the DOM of
+        a page and visible. Visibility means that the element is not only
+        displayed but also has a height and width that is greater than 0.
+
+        locator - used to find the element returns the WebElement once it is
+        located and visible."""
+        async def _predicate(driver):
+            try:
+                element = await driver.find_element(*locator)
+                return await ExpectedConditions._element_if_visible(element)
+            except StaleElementReferenceException:
+                return False
+
+        return _predicate
+
+    @staticmethod
+    def visibility_of(element):
+        """An expectation for checking that an element, known to be present on
+        the DOM of a page, is visible.
+
+        Visibility means that the element is not only displayed but also has a
+        height and width that is greater than 0. element is the WebElement
+        returns the (same) WebElement once it is visible."""
+        async def _predicate(_):
+            return await ExpectedConditions._element_if_visible(element)
+
+        return _predicate
+
+    @staticmethod
+    async def _element_if_visible(element, visibility=True):
+        return element if await element.is_displayed() == visibility else False
+
+    @staticmethod
+    def presence_of_all_elements_located(locator):
+        """An expectation for checking that there is at least one element
+        present on a web page.
+
+        locator is used to find the element returns the list of WebElements
+        once they are located."""
+        async def _predicate(driver):
+            return await driver.find_elements(*locator)
+
+        return _predicate
+
+    @staticmethod
+    def visibility_of_any_elements_located(locator):
+        """An expectation for checking that there is at least one element
+        visible on a web page.
+
+        locator is used to find the element returns the list of WebElements
+        once they are located."""
+        async def _predicate(driver):
+            elements = await driver.find_elements(*locator)
+            if not elements:
+                return []
+            # each is_displayed is an independent round trip; issue them
+            # concurrently instead of serializing the latency per element
+            results = await asyncio.gather(*(element.is_displayed() for element in elements))
+            return [element for element, displayed in zip(elements, results) if displayed]
+
+        return _predicate
+
+    visibility_of_all_elements_located = _VisibilityOfAllElementsLocated
+
+    @staticmethod
+    def text_to_be_present_in_element(locator, text_):
+        """An expectation for checking if the given text is present in the
+        specified element.
+
+        locator, text
+        """
+        async def _predicate(driver):
+            try:
+                element = await driver.find_element(*locator)
+                element_text = await element.text
+                return text_ in element_text
+            except StaleElementReferenceException:
+                return False
+
+        return _predicate
+
+    @staticmethod
+    def text_to_be_present_in_element_value(locator, text_):
+        """An expectation for checking if the given text is present in the
+        element's value.
+
+        locator, text
+        """
+        async def _predicate(driver):
+            try:
+                element = await driver.find_element(*locator)
+                element_text = await element.get_attribute("value")
+                return text_ in element_text
+            except StaleElementReferenceException:
+                return False
+
+        return _predicate
+
+    @staticmethod
+    def frame_to_be_available_and_switch_to_it(locator):
+        """An expectation for checking whether the given frame is available to
+        switch to.
+
+        If the frame is available it switches the given driver to the
+        specified frame.
+        """
+        async def _predicate(driver):
+            try:
+                if isinstance(locator, (list, tuple)):
+                    element = await driver.find_element(*locator)
+                    await driver.switch_to.frame(element)
+                else:
+                    await driver.switch_to.frame(locator)
+                return True
+            except NoSuchFrameException:
+                return False
+
+        return _predicate
+
+    @staticmethod
+    def invisibility_of_element_located(locator):
+        """An Expectation for checking that an element is either invisible or
+        not present on the DOM.
+
+        locator used to find the element
+        """
+        async def _predicate(driver):
+            try:
+                target = locator
+                if not isinstance(target, WebElement):
+                    target = await driver.find_element(*target)
+                return await ExpectedConditions._element_if_visible(target, visibility=False)
+            except (NoSuchElementException, StaleElementReferenceException):
+                # In the case of NoSuchElement, returns true because the element is
+                # not present in DOM. The try block checks if the element is present
+                # but is invisible.
+                # In the case of StaleElementReference, returns true because stale
+                # element reference implies that element is no longer visible.
+                return True
+
+        return _predicate
+
+    @staticmethod
+    def invisibility_of_element(element):
+        """An Expectation for checking that an element is either invisible or
+        not present on the DOM.
+
+        element is either a locator (text) or an WebElement
+        """
+        return ExpectedConditions.invisibility_of_element_located(element)
+
+    @staticmethod
+    def element_to_be_clickable(locator):
+        """An Expectation for checking an element is visible and enabled such
+        that you can click it."""
+        async def _predicate(driver):
+            try:
+                element = await driver.find_element(*locator)
+                if element and await element.is_displayed() and await element.is_enabled():
+                    return element
+                return False
+            except StaleElementReferenceException:
+                return False
+
+        return _predicate
+
+    @staticmethod
+    def staleness_of(element):
+        """Wait until an element is no longer attached to the DOM.
+
+        element is the element to wait for. returns False if the element is
+        still attached to the DOM, true otherwise.
+        """
+        async def _predicate(_):
+            try:
+                # Calling any method forces a staleness check
+                await element.is_enabled()
+                return False
+            except StaleElementReferenceException:
+                return True
+
+        return _predicate
+
+    @staticmethod
+    def element_to_be_selected(element):
+        """An expectation for checking the selection is selected.
+
+        element is WebElement object
+        """
+        async def _predicate(_):
+            return await element.is_selected()
+
+        return _predicate
+
+    @staticmethod
+    def element_located_to_be_selected(locator):
+        """An expectation for the element to be located is selected.
+
+        locator is a tuple of (by, path)"""
+        async def _predicate(driver):
+            element = await driver.find_element(*locator)
+            return await element.is_selected()
+
+        return _predicate
+
+    @staticmethod
+    def element_selection_state_to_be(element, is_selected):
+        """An expectation for checking if the given element is selected.
+
+        element is WebElement object is_selected is a Boolean."
+        """
+        async def _predicate(_):
+            return await element.is_selected() == is_selected
+
+        return _predicate
+
+    @staticmethod
+    def element_located_selection_state_to_be(locator, is_selected):
+        """An expectation to locate an element and check if the selection state
+        specified is in that state.
+
+        locator is a tuple of (by, path) is_selected is a boolean
+        """
+        async def _predicate(driver):
+            try:
+                element = await driver.find_element(*locator)
+                return await element.is_selected() == is_selected
+            except StaleElementReferenceException:
+                return False
+
+        return _predicate
+
+    @staticmethod
+    def number_of_windows_to_be(num_windows):
+        """An expectation for the number of windows to be a certain value."""
+        async def _predicate(driver):
+            return len(await driver.window_handles()) == num_windows
+
+        return _predicate
+
+    @staticmethod
+    def new_window_is_opened(current_handles):
+        """An expectation that a new window will be opened and have the number
+        of windows handles increase."""
+        async def _predicate(driver):
+            return len(await driver.window_handles()) > len(current_handles)
+
+        return _predicate
+
+    @staticmethod
+    def alert_is_present():
+        """An expectation for checking if an alert is currently present and
+        switching to it."""
+        async def _predicate(driver):
+            try:
+                return await driver.switch_to.wait_alert()
+            except NoAlertPresentException:
+                return False
+
+        return _predicate
+
+    @staticmethod
+    def any_of(*expected_conditions):
+        """An expectation that any of multiple expected conditions is true.
+
+        Equivalent to a logical 'OR'. Returns results of the first matching
+        condition, or False if none do."""
+        async def any_of_condition(driver):
+            # run the conditions concurrently and settle on the first truthy
+            # result; the stragglers are cancelled and drained so nothing is
+            # left running or logging unretrieved exceptions
+            tasks = [asyncio.ensure_future(expected_condition(driver))
+                     for expected_condition in expected_conditions]
+            try:
+                for future in asyncio.as_completed(tasks):
+                    try:
+                        result = await future
+                    except WebDriverException:
+                        continue
+                    if result:
+                        return result
+                return False
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        return any_of_condition
+
+    @staticmethod
+    def all_of(*expected_conditions):
+        """An expectation that all of multiple expected conditions is true.
+
+        Equivalent to a logical 'AND'.
+        Returns: When any ExpectedCondition is not met: False.
+        When all ExpectedConditions are met: A List with each ExpectedCondition's return value."""
+        async def all_of_condition(driver):
+            results = await asyncio.gather(
+                *(expected_condition(driver) for expected_condition in expected_conditions),
+                return_exceptions=True)
+            values = []
+            for result in results:
+                if isinstance(result, WebDriverException):
+                    return False
+                if isinstance(result, BaseException):
+                    raise result
+                if not result:
+                    return False
+                values.append(result)
+            return values
+
+        return all_of_condition
+
+    @staticmethod
+    def none_of(*expected_conditions):
+        """An expectation that none of 1 or multiple expected conditions is
+        true.
+
+        Equivalent to a logical 'NOT-OR'. Returns a Boolean"""
+        async def none_of_condition(driver):
+            results = await asyncio.gather(
+                *(expected_condition(driver) for expected_condition in expected_conditions),
+                return_exceptions=True)
+            for result in results:
+                if isinstance(result, WebDriverException):
+                    continue
+                if isinstance(result, BaseException):
+                    raise result
+                if result:
+                    return False
+            return True
+
+        return none_of_condition
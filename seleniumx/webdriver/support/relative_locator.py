@@ -0,0 +1,122 @@
+from seleniumx.common.exceptions import WebDriverException
+
+
+def with_tag_name(tag_name):
+    """Start searching for relative objects using a tag name.
+
+    Note: This method may be removed in future versions, please use
+    `locate_with` instead.
+    :Args:
+        - tag_name: the DOM tag of element to start searching.
+    :Returns:
+        - RelativeBy - use this object to create filters within a
+            `find_elements` call.
+    """
+    if tag_name is None:
+        raise WebDriverException("tag_name can not be null")
+    return RelativeBy({"css selector": tag_name})
+
+
+class RelativeBy(object):
+    """Gives the opportunity to find elements based on their relative location
+    on the page from a root element. It is recommended that you use the helper
+    function to create it.
+
+    Example::
+
+        lowest = driver.find_element(By.ID, "below")
+
+        elements = await driver.find_elements(with_tag_name("p").above(lowest))
+    """
+
+    __slots__ = ("root", "filters", "_cached", "_dirty")
+
+    def __init__(self, root=None, filters=None):
+        """Creates a new RelativeBy object. It is preferred if you use the
+        `with_tag_name` method as this signature could change.
+
+        :Args:
+            root - A dict with `By` enum as the key and the search query as the value
+            filters - A list of the filters that will be searched. If none are passed
+                in please use the fluent API on the object to create the filters
+        """
+        self.root = root
+        self.filters = filters or []
+        self._cached = None
+        self._dirty = True
+
+    def above(self, element_or_locator=None):
+        """Add a filter to look for elements above.
+
+        :Args:
+            - element_or_locator: Element to look above
+        """
+        if element_or_locator is None:
+            raise WebDriverException("Element or locator must be given when calling above method")
+        self.filters.append(self._get_kind_dict("above", element_or_locator))
+        return self
+
+    def below(self, element_or_locator=None):
+        """Add a filter to look for elements below.
+
+        :Args:
+            - element_or_locator: Element to look below
+        """
+        if element_or_locator is None:
+            raise WebDriverException("Element or locator must be given when calling below method")
+        self.filters.append(self._get_kind_dict("below", element_or_locator))
+        return self
+
+    def to_left_of(self, element_or_locator=None):
+        """Add a filter to look for elements to the left of.
+
+        :Args:
+            - element_or_locator: Element to look to the left of
+        """
+        if element_or_locator is None:
+            raise WebDriverException("Element or locator must be given when calling to_left_of method")
+        self.filters.append(self._get_kind_dict("left", element_or_locator))
+        return self
+
+    def to_right_of(self, element_or_locator=None):
+        """Add a filter to look for elements right of.
+
+        :Args:
+            - element_or_locator: Element to look right of
+        """
+        if element_or_locator is None:
+            raise WebDriverException("Element or locator must be given when calling to_right_of method")
+        self.filters.append(self._get_kind_dict("right", element_or_locator))
+        return self
+
+    def near(self, element_or_locator_distance=None):
+        """Add a filter to look for elements near.
+
+        :Args:
+            - element_or_locator_distance: Element to look near by the element or within a distance
+        """
+        if element_or_locator_distance is None:
+            raise WebDriverException("Element or locator or distance must be given when calling near method")
+        self.filters.append(self._get_kind_dict("near", element_or_locator_distance))
+        return self
+
+    def _get_kind_dict(self, kind, arg):
+        self._dirty = True
+        # a tuple is cheaper than a single-item list and serializes to the
+        # same JSON array
+        return {"kind": kind, "args": (arg,)}
+
+    def to_dict(self):
+        """Create a dict that will be passed to the driver to start searching
+        for the element."""
+        # the outer shape only changes when a filter is added, so rebuild
+        # lazily; repeated find calls on the same locator reuse the dict
+        if self._dirty:
+            self._cached = {
+                "relative": {
+                    "root": self.root,
+                    "filters": self.filters,
+                }
+            }
+            self._dirty = False
+        return self._cached
@@ -0,0 +1,353 @@
+import asyncio
+from functools import lru_cache
+
+from seleniumx.common.exceptions import (
+    NoSuchElementException,
+    UnexpectedTagNameException,
+    WebDriverException)
+from seleniumx.webdriver.common.by import By
+
+#: fetches tag name and the multiple flag in one round trip instead of a
+#: tag_name command plus a get_attribute command
+_TAG_AND_MULTIPLE_SCRIPT = (
+    "return [arguments[0].tagName.toLowerCase(), arguments[0].multiple];")
+
+#: returns the indices of the candidates whose rendered text matches, so a
+#: candidate sweep costs one script call instead of one .text per element
+_MATCHING_TEXT_SCRIPT = (
+    "var text = arguments[1];"
+    "var out = [];"
+    "arguments[0].forEach(function(el, i) {"
+    " if (el.innerText.trim() === text) { out.push(i); }"
+    "});"
+    "return out;")
+
+
+@lru_cache(maxsize=512)
+def _escape_string(value):
+    """Quotes a value for embedding in a CSS/XPath selector; pure, so the
+    result is memoized for values that are re-used across calls."""
+    # almost all real-world option values contain no double quote, so that
+    # single membership test settles the common case immediately
+    if '"' not in value:
+        return f'"{value}"'
+    if "'" not in value:
+        return f"'{value}'"
+    # both quote kinds present: concat() of double-quoted runs stitched
+    # together with literal double quotes, built in one join pass
+    pieces = ", '\"', ".join(f'"{substring}"' for substring in value.split('"'))
+    if value.endswith('"'):
+        return f"concat({pieces}, '\"')"
+    return f"concat({pieces})"
+
+
+@lru_cache(maxsize=512)
+def _build_value_css(value):
+    return f"option[value = {_escape_string(value)}]"
+
+
+@lru_cache(maxsize=512)
+def _build_text_xpath(text):
+    return f".//option[normalize-space(.) = {_escape_string(text)}]"
+
+
+@lru_cache(maxsize=512)
+def _build_first_text_xpath(text):
+    # a single select only ever acts on the first match, so have the
+    # driver stop there instead of serializing every matching option
+    return f"({_build_text_xpath(text)})[1]"
+
+
+class Select(object):
+    """Provides helpers for interacting with ``<select>`` elements."""
+
+    __slots__ = ("_element", "is_multiple", "_ready")
+
+    def __init__(self, webelement):
+        """Constructor. A check that the given element is, indeed, a SELECT
+        tag happens on the first awaited operation (the element's tag name
+        and multiple flag are only reachable asynchronously); an
+        UnexpectedTagNameException is thrown then. Use ``await
+        Select.create(webelement)`` to validate eagerly.
+
+        :Args:
+         - webelement - SELECT element to wrap
+
+        Example::
+
+            from seleniumx.webdriver.support.select import Select
+
+            select = await Select.create(driver.find_element(By.TAG_NAME, "select"))
+            await select.select_by_index(2)
+        """
+        self._element = webelement
+        self.is_multiple = False
+        self._ready = False
+
+    @classmethod
+    async def create(cls, webelement):
+        """Builds a Select and validates the element up front, fetching the
+        tag name and multiple flag in a single round trip."""
+        instance = cls(webelement)
+        await instance._ensure_ready()
+        return instance
+
+    async def _ensure_ready(self):
+        if self._ready:
+            return
+        try:
+            tag_name, multiple = await self._element.parent.execute_script(
+                _TAG_AND_MULTIPLE_SCRIPT, self._element)
+        except WebDriverException:
+            # driver without script support: two commands, as before
+            tag_name = await self._element.tag_name
+            multiple = await self._element.get_attribute("multiple")
+        # the script path and the W3C tag name endpoint both return
+        # lowercase for HTML documents, so the common case is settled by
+        # the first comparison without a .lower() allocation
+        if tag_name != "select" and (not tag_name or tag_name.lower() != "select"):
+            raise UnexpectedTagNameException(
+                f"Select only works on <select> elements, not on <{tag_name}>")
+        self.is_multiple = bool(multiple) and multiple != "false"
+        self._ready = True
+
+    @property
+    async def options(self):
+        """Returns a list of all options belonging to this select tag."""
+        await self._ensure_ready()
+        return await self._element.find_elements(By.TAG_NAME, "option")
+
+    @property
+    async def all_selected_options(self):
+        """Returns a list of all selected options belonging to this select
+        tag."""
+        options = await self.options
+        if not options:
+            return []
+        # every is_selected is an independent round trip; probe them all
+        # concurrently and filter locally
+        results = await asyncio.gather(*(option.is_selected() for option in options))
+        return [option for option, selected in zip(options, results) if selected]
+
+    @property
+    async def first_selected_option(self):
+        """The first selected option in this select tag (or the currently
+        selected option in a normal select)"""
+        options = await self.options
+        if options:
+            # gather keeps result order aligned with document order, so the
+            # first truthy flag is still the first selected option
+            results = await asyncio.gather(*(option.is_selected() for option in options))
+            for option, selected in zip(options, results):
+                if selected:
+                    return option
+        raise NoSuchElementException("No options are selected")
+
+    async def select_by_value(self, value):
+        """Select all options that have a value matching the argument. That is,
+        when given "foo" this would select an option like:
+
+        <option value="foo">Bar</option>
+
+        :Args:
+         - value - The value to match against
+
+        throws NoSuchElementException If there is no option with specified value in SELECT
+        """
+        await self._ensure_ready()
+        css = _build_value_css(value)
+        if not self.is_multiple:
+            # CSS has no "first match" pseudo-class, but find_element
+            # already returns only the first hit - the one we would act on
+            try:
+                opt = await self._element.find_element(By.CSS_SELECTOR, css)
+            except NoSuchElementException:
+                raise NoSuchElementException(f"Cannot locate option with value: {value}")
+            await self._set_selected(opt)
+            return
+        opts = await self._element.find_elements(By.CSS_SELECTOR, css)
+        matched = False
+        for opt in opts:
+            await self._set_selected(opt)
+            matched = True
+        if not matched:
+            raise NoSuchElementException(f"Cannot locate option with value: {value}")
+
+    async def select_by_index(self, index):
+        """Select the option at the given index. This is done by examining the
+        "index" attribute of an element, and not merely by counting.
+
+        :Args:
+         - index - The option at this index will be selected
+
+        throws NoSuchElementException If there is no option with specified index in SELECT
+        """
+        opt = await self._find_option_by_index(index)
+        if opt is None:
+            raise NoSuchElementException(f"Could not locate element with index {index}")
+        await self._set_selected(opt)
+
+    async def select_by_visible_text(self, text):
+        """Select all options that display text matching the argument. That is,
+        when given "Bar" this would select an option like:
+
+        <option value="foo">Bar</option>
+
+        :Args:
+         - text - The visible text to match against
+
+        throws NoSuchElementException If there is no option with specified text in SELECT
+        """
+        await self._ensure_ready()
+        if self.is_multiple:
+            xpath = _build_text_xpath(text)
+        else:
+            xpath = _build_first_text_xpath(text)
+        opts = await self._element.find_elements(By.XPATH, xpath)
+        matched = False
+        for opt in opts:
+            await self._set_selected(opt)
+            if not self.is_multiple:
+                return
+            matched = True
+
+        if len(opts) == 0 and " " in text:
+            sub_string_without_space = self._get_longest_token(text)
+            if sub_string_without_space == "":
+                candidates = await self.options
+            else:
+                xpath = f".//option[contains(., {_escape_string(sub_string_without_space)})]"
+                candidates = await self._element.find_elements(By.XPATH, xpath)
+            for candidate in await self._matching_candidates(candidates, text):
+                await self._set_selected(candidate)
+                if not self.is_multiple:
+                    return
+                matched = True
+
+        if not matched:
+            raise NoSuchElementException(f"Could not locate element with visible text: {text}")
+
+    async def deselect_all(self):
+        """Clear all selected entries.
+
+        This is only valid when the SELECT supports multiple selections.
+        throws NotImplementedError If the SELECT does not support
+        multiple selections
+        """
+        await self._ensure_ready()
+        if not self.is_multiple:
+            raise NotImplementedError("You may only deselect all options of a multi-select")
+        options = await self.options
+        for opt in options:
+            await self._unset_selected(opt)
+
+    async def deselect_by_value(self, value):
+        """Deselect all options that have a value matching the argument. That
+        is, when given "foo" this would deselect an option like:
+
+        <option value="foo">Bar</option>
+
+        :Args:
+         - value - The value to match against
+
+        throws NoSuchElementException If there is no option with specified value in SELECT
+        """
+        await self._ensure_ready()
+        if not self.is_multiple:
+            raise NotImplementedError("You may only deselect options of a multi-select")
+        matched = False
+        css = _build_value_css(value)
+        opts = await self._element.find_elements(By.CSS_SELECTOR, css)
+        for opt in opts:
+            await self._unset_selected(opt)
+            matched = True
+        if not matched:
+            raise NoSuchElementException(f"Could not locate element with value: {value}")
+
+    async def deselect_by_index(self, index):
+        """Deselect the option at the given index. This is done by examining
+        the "index" attribute of an element, and not merely by counting.
+
+        :Args:
+         - index - The option at this index will be deselected
+
+        throws NoSuchElementException If there is no option with specified index in SELECT
+        """
+        await self._ensure_ready()
+        if not self.is_multiple:
+            raise NotImplementedError("You may only deselect options of a multi-select")
+        opt = await self._find_option_by_index(index)
+        if opt is None:
+            raise NoSuchElementException(f"Could not locate element with index {index}")
+        await self._unset_selected(opt)
+
+    async def deselect_by_visible_text(self, text):
+        """Deselect all options that display text matching the argument. That
+        is, when given "Bar" this would deselect an option like:
+
+        <option value="foo">Bar</option>
+
+        :Args:
+         - text - The visible text to match against
+        """
+        await self._ensure_ready()
+        if not self.is_multiple:
+            raise NotImplementedError("You may only deselect options of a multi-select")
+        matched = False
+        xpath = _build_text_xpath(text)
+        opts = await self._element.find_elements(By.XPATH, xpath)
+        for opt in opts:
+            await self._unset_selected(opt)
+            matched = True
+        if not matched:
+            raise NoSuchElementException(f"Could not locate element with visible text: {text}")
+
+    async def _find_option_by_index(self, index):
+        """Locates the option whose "index" attribute equals `index`.
+
+        An option's index normally equals its DOM position, so a single
+        nth-of-type lookup replaces probing every option; the returned
+        element is verified against the attribute in case a custom "index"
+        is in play. Options nested in optgroups restart the nth-of-type
+        count, so a miss falls back to the full scan."""
+        await self._ensure_ready()
+        match = str(index)
+        selector = f"option:nth-of-type({int(index) + 1})"
+        for opt in await self._element.find_elements(By.CSS_SELECTOR, selector):
+            if await opt.get_attribute("index") == match:
+                return opt
+        for opt in await self.options:
+            if await opt.get_attribute("index") == match:
+                return opt
+        return None
+
+    async def _matching_candidates(self, candidates, text):
+        """Returns the candidates whose visible text equals `text`.
+
+        One execute_script round trip compares every candidate at once;
+        drivers without script support fall back to a .text fetch per
+        candidate."""
+        if not candidates:
+            return []
+        try:
+            indexes = await self._element.parent.execute_script(
+                _MATCHING_TEXT_SCRIPT, list(candidates), text)
+            return [candidates[i] for i in indexes]
+        except WebDriverException:
+            matches = []
+            for candidate in candidates:
+                if text == await candidate.text:
+                    matches.append(candidate)
+            return matches
+
+    async def _set_selected(self, option):
+        if not await option.is_selected():
+            await option.click()
+
+    async def _unset_selected(self, option):
+        if await option.is_selected():
+            await option.click()
+
+    def _get_longest_token(self, value):
+        # key=len stays in C; the old lambda paid a Python call per token
+        return max(value.split(" "), key=len)
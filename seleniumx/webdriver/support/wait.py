@@ -0,0 +1,190 @@
+import asyncio
+import inspect
+
+from seleniumx.common.exceptions import NoSuchElementException, TimeoutException
+
+POLL_FREQUENCY = 0.5  # How long to sleep in between calls to the method
+IGNORED_EXCEPTIONS = (NoSuchElementException,)  # exceptions ignored during calls to the method
+
+
+def _is_coro_method(method):
+    """True when calling `method` yields a coroutine to await - either a
+    coroutine function itself or an instance whose __call__ is one (the
+    expected-condition callables)."""
+    return (asyncio.iscoroutinefunction(method)
+            or asyncio.iscoroutinefunction(getattr(method, "__call__", None)))
+
+
+def _session_key(driver):
+    return driver.session_id
+
+
+def _memoize_method(method, key_fn, is_coro):
+    """Wraps `method` so repeated polls with an unchanged key skip the
+    underlying driver calls and return the cached result. The cache is a
+    plain dict scoped to one wait, so nothing needs invalidating across
+    calls."""
+    cache = {}
+    if is_coro:
+        async def wrapper(driver):
+            key = key_fn(driver)
+            if key in cache:
+                return cache[key]
+            value = await method(driver)
+            cache[key] = value
+            return value
+    else:
+        async def wrapper(driver):
+            key = key_fn(driver)
+            if key in cache:
+                return cache[key]
+            value = method(driver)
+            if inspect.isawaitable(value):
+                value = await value
+            cache[key] = value
+            return value
+    return wrapper
+
+
+class WebDriverWait(object):
+
+    __slots__ = ("_driver", "_timeout", "_poll", "_ignored_exceptions")
+
+    def __init__(self, driver, timeout, poll_frequency=POLL_FREQUENCY, ignored_exceptions=None):
+        """Constructor, takes a WebDriver instance and timeout in seconds.
+
+        :Args:
+         - driver - Instance of WebDriver (Ie, Firefox, Chrome or Remote)
+         - timeout - Number of seconds before timing out
+         - poll_frequency - sleep interval between calls
+           By default, it is 0.5 second.
+         - ignored_exceptions - iterable structure of exception classes ignored during calls.
+           By default, it contains NoSuchElementException only.
+
+        Example::
+
+            from seleniumx.webdriver.support.wait import WebDriverWait
+
+            element = await WebDriverWait(driver, 10).until(lambda x: x.find_element(By.ID, "someId"))
+        """
+        self._driver = driver
+        self._timeout = timeout
+        self._poll = poll_frequency
+        # avoid the divide by zero
+        if self._poll == 0:
+            self._poll = POLL_FREQUENCY
+        if ignored_exceptions is None:
+            # the overwhelmingly common call is WebDriverWait(driver,
+            # timeout); share the module tuple instead of rebuilding it
+            self._ignored_exceptions = IGNORED_EXCEPTIONS
+        else:
+            exceptions = dict.fromkeys(IGNORED_EXCEPTIONS)
+            self._extend_ignored_exceptions(exceptions, ignored_exceptions)
+            self._ignored_exceptions = tuple(exceptions)
+
+    def _extend_ignored_exceptions(self, current, ignored_exceptions):
+        # current is a dict used as an ordered set: duplicates disappear
+        # as they are added, but insertion order survives - the except
+        # clause order stays deterministic across runs, which matters
+        # when one ignored exception subclasses another
+        try:
+            current.update(dict.fromkeys(ignored_exceptions))
+        except TypeError:  # ignored_exceptions is not iterable
+            current[ignored_exceptions] = None
+        return current
+
+    def __repr__(self):
+        return f'<{type(self).__module__}.{type(self).__name__} (session="{self._driver.session_id}")>'
+
+    async def until(self, method, message="", memoize=False, key_fn=None):
+        """Calls the method provided with the driver as an argument until the
+        return value does not evaluate to ``False``.
+
+        :param method: callable(WebDriver)
+        :param message: optional message for :exc:`TimeoutException`
+        :param memoize: when True, `method` is only re-evaluated on polls
+          where `key_fn(driver)` differs from a previously seen key; polls
+          with a known key reuse the cached result without touching the
+          driver. Pick a `key_fn` that tracks the state the condition
+          depends on - with the default (session id) the method runs once
+          per session. The cache lives only for this call.
+        :param key_fn: callable(WebDriver) producing the cache key,
+          defaults to the driver's session id
+        :returns: the result of the last call to `method`
+        :raises: :exc:`seleniumx.common.exceptions.TimeoutException` if timeout occurs
+        """
+        last_ex = None
+        # whether the method is a coroutine function never changes, so
+        # settle it once instead of re-inspecting on every poll
+        is_coro = _is_coro_method(method)
+        if memoize:
+            method = _memoize_method(method, key_fn or _session_key, is_coro)
+            is_coro = True
+        # everything the loop touches per iteration is bound to a local
+        # up front; LOAD_FAST beats an attribute lookup on a path that can
+        # run hundreds of iterations
+        driver = self._driver
+        poll = self._poll
+        ignored = self._ignored_exceptions
+        sleep = asyncio.sleep
+        # the loop clock is monotonic, so wall-clock adjustments can neither
+        # stretch nor cut the wait short
+        clock = asyncio.get_running_loop().time
+        end_time = clock() + self._timeout
+        while True:
+            try:
+                if is_coro:
+                    value = await method(driver)
+                else:
+                    value = method(driver)
+                    if inspect.isawaitable(value):
+                        value = await value
+                if value:
+                    return value
+            except ignored as exc:
+                # only keep the exception; its screen/stacktrace are dug
+                # out once on timeout instead of on every failed poll
+                last_ex = exc
+            remaining = end_time - clock()
+            if remaining <= 0:
+                break
+            # never sleep past the deadline; the old unconditional sleep
+            # added up to a full poll interval of dead time per call
+            await sleep(min(poll, remaining))
+        raise TimeoutException(message,
+                               getattr(last_ex, "screen", None),
+                               getattr(last_ex, "stacktrace", None))
+
+    async def until_not(self, method, message=""):
+        """Calls the method provided with the driver as an argument until the
+        return value evaluates to ``False``.
+
+        :param method: callable(WebDriver)
+        :param message: optional message for :exc:`TimeoutException`
+        :returns: the result of the last call to `method`
+        :raises: :exc:`seleniumx.common.exceptions.TimeoutException` if timeout occurs
+        """
+        is_coro = _is_coro_method(method)
+        driver = self._driver
+        poll = self._poll
+        ignored = self._ignored_exceptions
+        sleep = asyncio.sleep
+        clock = asyncio.get_running_loop().time
+        end_time = clock() + self._timeout
+        while True:
+            try:
+                if is_coro:
+                    value = await method(driver)
+                else:
+                    value = method(driver)
+                    if inspect.isawaitable(value):
+                        value = await value
+                if not value:
+                    return value
+            except ignored:
+                return True
+            remaining = end_time - clock()
+            if remaining <= 0:
+                break
+            await sleep(min(poll, remaining))
+        raise TimeoutException(message)
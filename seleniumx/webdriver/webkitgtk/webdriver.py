@@ -0,0 +1,88 @@
+"""The WebKitGTK WebDriver implementation."""
+
+import asyncio
+import http.client as http_client
+
+from seleniumx.webdriver.common.desired_capabilities import DesiredCapabilities
+from seleniumx.webdriver.remote.webdriver import RemoteWebDriver
+from seleniumx.webdriver.webkitgtk.service import WebKitGtkDriverService
+
+
+class WebKitGtkDriver(RemoteWebDriver):
+    """Controls the WebKitGTKDriver and allows you to drive the browser."""
+
+    #: running services kept warm for reuse by get_pooled(); quit() on a
+    #: pooled driver parks its service here instead of stopping it
+    _service_pool = None
+    _service_pool_max = 4
+
+    def __init__(self, executable_path="WebKitWebDriver", port=0, options=None,
+                 desired_capabilities=DesiredCapabilities.WEBKITGTK,
+                 service_log_path=None, keep_alive=True, service=None):
+        """Creates a new instance of the WebKitGTK driver.
+
+        Starts the service and then creates new instance of WebKitGTK driver.
+
+        :Args:
+         - executable_path : path to the executable. If the default is used it assumes the executable is in the $PATH.
+         - port : port you would like the service to run, if left as 0, a free port will be found.
+         - options : an instance of WebKitGtkOptions
+         - desired_capabilities : Dictionary object with desired capabilities
+         - service_log_path : Path to write service stdout and stderr output.
+         - keep_alive : Whether to configure RemoteConnection to use HTTP keep-alive.
+         - service : an already-constructed WebKitGtkDriverService to bind to instead of creating one.
+        """
+        # merge into a new dict: update() in place corrupted the shared
+        # DesiredCapabilities.WEBKITGTK default (and any caller's dict)
+        desired_capabilities = {
+            **(desired_capabilities or {}),
+            **(options.to_capabilities() if options is not None else {})}
+
+        self.service = service or WebKitGtkDriverService(
+            executable_path, port=port, log_path=service_log_path)
+        self._pooled = False
+        self._service_reused = service is not None
+
+        super().__init__(server_url=self.service.service_url,
+                         desired_capabilities=desired_capabilities,
+                         keep_alive=keep_alive)
+        self._is_remote = False
+
+    @classmethod
+    async def get_pooled(cls, max_services=4, **kwargs):
+        """Returns a driver whose service subprocess is reused across
+        sessions.
+
+        The first pooled driver pays the usual fork/exec cold start; when
+        it quits, its service is parked (up to `max_services`) and the next
+        get_pooled call binds a fresh session to the warm process instead
+        of spawning a new one."""
+        if cls._service_pool is None:
+            cls._service_pool = asyncio.Queue()
+            cls._service_pool_max = max_services
+        try:
+            service = cls._service_pool.get_nowait()
+        except asyncio.QueueEmpty:
+            service = None
+        driver = cls(service=service, **kwargs)
+        driver._pooled = True
+        return driver
+
+    async def start_service(self):
+        if not self._service_reused:
+            await self.service.start()
+
+    async def quit(self):
+        """Closes the browser and shuts down the WebKitGTKDriver executable
+        that is started when starting the WebKitGTKDriver."""
+        try:
+            await super().quit()
+        except http_client.BadStatusLine:
+            pass
+        finally:
+            pool = type(self)._service_pool
+            if (self._pooled and pool is not None
+                    and pool.qsize() < type(self)._service_pool_max):
+                pool.put_nowait(self.service)
+            else:
+                await self.service.stop()
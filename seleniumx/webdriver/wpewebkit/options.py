@@ -0,0 +1,55 @@
+from seleniumx.webdriver.common.desired_capabilities import DesiredCapabilities
+
+
+class WPEWebKitOptions(object):
+
+    KEY = "wpe:browserOptions"
+
+    def __init__(self):
+        self._binary_location = ""
+        self._arguments = []
+
+    @property
+    def binary_location(self):
+        """Returns the location of the browser binary otherwise an empty string."""
+        return self._binary_location
+
+    @binary_location.setter
+    def binary_location(self, value):
+        """Allows you to set the browser binary to launch.
+
+        :Args:
+         - value : path to the browser binary
+        """
+        self._binary_location = value
+
+    @property
+    def arguments(self):
+        """Returns a list of arguments needed for the browser."""
+        return self._arguments
+
+    def add_argument(self, argument):
+        """Adds an argument to the list.
+
+        :Args:
+         - argument : adds the argument to the list of arguments
+        """
+        if argument:
+            self._arguments.append(argument)
+        else:
+            raise ValueError("argument can not be null")
+
+    def to_capabilities(self):
+        """Creates a capabilities with all the options that have been set and
+        returns a dictionary with everything."""
+        caps = DesiredCapabilities.WPEWEBKIT.copy()
+
+        browser_options = {}
+        if self.binary_location:
+            browser_options["binary"] = self.binary_location
+        if self.arguments:
+            browser_options["args"] = self.arguments
+
+        caps[WPEWebKitOptions.KEY] = browser_options
+
+        return caps
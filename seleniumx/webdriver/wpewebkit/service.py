@@ -0,0 +1,22 @@
+from seleniumx.webdriver.common import service
+
+
+class WPEWebKitDriverService(service.Service):
+    """Object that manages the starting and stopping of the WPEWebKitDriver."""
+
+    def __init__(self, executable_path, port=0, log_path=None):
+        """Creates a new instance of the WPEWebKitDriver service.
+
+        :Args:
+         - executable_path : Path to the WPEWebKitDriver
+         - port : Port the service is running on
+         - log_path : Path for the WPEWebKitDriver service to log to
+        """
+        log_file = open(log_path, "wb") if log_path else None
+        super().__init__(executable_path, port=port, log_file=log_file)
+
+    def command_line_args(self):
+        return ["-p", str(self.port)]
+
+    async def send_remote_shutdown_command(self):
+        pass
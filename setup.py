@@ -0,0 +1,37 @@
+from setuptools import find_packages, setup
+
+setup(
+    name="seleniumx",
+    version="0.1.0",
+    description="Asyncio based python bindings for WebDriver",
+    long_description=open("README.md").read(),
+    long_description_content_type="text/markdown",
+    url="https://github.com/abranjith/seleniumx",
+    license="Apache 2.0",
+    classifiers=[
+        "Development Status :: 3 - Alpha",
+        "Intended Audience :: Developers",
+        "License :: OSI Approved :: Apache Software License",
+        "Operating System :: POSIX",
+        "Operating System :: Microsoft :: Windows",
+        "Operating System :: MacOS :: MacOS X",
+        "Programming Language :: Python :: 3.7",
+        "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+    ],
+    python_requires=">=3.7",
+    packages=find_packages(exclude=["tests*"]),
+    install_requires=[
+        "httpx",
+        "aiofiles",
+        "async_property",
+    ],
+    extras_require={
+        # faster JSON encode/decode on the command path; picked up
+        # automatically when installed
+        "speedups": ["orjson"],
+        # HTTP/2 multiplexing support for the WebDriver client
+        "http2": ["httpx[http2]"],
+    },
+    zip_safe=False,
+)